@@ -1,4 +1,45 @@
-from interpolation.newton import newton_interpolate
-from interpolation.lagrange import lagrange_interpolate
-from interpolation.cubic_spline import cubic_spline_interpolate
-from interpolation.b_spline import b_spline_interpolate
\ No newline at end of file
+import importlib
+
+from interpolation.registry import register_method, get_method, method_info, available_methods
+
+# Public names and the module defining each one. They are imported on first
+# attribute access, so importing the package (or the registry through it)
+# does not load any interpolation method.
+_EXPORTS = {
+    'newton_interpolate': 'interpolation.newton',
+    'newton_fit': 'interpolation.newton',
+    'lagrange_interpolate': 'interpolation.lagrange',
+    'lagrange_fit': 'interpolation.lagrange',
+    'cubic_spline_interpolate': 'interpolation.cubic_spline',
+    'cubic_spline_interpolate_batch': 'interpolation.cubic_spline',
+    'cubic_spline_fit': 'interpolation.cubic_spline',
+    'b_spline_interpolate': 'interpolation.b_spline',
+    'b_spline_interpolate_batch': 'interpolation.b_spline',
+    'b_spline_fit': 'interpolation.b_spline',
+    'chebyshev_interpolate': 'interpolation.chebyshev',
+    'chebyshev_fit': 'interpolation.chebyshev',
+    'akima_interpolate': 'interpolation.hermite',
+    'akima_fit': 'interpolation.hermite',
+    'catmull_rom_interpolate': 'interpolation.hermite',
+    'catmull_rom_fit': 'interpolation.hermite',
+    'pchip_interpolate': 'interpolation.hermite',
+    'pchip_fit': 'interpolation.hermite',
+    'auto_interpolate': 'interpolation.auto',
+    'anytime_interpolate': 'interpolation.anytime',
+    'PiecewisePolynomial': 'interpolation.path',
+    'RouteGraph': 'interpolation.route_graph',
+}
+
+__all__ = list(_EXPORTS) + ['register_method', 'get_method', 'method_info', 'available_methods']
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'interpolation' has no attribute '{name}'")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,194 @@
+import logging
+import time
+
+import numpy as np
+
+from interpolation.registry import get_method
+from utils import telemetry
+
+logger = logging.getLogger(__name__)
+
+_level_gauge = telemetry.gauge('anytime_refinement_level',
+                               'Refinement level reached by the last anytime call')
+_elapsed_histogram = telemetry.histogram('anytime_elapsed_seconds',
+                                         'Time used by anytime interpolation calls')
+_missed_counter = telemetry.counter('anytime_deadline_missed_total',
+                                    'Anytime calls that exceeded their budget')
+
+# Weight of the newest measurement in the moving average of metrics_costs
+METRICS_COST_SMOOTHING = 0.25
+
+
+def second_derivative_bound(path):
+    """
+    Upper bound on |r''(t)| over a PiecewisePolynomial.
+
+    On a piece of width w with power-basis coefficients c_j,
+    |r''(s)| <= sum_{j>=2} j (j-1) |c_j| w^(j-2) for 0 <= s <= w.
+    """
+    order = path.order
+    if order < 3:
+        return 0.0
+
+    widths = np.diff(path.breakpoints)
+    j = np.arange(2, order)
+    norms = np.sqrt(np.sum(path.coeffs[:, 2:]**2, axis=2))
+    terms = (j * (j - 1)) * norms * widths[:, None]**(j - 2)
+    return float(np.max(np.sum(terms, axis=1)))
+
+
+def sampling_error_bound(path, num_points, curvature_bound=None):
+    """
+    Bound on the distance between a path and its polyline of num_points samples.
+
+    A chord over a parameter step h deviates from the curve by at most
+    h^2 / 8 * max|r''|.
+    """
+    if curvature_bound is None:
+        curvature_bound = second_derivative_bound(path)
+    start, end = path.domain
+    h = (end - start) / max(num_points - 1, 1)
+    return float(curvature_bound * h**2 / 8)
+
+
+def anytime_interpolate(waypoints, budget=0.002, method='cubic_spline', tolerance=None,
+                        start_points=16, max_points=4096, metrics=True, length_rtol=1e-6,
+                        clock=time.perf_counter, start_time=None, metrics_costs=None):
+    """
+    Interpolate waypoints within a time budget, refining while time remains.
+
+    The curve is fitted once and first sampled coarsely at start_points.
+    Each refinement level doubles the number of samples, which divides the
+    sampling error bound by four. When refinement is done (tolerance
+    reached, max_points reached or no time left for another level), the
+    exact metrics are computed if they still fit in the budget.
+
+    A stage only starts when its predicted cost fits in the remaining
+    budget: twice the previous level for sampling (its cost grows linearly
+    with the number of points) and the measured cost in metrics_costs for
+    the metrics stage, whose predicted cost is also kept free while
+    refining. The fit and the first level always run, so the caller gets a
+    path even when the budget is already spent, and can check deadline_met
+    to decide whether to keep the previous path.
+
+    A control loop that calls this every cycle passes the same
+    metrics_costs dict each time. It holds the measured duration of the
+    metrics stage per method as a moving average; until a method has been
+    measured, the stage only runs when at least half of the budget is
+    left. Each time the stage is skipped the estimate decays, so one slow
+    outlier cannot disable it for good.
+
+    Args:
+        waypoints (numpy.ndarray): Waypoints of shape (n, d)
+        budget (float): Time budget in seconds
+        method (str): Registered method with a fit function
+        tolerance (float): Stop refining once the sampling error bound is
+            below this distance (default: refine until time or max_points
+            runs out)
+        start_points (int): Number of samples of the first level
+        max_points (int): Maximum number of samples
+        metrics (bool): Whether to compute the exact metrics stage
+        length_rtol (float): Relative tolerance of the metrics' arc length
+        clock (callable): Time source in seconds
+        start_time (float): Clock value the budget counts from, e.g. the
+            start of the control cycle (default: now)
+        metrics_costs (dict): {method: seconds} estimates of the metrics
+            stage, updated in place (default: a new dict for this call)
+
+    Returns:
+        dict: Dictionary with the best result so far:
+            - path: Sampled path of shape (num_points, d)
+            - fit: The fitted PiecewisePolynomial
+            - level: Achieved refinement level (0 is the first sampling)
+            - num_points: Number of samples in path
+            - error_bound: Upper bound on the distance from the polyline to
+              the fitted curve
+            - metrics: {'length', 'max_deviation', 'max_curvature'} from the
+              exact metrics stage, or None if it did not run
+            - stages: List of {'stage', 'num_points', 'error_bound', 'time'}
+              records with the duration of each completed stage
+            - elapsed: Time used since start_time
+            - deadline_met: Whether elapsed is within the budget
+    """
+    from utils.metrics import path_deviation, curvature_metrics
+
+    start = clock() if start_time is None else start_time
+    deadline = start + budget
+    waypoints = np.asarray(waypoints, dtype=float)
+
+    stage_start = clock()
+    fit = get_method(method, 'fit')(waypoints, num_points=start_points)
+    curvature_bound = second_derivative_bound(fit)
+    stages = [{'stage': 'fit', 'num_points': 0, 'error_bound': np.inf,
+               'time': clock() - stage_start}]
+
+    if metrics_costs is None:
+        metrics_costs = {}
+    # Time kept free for the metrics stage while refining
+    metrics_cost = metrics_costs.get(method, 0.5 * budget) if metrics else 0.0
+
+    level = -1
+    num_points = min(start_points, max_points)
+    path = None
+    error_bound = np.inf
+    last_sample_time = 0.0
+
+    while num_points <= max_points:
+        # The first level always runs; later ones must fit in the budget
+        predicted = 2 * last_sample_time + metrics_cost
+        if path is not None and clock() + predicted > deadline:
+            break
+
+        stage_start = clock()
+        path = fit.sample(num_points)
+        last_sample_time = clock() - stage_start
+        level += 1
+        error_bound = sampling_error_bound(fit, num_points, curvature_bound)
+        stages.append({'stage': 'sample', 'num_points': num_points,
+                       'error_bound': error_bound, 'time': last_sample_time})
+
+        if tolerance is not None and error_bound <= tolerance:
+            break
+        num_points *= 2
+    num_points = len(path)
+
+    result_metrics = None
+    if metrics and clock() + metrics_cost <= deadline:
+        stage_start = clock()
+        result_metrics = {
+            'length': fit.length(rtol=length_rtol),
+            'max_deviation': path_deviation(waypoints, path)['max_deviation'],
+            'max_curvature': curvature_metrics(path)['max_curvature']
+        }
+        metrics_time = clock() - stage_start
+        stages.append({'stage': 'metrics', 'num_points': num_points,
+                       'error_bound': error_bound, 'time': metrics_time})
+
+        previous = metrics_costs.get(method, metrics_time)
+        metrics_costs[method] = (previous + METRICS_COST_SMOOTHING *
+                                 (metrics_time - previous))
+    elif metrics and method in metrics_costs:
+        metrics_costs[method] *= 1 - METRICS_COST_SMOOTHING
+
+    elapsed = clock() - start
+    deadline_met = elapsed <= budget
+    logger.info("anytime: %s level %d (%d points, bound %.3g) in %.3f of %.3f ms%s",
+                method, level, num_points, error_bound, elapsed * 1e3, budget * 1e3,
+                "" if deadline_met else " (deadline missed)")
+    if telemetry.enabled:
+        _level_gauge.set(level, method=method)
+        _elapsed_histogram.observe(elapsed, method=method)
+        if not deadline_met:
+            _missed_counter.inc(method=method)
+
+    return {
+        'path': path,
+        'fit': fit,
+        'level': level,
+        'num_points': num_points,
+        'error_bound': error_bound,
+        'metrics': result_metrics,
+        'stages': stages,
+        'elapsed': elapsed,
+        'deadline_met': deadline_met
+    }
@@ -0,0 +1,272 @@
+import logging
+import time
+
+import numpy as np
+
+from interpolation.registry import get_method
+from utils.waypoints import chord_length_parameter
+
+logger = logging.getLogger(__name__)
+
+# Estimated runtime of each method: scale * n**exponent seconds for n waypoints
+# at 100 output points, scaled linearly with num_points. The values were
+# measured with calibrate_cost_model() (fits of 4 to 64 waypoints, best of 7
+# runs) on a development machine; they only need to rank the methods, and
+# calibrate_cost_model() refits them on the machine the planner runs on.
+#
+# 'nodes' names the interpolation nodes of a global polynomial: 'graph' for
+# the x coordinates of the y(x) graph that Newton and Lagrange fit to 2-D
+# waypoints, 'chebyshev' for the Chebyshev-Lobatto parameters of
+# chebyshev_fit, and None for the piecewise methods.
+COST_MODEL = {
+    'newton': {'scale': 3.3e-5, 'exponent': 0.99, 'nodes': 'graph'},
+    'lagrange': {'scale': 4.2e-5, 'exponent': 0.94, 'nodes': 'graph'},
+    'chebyshev': {'scale': 6.4e-4, 'exponent': 0.77, 'nodes': 'chebyshev'},
+    'cubic_spline': {'scale': 1.2e-4, 'exponent': 0.53, 'nodes': None},
+    'catmull_rom': {'scale': 2.1e-4, 'exponent': 0.0, 'nodes': None},
+    'akima': {'scale': 2.5e-4, 'exponent': 0.02, 'nodes': None},
+    'pchip': {'scale': 3.0e-4, 'exponent': 0.0, 'nodes': None},
+    'b_spline': {'scale': 7.7e-4, 'exponent': 0.05, 'nodes': None},
+}
+
+# Global polynomials are never considered above this many waypoints, or when the
+# Lebesgue constant of their nodes (the worst-case amplification of waypoint
+# error) exceeds the limit.
+MAX_POLYNOMIAL_POINTS = 15
+MAX_LEBESGUE_CONSTANT = 10.0
+
+
+def estimate_lebesgue_constant(nodes, samples_per_node=8):
+    """Estimate the Lebesgue constant of polynomial interpolation on nodes.
+
+    Uses the barycentric form of the Lagrange basis on a grid that is
+    ``samples_per_node`` times denser than the nodes, so the check costs
+    O(n^2) only for the small n it is ever run on.
+    """
+    nodes = np.asarray(nodes, dtype=float)
+    n = len(nodes)
+    if n < 3:
+        return 1.0
+
+    diff = nodes[:, None] - nodes[None, :]
+    np.fill_diagonal(diff, 1.0)
+    if np.any(diff == 0):
+        return np.inf
+    weights = 1.0 / np.prod(diff, axis=1)
+
+    grid = np.linspace(nodes.min(), nodes.max(), samples_per_node * n)
+    offsets = grid[:, None] - nodes[None, :]
+    on_node = np.isclose(offsets, 0.0, atol=1e-14)
+    offsets[on_node] = 1.0
+    terms = weights / offsets
+    basis = terms / np.sum(terms, axis=1, keepdims=True)
+    lebesgue = np.sum(np.abs(basis), axis=1)
+    # Grid points that coincide with a node have a Lebesgue function of 1
+    lebesgue[np.any(on_node, axis=1)] = 1.0
+
+    return float(np.max(lebesgue))
+
+
+def polynomial_nodes(kind, waypoints):
+    """
+    Interpolation nodes of a global polynomial method, or None if it has none.
+
+    Newton and Lagrange fit 2-D waypoints as the graph y(x), which is only
+    a path through the waypoints in order when x strictly increases; for
+    any other x the graph method has no usable nodes. Waypoints of other
+    dimensions are fitted over chord length.
+    """
+    waypoints = np.asarray(waypoints, dtype=float)
+    if kind == 'chebyshev':
+        n = len(waypoints) - 1
+        return np.cos(np.pi * np.arange(n + 1) / max(n, 1))
+    if waypoints.shape[1] != 2:
+        return chord_length_parameter(waypoints)
+    x = waypoints[:, 0]
+    return x if np.all(np.diff(x) > 0) else None
+
+
+def estimate_method_costs(waypoints, num_points=100):
+    """
+    Estimate cost and stability of every method for a waypoint set.
+
+    Args:
+        waypoints (numpy.ndarray): Waypoints as [x, y] coordinates
+        num_points (int): Number of points in the interpolated path
+
+    Returns:
+        dict: {method_name: estimate} where each estimate holds:
+            - cost: Predicted runtime in seconds
+            - stable: Whether the method is expected to be well conditioned
+            - lebesgue_constant: Error amplification of global polynomials
+              on their own nodes (1.0 for the piecewise methods, inf when
+              the nodes are unusable or not checked)
+            - spacing_ratio: Longest over shortest waypoint spacing
+    """
+    waypoints = np.asarray(waypoints, dtype=float)
+    n = len(waypoints)
+
+    spacing = np.sqrt(np.sum(np.diff(waypoints, axis=0)**2, axis=1))
+    positive = spacing[spacing > 0]
+    spacing_ratio = float(positive.max() / positive.min()) if len(positive) else 1.0
+
+    # Only pay for the conditioning check when a polynomial is still a
+    # candidate, and once per kind of nodes
+    lebesgue = {}
+    if n <= MAX_POLYNOMIAL_POINTS:
+        for kind in {model['nodes'] for model in COST_MODEL.values()} - {None}:
+            nodes = polynomial_nodes(kind, waypoints)
+            lebesgue[kind] = np.inf if nodes is None else estimate_lebesgue_constant(nodes)
+
+    estimates = {}
+    for method, model in COST_MODEL.items():
+        cost = model['scale'] * n**model['exponent'] * (num_points / 100.0)
+
+        if model['nodes'] is None:
+            method_lebesgue = 1.0
+        else:
+            method_lebesgue = lebesgue.get(model['nodes'], np.inf)
+        stable = method_lebesgue <= MAX_LEBESGUE_CONSTANT
+
+        estimates[method] = {
+            'cost': cost,
+            'stable': stable,
+            'lebesgue_constant': method_lebesgue,
+            'spacing_ratio': spacing_ratio
+        }
+
+    return estimates
+
+
+def calibrate_cost_model(sizes=(4, 8, 16, 32, 64), repeats=3, num_points=100,
+                         methods=None, update=True):
+    """
+    Fit the cost model from benchmark measurements.
+
+    Each method is timed on random waypoint sets of the given sizes and a
+    power law ``scale * n**exponent`` is fitted in log-log space.
+
+    Args:
+        sizes (tuple): Waypoint counts to benchmark
+        repeats (int): Timing repeats per size; the fastest run is kept
+        num_points (int): Number of points in the interpolated path
+        methods (list): Methods to calibrate (default: all in COST_MODEL)
+        update (bool): Whether to store the fitted values in COST_MODEL
+
+    Returns:
+        dict: {method_name: {'scale': float, 'exponent': float,
+               'timings': {n: seconds}}}
+    """
+    rng = np.random.default_rng(0)
+    methods = methods or list(COST_MODEL)
+    calibration = {}
+
+    for method in methods:
+        method_func = get_method(method, 'fit')
+        timings = {}
+
+        for n in sizes:
+            # Monotone x keeps the polynomial methods well defined
+            x = np.sort(rng.uniform(100, 700, n))
+            y = rng.uniform(100, 500, n)
+            waypoints = np.column_stack((x, y))
+
+            best = np.inf
+            for _ in range(repeats):
+                start = time.perf_counter()
+                method_func(waypoints, num_points=num_points).to_array()
+                best = min(best, time.perf_counter() - start)
+            timings[n] = best
+
+        counts = np.array(list(timings), dtype=float)
+        seconds = np.array(list(timings.values())) * (100.0 / num_points)
+        exponent, log_scale = np.polyfit(np.log(counts), np.log(seconds), 1)
+
+        calibration[method] = {
+            'scale': float(np.exp(log_scale)),
+            'exponent': float(exponent),
+            'timings': timings
+        }
+        logger.info("Calibrated %s: %.3g * n^%.2f s", method,
+                    calibration[method]['scale'], exponent)
+
+        if update:
+            COST_MODEL[method]['scale'] = calibration[method]['scale']
+            COST_MODEL[method]['exponent'] = calibration[method]['exponent']
+
+    return calibration
+
+
+def auto_interpolate(waypoints, num_points=100, max_deviation=None, max_curvature=None,
+                     return_choice=False):
+    """
+    Interpolate waypoints with the cheapest method that meets the given bounds.
+
+    Methods are tried in order of predicted cost, skipping those whose
+    conditioning check fails, and each candidate path is sampled from the
+    method's fit. Paths with non-finite points are rejected. The first path
+    whose maximum deviation and maximum curvature are within bounds is
+    returned. If no method meets the bounds, the finite candidate with the
+    lowest deviation is returned.
+
+    Args:
+        waypoints (numpy.ndarray): Waypoints as [x, y] coordinates
+        num_points (int): Number of points in the interpolated path
+        max_deviation (float): Maximum allowed waypoint deviation
+        max_curvature (float): Maximum allowed path curvature
+        return_choice (bool): Also return the selected method and estimates
+
+    Returns:
+        numpy.ndarray: Interpolated path, or (path, choice) when return_choice
+        is set, where choice is a dict with 'method', 'met_bounds' and
+        'estimates'
+
+    Raises:
+        ValueError: If no method produces a finite path
+    """
+    from utils.metrics import path_deviation, curvature_metrics
+
+    waypoints = np.asarray(waypoints, dtype=float)
+    estimates = estimate_method_costs(waypoints, num_points)
+
+    candidates = sorted((m for m in estimates if estimates[m]['stable']),
+                        key=lambda m: estimates[m]['cost'])
+
+    best = None
+    within_bounds = False
+    for method in candidates:
+        path = get_method(method, 'fit')(waypoints, num_points=num_points).to_array()
+        if not np.all(np.isfinite(path)):
+            logger.debug("auto: %s rejected (non-finite path)", method)
+            continue
+
+        deviation = path_deviation(waypoints, path)['max_deviation']
+        curvature = curvature_metrics(path)['max_curvature']
+
+        # NaN metrics fail every bound and never become the best candidate
+        within_bounds = bool((max_deviation is None or deviation <= max_deviation) and
+                             (max_curvature is None or curvature <= max_curvature))
+
+        if within_bounds or best is None or deviation < best[2]:
+            best = (method, path, deviation)
+        if within_bounds:
+            break
+        logger.debug("auto: %s rejected (deviation %.4g, curvature %.4g)",
+                     method, deviation, curvature)
+
+    if best is None:
+        raise ValueError("No interpolation method produced a finite path")
+
+    method, path, deviation = best
+    logger.info("auto: selected %s for %d waypoints (predicted %.3g s, "
+                "deviation %.4g, bounds %s)", method, len(waypoints),
+                estimates[method]['cost'], deviation,
+                "met" if within_bounds else "not met")
+
+    if return_choice:
+        return path, {
+            'method': method,
+            'met_bounds': within_bounds,
+            'estimates': estimates
+        }
+    return path
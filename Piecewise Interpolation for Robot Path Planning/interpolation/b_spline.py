@@ -1,4 +1,7 @@
 import numpy as np
+from interpolation.evaluation import bspline_basis_matrix, b_spline_evaluation_matrix
+from interpolation.path import PiecewisePolynomial
+from utils.waypoints import chord_length_parameter
 
 def generate_knot_vector(n, k):
     """Generate a clamped knot vector."""
@@ -54,3 +57,85 @@ def b_spline_interpolate(waypoints, degree=3, num_points=100):
     
     # STUDENT IMPLEMENTATION END
     return curve_points
+
+def averaged_knot_vector(t_params, k):
+    """Clamped knot vector whose internal knots average the parameters.
+
+    Internal knot j is the mean of t_params[j:j + k] (de Boor's averaging),
+    so every parameter lies inside the support of its basis function
+    (Schoenberg-Whitney) and the collocation matrix is well conditioned.
+    The n + k + 1 knots repeat the first and last parameter k + 1 times.
+    """
+    t_params = np.asarray(t_params, dtype=float)
+    n = len(t_params)
+    sums = np.concatenate(([0.0], np.cumsum(t_params)))
+    internal = (sums[k + 1:n] - sums[1:n - k]) / k
+    return np.concatenate((np.full(k + 1, t_params[0]), internal, np.full(k + 1, t_params[-1])))
+
+def b_spline_interpolate_batch(waypoints_batch, degree=3, num_points=100):
+    """Interpolate a batch of equal-size waypoint sets using B-splines.
+
+    The knot vector depends on a path's chord-length parameters, as in
+    b_spline_fit. Paths are grouped by parameters, and so by knot vector;
+    each group factorizes its collocation matrix once for all of its paths
+    and is evaluated with its cached sparse evaluation matrix in a single
+    sparse-dense product.
+
+    Returns:
+        numpy.ndarray: Curve points of shape (batch, num_points, d)
+    """
+    waypoints_batch = np.asarray(waypoints_batch, dtype=float)
+    batch, n, dims = waypoints_batch.shape
+    k = min(degree, n - 1)
+
+    t_groups, group = np.unique(chord_length_parameter(waypoints_batch), axis=0,
+                                return_inverse=True)
+    group = group.ravel()
+
+    curve_points = np.empty((batch, num_points, dims))
+    for g, t_params in enumerate(t_groups):
+        members = np.flatnonzero(group == g)
+        knots = averaged_knot_vector(t_params, k)
+        collocation = bspline_basis_matrix(knots, k, t_params).toarray()
+
+        # One solve for the coordinates of every path in the group
+        rhs = waypoints_batch[members].transpose(1, 0, 2).reshape(n, -1)
+        control_points = np.linalg.solve(collocation, rhs).reshape(n, len(members), dims)
+        curve_points[members] = (b_spline_evaluation_matrix(knots, k, num_points)
+                                 @ control_points.transpose(1, 0, 2))
+
+    return curve_points
+
+def b_spline_derivative_control_points(control_points, degree, knots):
+    """Control points and knots of the derivative of a B-spline curve.
+
+    The derivative of a degree-k B-spline is a degree-(k-1) B-spline on the
+    inner knots with control points k * (P_{i+1} - P_i) / (u_{i+k+1} - u_{i+1}).
+    """
+    control_points = np.asarray(control_points, dtype=float)
+    knots = np.asarray(knots, dtype=float)
+    k = degree
+
+    spans = knots[k + 1:k + len(control_points)] - knots[1:len(control_points)]
+    safe_spans = np.where(spans > 0, spans, 1.0)[:, None]
+    derivative_points = k * np.diff(control_points, axis=0) / safe_spans
+    derivative_points[spans <= 0] = 0.0
+
+    return derivative_points, knots[1:-1]
+
+def b_spline_fit(waypoints, degree=3, num_points=100):
+    """Fit a B-spline through waypoints and return it as a lazy path object.
+
+    Waypoints may have any number of coordinates, shape (n, d); the
+    collocation matrix is factorized once and solved for all d columns.
+    """
+    waypoints = np.asarray(waypoints, dtype=float)
+    n = len(waypoints)
+    k = min(degree, n - 1)
+
+    t_params = chord_length_parameter(waypoints)
+    knots = averaged_knot_vector(t_params, k)
+    collocation = bspline_basis_matrix(knots, k, t_params).toarray()
+    control_points = np.linalg.solve(collocation, waypoints)
+
+    return PiecewisePolynomial.from_b_spline(control_points, k, knots, num_points)
@@ -0,0 +1,175 @@
+import numpy as np
+from interpolation.path import PiecewisePolynomial
+
+
+def chebyshev_lobatto_nodes(n):
+    """Chebyshev-Lobatto nodes cos(pi k / n), k = 0..n, from 1 down to -1."""
+    return np.cos(np.pi * np.arange(n + 1) / n)
+
+
+def chebyshev_coefficients(values):
+    """
+    Chebyshev coefficients of the interpolant through values at Lobatto nodes.
+
+    The values at the n + 1 nodes of chebyshev_lobatto_nodes(n) are mirrored
+    into an even sequence of length 2n, whose FFT is the DCT-I of the
+    values, so the coefficients cost O(n log n).
+
+    Args:
+        values (numpy.ndarray): Values of shape (n + 1,) or (n + 1, d)
+
+    Returns:
+        numpy.ndarray: Coefficients c_0..c_n, same shape as values
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values) - 1
+    if n == 0:
+        return values.copy()
+
+    extended = np.concatenate((values, values[-2:0:-1]), axis=0)
+    coeffs = np.fft.rfft(extended, axis=0).real[:n + 1] / n
+    coeffs[0] /= 2
+    coeffs[n] /= 2
+    return coeffs
+
+
+def clenshaw(coeffs, x):
+    """
+    Evaluate a Chebyshev series at x with Clenshaw's recurrence.
+
+    Args:
+        coeffs (numpy.ndarray): Coefficients of shape (m,) or (m, d)
+        x (numpy.ndarray): Points in [-1, 1]
+
+    Returns:
+        numpy.ndarray: Values of shape (len(x),) or (len(x), d)
+    """
+    coeffs = np.asarray(coeffs, dtype=float)
+    x = np.atleast_1d(np.asarray(x, dtype=float))
+    if coeffs.ndim == 2:
+        x = x[:, None]
+
+    b1 = np.zeros(np.broadcast_shapes(x.shape, coeffs.shape[1:]))
+    b2 = np.zeros_like(b1)
+    two_x = 2 * x
+    for c in coeffs[:0:-1]:
+        b1, b2 = c + two_x * b1 - b2, b1
+    return coeffs[0] + x * b1 - b2
+
+
+def truncate_coefficients(coeffs, tolerance):
+    """
+    Drop the trailing coefficients whose combined size is below tolerance.
+
+    Since |T_k(x)| <= 1 on [-1, 1], the sum of the norms of the dropped
+    coefficients bounds the change of the series anywhere on the interval.
+
+    Returns:
+        tuple: (truncated coefficients, bound on the truncation error)
+    """
+    coeffs = np.asarray(coeffs, dtype=float)
+    norms = np.abs(coeffs) if coeffs.ndim == 1 else np.sqrt(np.sum(coeffs**2, axis=1))
+    # tail[k] = sum of norms from k to the end
+    tail = np.append(np.cumsum(norms[::-1])[::-1], 0.0)
+    keep = max(int(np.argmax(tail <= tolerance)), 1)
+    return coeffs[:keep], float(tail[keep])
+
+
+def chebyshev_series(waypoints, tolerance=None):
+    """
+    Truncated Chebyshev series through waypoints at Chebyshev-Lobatto parameters.
+
+    Waypoint i of n is placed at t_i = (1 - cos(pi i / (n - 1))) / 2 in
+    [0, 1] instead of at its chord length: a single polynomial through
+    chord-length (or any near-uniform) parameters is the Newton/Lagrange
+    interpolant and oscillates like Runge's example at high degree, while
+    on these nodes its Lebesgue constant only grows like log n. The
+    coefficients come from one DCT-I (FFT) of the waypoints, and the
+    trailing ones are dropped while their combined size stays below
+    tolerance, so densely sampled smooth routes get a low degree.
+
+    Args:
+        waypoints (numpy.ndarray): Waypoints of shape (n, d), n >= 2
+        tolerance (float): Bound on the distance between the truncated and
+            the full series (default: 1e-9 of the waypoints' bounding box
+            diagonal)
+
+    Returns:
+        dict: Dictionary with the series:
+            - coeffs: Coefficients of shape (degree + 1, d) in x = 1 - 2 t
+            - degree: Degree after truncation
+            - error_bound: Bound on the truncation error
+            - tolerance: The tolerance used
+    """
+    waypoints = np.asarray(waypoints, dtype=float)
+    if tolerance is None:
+        diagonal = np.sqrt(np.sum((waypoints.max(axis=0) - waypoints.min(axis=0))**2))
+        tolerance = 1e-9 * diagonal if diagonal > 0 else 1e-9
+
+    coeffs, error_bound = truncate_coefficients(chebyshev_coefficients(waypoints), tolerance)
+    return {'coeffs': coeffs, 'degree': len(coeffs) - 1, 'error_bound': error_bound,
+            'tolerance': tolerance}
+
+
+def chebyshev_fit(waypoints, num_points=100, tolerance=None, max_piece_order=24):
+    """
+    Interpolate waypoints with one truncated Chebyshev series (see chebyshev_series).
+
+    The power basis of a high-degree polynomial is ill conditioned, and so
+    are its Taylor coefficients computed from the derivative series, so the
+    path stores one short piece per pair of consecutive Lobatto parameters
+    instead. Over such a short interval the series is resolved by a low
+    degree: every piece is the Chebyshev interpolant of the series at
+    max_piece_order + 1 local Lobatto points, all of them evaluated in a
+    single Clenshaw pass, with the trailing local coefficients below
+    tolerance dropped before converting to powers of the local parameter.
+
+    Args:
+        waypoints (numpy.ndarray): Waypoints of shape (n, d), n >= 2
+        num_points (int): Default number of samples of the path
+        tolerance (float): Truncation tolerance of chebyshev_series
+        max_piece_order (int): Largest degree of a piece
+
+    Returns:
+        PiecewisePolynomial: The interpolant over t in [0, 1]
+    """
+    waypoints = np.asarray(waypoints, dtype=float)
+    series = chebyshev_series(waypoints, tolerance)
+    coeffs = series['coeffs']
+    t = (1 - chebyshev_lobatto_nodes(len(waypoints) - 1)) / 2
+    widths = np.diff(t)
+
+    order = min(len(coeffs) - 1, max_piece_order)
+    if order == 0:
+        return PiecewisePolynomial(t, np.repeat(coeffs[None], len(widths), axis=0), num_points)
+
+    # Local Lobatto points v in [0, 1] of every piece, in the order expected
+    # by chebyshev_coefficients (u = 2 v - 1 from 1 down to -1)
+    v = (1 + chebyshev_lobatto_nodes(order)) / 2
+    samples = clenshaw(coeffs, 1 - 2 * (t[:-1, None] + widths[:, None] * v).ravel())
+    local = chebyshev_coefficients(samples.reshape(len(widths), order + 1, -1).transpose(1, 0, 2))
+
+    # Drop the local terms that stay below the truncation tolerance on every piece
+    norms = np.sqrt(np.sum(local**2, axis=2)).max(axis=1)
+    significant = np.nonzero(norms > 1e-3 * series['tolerance'])[0]
+    local = local[:significant[-1] + 1 if len(significant) else 1]
+
+    # T_k(2 v - 1) in powers of v, then v = s / width
+    basis = np.zeros((len(local), len(local)))
+    for k in range(len(local)):
+        power = np.polynomial.Chebyshev.basis(k, domain=[0, 1]).convert(kind=np.polynomial.Polynomial).coef
+        basis[:len(power), k] = power
+    pieces = np.einsum('jk,kpd->pjd', basis, local)
+    pieces /= widths[:, None, None] ** np.arange(len(local))[None, :, None]
+    return PiecewisePolynomial(t, pieces, num_points)
+
+
+def chebyshev_interpolate(waypoints, num_points=100, tolerance=None):
+    """
+    Interpolate a path through waypoints with a truncated Chebyshev series.
+
+    The path is sampled with one Clenshaw pass over the truncated series,
+    without building the pieces of chebyshev_fit.
+    """
+    coeffs = chebyshev_series(waypoints, tolerance)['coeffs']
+    return clenshaw(coeffs, 1 - 2 * np.linspace(0, 1, num_points))
@@ -1,4 +1,7 @@
 import numpy as np
+from interpolation.evaluation import cubic_spline_evaluation_matrix
+from interpolation.path import PiecewisePolynomial
+from utils.waypoints import chord_length_parameter
 
 def compute_spline_coefficients(x, y, boundary_condition='natural'):
     """Compute the coefficients for cubic spline interpolation."""
@@ -42,3 +45,149 @@ def cubic_spline_interpolate(waypoints, num_points=100, boundary_condition='natu
     
     # STUDENT IMPLEMENTATION END
     return path
+
+BOUNDARY_CONDITIONS = ('natural', 'clamped', 'not-a-knot')
+
+def spline_coefficients(x, Y, boundary_condition='natural'):
+    """Cubic spline coefficients for many value columns at once.
+
+    The tridiagonal system for the second derivatives depends only on the
+    breakpoints, so it is factorized once (Thomas algorithm) and the
+    elimination is applied to every column of Y as a multi-RHS solve.
+    Leading batch axes solve many systems with different breakpoints in
+    the same vectorized steps.
+
+    Only the interior unknowns are solved for. The boundary condition
+    fixes the two end unknowns in terms of their neighbours, which
+    changes the first and last equations but keeps the system
+    tridiagonal:
+
+    - 'natural': zero second derivative at both ends
+    - 'clamped': zero first derivative at both ends
+    - 'not-a-knot': continuous third derivative at the second and the
+      second-to-last breakpoints (one parabola through three points)
+
+    Args:
+        x: Breakpoints, shape (n,) or (batch, n)
+        Y: Values, shape (n, k) or (batch, n, k) -- e.g. the d coordinates
+            of the waypoints
+        boundary_condition (str): One of BOUNDARY_CONDITIONS
+
+    Returns:
+        tuple: (a, b, c, d) arrays of shape (n - 1, k) or (batch, n - 1, k),
+        in the same form as compute_spline_coefficients
+    """
+    if boundary_condition not in BOUNDARY_CONDITIONS:
+        raise ValueError(f"Unknown boundary condition '{boundary_condition}', "
+                         f"expected one of {BOUNDARY_CONDITIONS}")
+
+    x = np.asarray(x, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    n = x.shape[-1]
+    h = np.diff(x, axis=-1)[..., None]
+    slopes = np.diff(Y, axis=-2) / h
+
+    # Interior equations: h[i-1] c[i-1] + 2 (h[i-1] + h[i]) c[i] + h[i] c[i+1] = rhs[i]
+    c = np.zeros_like(Y)
+    m = n - 2
+    if boundary_condition == 'clamped' and m == 0:
+        # 2 h c[0] + h c[1] = 3 slope and h c[0] + 2 h c[1] = -3 slope
+        c[..., 0, :] = 3 * slopes[..., 0, :] / h[..., 0, :]
+        c[..., 1, :] = -c[..., 0, :]
+    elif boundary_condition == 'not-a-knot' and m == 1:
+        # The parabola through the three points
+        c[..., :, :] = ((slopes[..., 1:, :] - slopes[..., :1, :])
+                        / (h[..., :1, :] + h[..., 1:, :]))
+    elif m > 0:
+        rhs = 3 * (slopes[..., 1:, :] - slopes[..., :-1, :])
+        diag = 2 * (h[..., :-1, :] + h[..., 1:, :])
+        lower = h[..., 1:-1, :].copy()
+        upper = h[..., 1:-1, :].copy()
+
+        first, last = h[..., 0, :], h[..., -1, :]
+        if boundary_condition == 'clamped':
+            # c[0] = (3 slope[0] / h[0] - c[1]) / 2, likewise at the end
+            diag[..., 0, :] -= first / 2
+            diag[..., -1, :] -= last / 2
+            rhs[..., 0, :] -= 1.5 * slopes[..., 0, :]
+            rhs[..., -1, :] += 1.5 * slopes[..., -1, :]
+        elif boundary_condition == 'not-a-knot':
+            # c[0] = ((h[0] + h[1]) c[1] - h[0] c[2]) / h[1], likewise at the end
+            second, second_last = h[..., 1, :], h[..., -2, :]
+            diag[..., 0, :] += first * (first + second) / second
+            upper[..., 0, :] -= first**2 / second
+            diag[..., -1, :] += last * (last + second_last) / second_last
+            lower[..., -1, :] -= last**2 / second_last
+
+        # Factorize once: modified diagonal and elimination multipliers
+        modified = diag.copy()
+        multipliers = np.zeros_like(diag)
+        for i in range(1, m):
+            multipliers[..., i, :] = lower[..., i - 1, :] / modified[..., i - 1, :]
+            modified[..., i, :] = diag[..., i, :] - multipliers[..., i, :] * upper[..., i - 1, :]
+
+        # Forward elimination and back substitution for all columns
+        for i in range(1, m):
+            rhs[..., i, :] -= multipliers[..., i, :] * rhs[..., i - 1, :]
+        interior = np.empty_like(rhs)
+        interior[..., -1, :] = rhs[..., -1, :] / modified[..., -1, :]
+        for i in range(m - 2, -1, -1):
+            interior[..., i, :] = ((rhs[..., i, :] - upper[..., i, :] * interior[..., i + 1, :])
+                                   / modified[..., i, :])
+        c[..., 1:-1, :] = interior
+
+        if boundary_condition == 'clamped':
+            c[..., 0, :] = (3 * slopes[..., 0, :] / first - c[..., 1, :]) / 2
+            c[..., -1, :] = (-3 * slopes[..., -1, :] / last - c[..., -2, :]) / 2
+        elif boundary_condition == 'not-a-knot':
+            c[..., 0, :] = ((first + second) * c[..., 1, :] - first * c[..., 2, :]) / second
+            c[..., -1, :] = (((last + second_last) * c[..., -2, :] - last * c[..., -3, :])
+                             / second_last)
+
+    a = Y[..., :-1, :]
+    b = slopes - h * (2 * c[..., :-1, :] + c[..., 1:, :]) / 3
+    d = (c[..., 1:, :] - c[..., :-1, :]) / (3 * h)
+    return a, b, c[..., :-1, :], d
+
+def cubic_spline_interpolate_batch(waypoints_batch, num_points=100, boundary_condition='natural'):
+    """Interpolate a batch of equal-size waypoint sets using cubic splines.
+
+    Each path is parameterized by chord length, as in cubic_spline_fit, so
+    row i equals cubic_spline_fit(waypoints_batch[i]).to_array(). The
+    spline systems of all paths are solved together. Paths are
+    then grouped by parameters, and each group is sampled at num_points
+    uniform parameters with its cached sparse evaluation matrix in a
+    single sparse-dense product.
+
+    Returns:
+        numpy.ndarray: Path points of shape (batch, num_points, d)
+    """
+    waypoints_batch = np.asarray(waypoints_batch, dtype=float)
+    batch, n, dims = waypoints_batch.shape
+    t = chord_length_parameter(waypoints_batch)
+
+    a, b, c, d = spline_coefficients(t, waypoints_batch, boundary_condition)
+
+    # [a_0, b_0, c_0, d_0, a_1, ...] per path, the layout of the evaluation matrix
+    coeffs = np.stack((a, b, c, d), axis=2).reshape(batch, 4 * (n - 1), dims)
+
+    t_groups, group = np.unique(t, axis=0, return_inverse=True)
+    group = group.ravel()
+
+    path_points = np.empty((batch, num_points, dims))
+    for g, t_params in enumerate(t_groups):
+        members = np.flatnonzero(group == g)
+        path_points[members] = cubic_spline_evaluation_matrix(t_params, num_points) @ coeffs[members]
+    return path_points
+
+def cubic_spline_fit(waypoints, num_points=100, boundary_condition='natural'):
+    """Fit a chord-length parameterized cubic spline and return it as a lazy path object.
+
+    Waypoints may have any number of coordinates, shape (n, d).
+    """
+    waypoints = np.asarray(waypoints, dtype=float)
+    t = chord_length_parameter(waypoints)
+    a, b, c, d = spline_coefficients(t, waypoints, boundary_condition)
+    coeffs_per_dim = [(a[:, j], b[:, j], c[:, j], d[:, j]) for j in range(waypoints.shape[1])]
+
+    return PiecewisePolynomial.from_cubic_spline(t, coeffs_per_dim, num_points)
@@ -0,0 +1,199 @@
+import functools
+import numpy as np
+
+from utils import telemetry
+
+
+class EvaluationMatrix:
+    """
+    Sparse (CSR) linear map from curve coefficients to sampled path points.
+
+    Stores the standard CSR arrays (data, indices, indptr). Multiplying by a
+    coefficient array of shape (n_coeffs, d), or by a batch of shape
+    (batch, n_coeffs, d), evaluates every path in a single product.
+    """
+
+    __slots__ = ('data', 'indices', 'indptr', 'shape')
+
+    def __init__(self, data, indices, indptr, shape):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.intp)
+        self.indptr = np.asarray(indptr, dtype=np.intp)
+        self.shape = tuple(shape)
+        # Cached matrices are shared between callers
+        for array in (self.data, self.indices, self.indptr):
+            array.setflags(write=False)
+
+    @classmethod
+    def from_dense_rows(cls, columns, values, num_cols):
+        """Build from equal-width rows: columns/values of shape (rows, width)."""
+        rows, width = columns.shape
+        indptr = np.arange(0, rows * width + 1, width)
+        return cls(values.ravel(), columns.ravel(), indptr, (rows, num_cols))
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def __matmul__(self, coeffs):
+        coeffs = np.asarray(coeffs, dtype=float)
+        vector = coeffs.ndim == 1
+        if vector:
+            coeffs = coeffs[:, None]
+
+        if coeffs.shape[-2] != self.shape[1]:
+            raise ValueError(f"Coefficient shape {coeffs.shape} does not match "
+                             f"evaluation matrix shape {self.shape}")
+
+        # Gather the coefficients each nonzero touches, weight, and sum per row
+        axis = coeffs.ndim - 2
+        if self.nnz == 0:
+            shape = list(coeffs.shape)
+            shape[axis] = self.shape[0]
+            result = np.zeros(shape)
+            return result[..., 0] if vector else result
+        gathered = np.take(coeffs, self.indices, axis=axis)
+        gathered = gathered * self.data[:, None]
+        starts = self.indptr[:-1]
+        filled = starts < self.indptr[1:]
+        if np.all(filled):
+            result = np.add.reduceat(gathered, starts, axis=axis)
+        else:
+            # reduceat cannot express empty rows; sum the filled rows only
+            shape = list(gathered.shape)
+            shape[axis] = self.shape[0]
+            result = np.zeros(shape)
+            result[..., filled, :] = np.add.reduceat(gathered, starts[filled], axis=axis)
+
+        return result[..., 0] if vector else result
+
+    def toarray(self):
+        """Return the matrix as a dense numpy array."""
+        dense = np.zeros(self.shape)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        np.add.at(dense, (rows, self.indices), self.data)
+        return dense
+
+    def to_scipy(self):
+        """Return the matrix as a scipy.sparse.csr_matrix (requires scipy)."""
+        from scipy.sparse import csr_matrix
+        return csr_matrix((self.data, self.indices, self.indptr), shape=self.shape)
+
+
+def find_knot_spans(knots, degree, t):
+    """Index of the knot span [u_s, u_{s+1}) containing each parameter value."""
+    knots = np.asarray(knots, dtype=float)
+    n_basis = len(knots) - degree - 1
+    spans = np.searchsorted(knots, t, side='right') - 1
+    # The right end of a clamped knot vector belongs to the last span
+    return np.clip(spans, degree, n_basis - 1)
+
+
+def bspline_basis_matrix(knots, degree, t):
+    """
+    Evaluate all nonzero B-spline basis functions at parameter values t.
+
+    Vectorized Cox-de Boor recursion (triangular scheme): only the
+    ``degree + 1`` functions that are nonzero on each span are computed.
+
+    Args:
+        knots (numpy.ndarray): Clamped knot vector
+        degree (int): B-spline degree
+        t (numpy.ndarray): Parameter values
+
+    Returns:
+        EvaluationMatrix: Matrix of shape (len(t), len(knots) - degree - 1)
+    """
+    knots = np.asarray(knots, dtype=float)
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    n_basis = len(knots) - degree - 1
+    spans = find_knot_spans(knots, degree, t)
+
+    values = np.zeros((len(t), degree + 1))
+    values[:, 0] = 1.0
+    left = np.zeros((len(t), degree + 1))
+    right = np.zeros((len(t), degree + 1))
+
+    for j in range(1, degree + 1):
+        left[:, j] = t - knots[spans + 1 - j]
+        right[:, j] = knots[spans + j] - t
+        saved = np.zeros(len(t))
+        for r in range(j):
+            denom = right[:, r + 1] + left[:, j - r]
+            temp = np.divide(values[:, r], denom, out=np.zeros(len(t)), where=denom != 0)
+            values[:, r] = saved + right[:, r + 1] * temp
+            saved = left[:, j - r] * temp
+        values[:, j] = saved
+
+    columns = spans[:, None] - degree + np.arange(degree + 1)
+    return EvaluationMatrix.from_dense_rows(columns, values, n_basis)
+
+
+def cubic_spline_basis_matrix(x_points, x_eval):
+    """
+    Map stacked cubic spline coefficients to values at x_eval.
+
+    The coefficient vector is laid out segment by segment as
+    [a_0, b_0, c_0, d_0, a_1, ...], i.e. ``np.column_stack(coeffs).ravel()``
+    for the (a, b, c, d) arrays of compute_spline_coefficients.
+
+    Args:
+        x_points (numpy.ndarray): Spline breakpoints
+        x_eval (numpy.ndarray): Evaluation points
+
+    Returns:
+        EvaluationMatrix: Matrix of shape (len(x_eval), 4 * (len(x_points) - 1))
+    """
+    x_points = np.asarray(x_points, dtype=float)
+    x_eval = np.atleast_1d(np.asarray(x_eval, dtype=float))
+    n_segments = len(x_points) - 1
+
+    segment = np.searchsorted(x_points, x_eval, side='right') - 1
+    segment = np.clip(segment, 0, n_segments - 1)
+    dx = x_eval - x_points[segment]
+
+    values = dx[:, None] ** np.arange(4)
+    columns = 4 * segment[:, None] + np.arange(4)
+    return EvaluationMatrix.from_dense_rows(columns, values, 4 * n_segments)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_b_spline_matrix(knots, degree, num_points):
+    t = np.linspace(knots[degree], knots[-degree - 1], num_points)
+    return bspline_basis_matrix(np.array(knots), degree, t)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_cubic_spline_matrix(x_points, num_points):
+    x_eval = np.linspace(x_points[0], x_points[-1], num_points)
+    return cubic_spline_basis_matrix(np.array(x_points), x_eval)
+
+
+def b_spline_evaluation_matrix(knots, degree, num_points):
+    """Cached evaluation matrix of a B-spline at num_points uniform parameters."""
+    return _cached_b_spline_matrix(tuple(np.asarray(knots, dtype=float)), degree, num_points)
+
+
+def cubic_spline_evaluation_matrix(x_points, num_points):
+    """Cached evaluation matrix of a cubic spline at num_points uniform points."""
+    return _cached_cubic_spline_matrix(tuple(np.asarray(x_points, dtype=float)), num_points)
+
+
+def clear_evaluation_cache():
+    """Drop all cached evaluation matrices."""
+    _cached_b_spline_matrix.cache_clear()
+    _cached_cubic_spline_matrix.cache_clear()
+
+
+@telemetry.register_collector
+def _cache_telemetry():
+    """Report the evaluation matrix caches to telemetry at export time."""
+    for cache, cached in (('b_spline', _cached_b_spline_matrix),
+                          ('cubic_spline', _cached_cubic_spline_matrix)):
+        info = cached.cache_info()
+        telemetry.gauge('evaluation_cache_hits', 'Evaluation matrix cache hits').set(
+            info.hits, cache=cache)
+        telemetry.gauge('evaluation_cache_misses', 'Evaluation matrix cache misses').set(
+            info.misses, cache=cache)
+        telemetry.gauge('evaluation_cache_entries', 'Evaluation matrices in the cache').set(
+            info.currsize, cache=cache)
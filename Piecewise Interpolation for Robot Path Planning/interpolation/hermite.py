@@ -0,0 +1,143 @@
+import numpy as np
+from interpolation.path import PiecewisePolynomial
+from utils.waypoints import chord_length_parameter
+
+# Local C1 interpolants. Each one is a cubic Hermite curve: the tangent at a
+# waypoint depends only on its neighbours, so every segment is computed in
+# one vectorized O(n) pass with no global linear solve, and moving a
+# waypoint only changes the segments next to it.
+
+def hermite_coefficients(t, points, tangents):
+    """
+    Power-basis coefficients of the cubic Hermite segments.
+
+    Args:
+        t: Parameter values, shape (n,)
+        points: Waypoints, shape (n, d)
+        tangents: Derivatives dP/dt at the waypoints, shape (n, d)
+
+    Returns:
+        numpy.ndarray: Coefficients of shape (n - 1, 4, d) for
+        PiecewisePolynomial (a, b, c, d of each segment)
+    """
+    h = np.diff(t)[:, None]
+    delta = np.diff(points, axis=0) / h
+    m0, m1 = tangents[:-1], tangents[1:]
+
+    c = (3 * delta - 2 * m0 - m1) / h
+    d = (m0 + m1 - 2 * delta) / h**2
+    return np.stack((points[:-1], m0, c, d), axis=1)
+
+def _secants(t, points):
+    return np.diff(points, axis=0) / np.diff(t)[:, None]
+
+def akima_tangents(t, points):
+    """
+    Akima tangents: a weighted average of the neighbouring secants.
+
+    The weights are the differences of the secants on the far side, so a
+    tangent follows the side where the path is straight and outliers do
+    not cause overshoot. For curves the weights use the norm of the secant
+    differences, shared by all coordinates. Two secants are extrapolated
+    linearly at each end.
+    """
+    m = _secants(t, points)
+    if len(m) == 1:
+        return np.vstack((m, m))
+
+    start = 2 * m[:1] - m[1:2]
+    end = 2 * m[-1:] - m[-2:-1]
+    m = np.vstack((2 * start - m[:1], start, m, end, 2 * end - m[-1:]))
+
+    # Secant differences |m_{k+1} - m_k| around every waypoint
+    diff = np.sqrt(np.sum(np.diff(m, axis=0)**2, axis=1))
+    w1 = diff[2:]     # |m_{i+1} - m_i|
+    w2 = diff[:-2]    # |m_{i-1} - m_{i-2}|
+    left, right = m[1:-2], m[2:-1]
+
+    total = w1 + w2
+    flat = total == 0
+    total[flat] = 1.0
+    tangents = (w1[:, None] * left + w2[:, None] * right) / total[:, None]
+    tangents[flat] = 0.5 * (left[flat] + right[flat])
+    return tangents
+
+def catmull_rom_tangents(t, points):
+    """
+    Tangents of the non-uniform Catmull-Rom spline.
+
+    Interior tangents are those of the parabola through each waypoint and
+    its two neighbours; the end tangents are the end secants.
+    """
+    m = _secants(t, points)
+    if len(m) == 1:
+        return np.vstack((m, m))
+
+    span = (t[2:] - t[:-2])[:, None]
+    interior = m[:-1] + m[1:] - (points[2:] - points[:-2]) / span
+    return np.vstack((m[:1], interior, m[-1:]))
+
+def pchip_tangents(t, points):
+    """
+    Monotone (Fritsch-Carlson) tangents, per coordinate.
+
+    Where the secants on both sides of a waypoint have the same sign the
+    tangent is their weighted harmonic mean; at local extrema it is zero.
+    Each coordinate is therefore monotone between waypoints wherever the
+    waypoints are, so the path does not overshoot them.
+    """
+    h = np.diff(t)[:, None]
+    m = _secants(t, points)
+    tangents = np.zeros_like(points, dtype=float)
+    if len(m) == 1:
+        return np.vstack((m, m))
+
+    w1 = 2 * h[1:] + h[:-1]
+    w2 = h[1:] + 2 * h[:-1]
+    same_sign = (np.sign(m[:-1]) * np.sign(m[1:])) > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        harmonic = (w1 + w2) / (w1 / m[:-1] + w2 / m[1:])
+    tangents[1:-1] = np.where(same_sign, harmonic, 0.0)
+
+    # Three-point end tangents, limited to keep the ends shape preserving
+    for end, (h0, h1, m0, m1) in ((0, (h[0], h[1], m[0], m[1])),
+                                  (-1, (h[-1], h[-2], m[-1], m[-2]))):
+        tangent = ((2 * h0 + h1) * m0 - h0 * m1) / (h0 + h1)
+        tangent[np.sign(tangent) != np.sign(m0)] = 0.0
+        overshoot = (np.sign(m0) != np.sign(m1)) & (np.abs(tangent) > np.abs(3 * m0))
+        tangent[overshoot] = 3 * m0[overshoot]
+        tangents[end] = tangent
+
+    return tangents
+
+def _hermite_fit(waypoints, tangent_func, t, num_points):
+    coeffs = hermite_coefficients(t, waypoints, tangent_func(t, waypoints))
+    return PiecewisePolynomial(t, coeffs, num_points)
+
+def akima_fit(waypoints, num_points=100):
+    """Fit an Akima curve over chord length and return it as a lazy path object."""
+    waypoints = np.asarray(waypoints, dtype=float)
+    return _hermite_fit(waypoints, akima_tangents, chord_length_parameter(waypoints), num_points)
+
+def catmull_rom_fit(waypoints, num_points=100, alpha=0.5):
+    """Fit a Catmull-Rom curve (centripetal for alpha=0.5) and return it as a lazy path object."""
+    waypoints = np.asarray(waypoints, dtype=float)
+    t = chord_length_parameter(waypoints, alpha)
+    return _hermite_fit(waypoints, catmull_rom_tangents, t, num_points)
+
+def pchip_fit(waypoints, num_points=100):
+    """Fit a monotone PCHIP curve over chord length and return it as a lazy path object."""
+    waypoints = np.asarray(waypoints, dtype=float)
+    return _hermite_fit(waypoints, pchip_tangents, chord_length_parameter(waypoints), num_points)
+
+def akima_interpolate(waypoints, num_points=100):
+    """Interpolate a path through waypoints using Akima's local method."""
+    return akima_fit(waypoints, num_points).to_array()
+
+def catmull_rom_interpolate(waypoints, num_points=100, alpha=0.5):
+    """Interpolate a path through waypoints using a centripetal Catmull-Rom spline."""
+    return catmull_rom_fit(waypoints, num_points, alpha).to_array()
+
+def pchip_interpolate(waypoints, num_points=100):
+    """Interpolate a path through waypoints using monotone piecewise cubic Hermite segments."""
+    return pchip_fit(waypoints, num_points).to_array()
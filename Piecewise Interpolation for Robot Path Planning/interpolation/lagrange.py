@@ -1,4 +1,6 @@
 import numpy as np
+from interpolation.newton import newton_fit
+from interpolation.path import PiecewisePolynomial
 
 def lagrange_basis(x, i, x_points):
     """Compute the i-th Lagrange basis polynomial (L_i) at x."""
@@ -27,3 +29,13 @@ def lagrange_interpolate(waypoints, num_points=100):
     
     # STUDENT IMPLEMENTATION END
     return path
+
+
+def lagrange_fit(waypoints, num_points=100, parametric=None):
+    """Fit Lagrange's polynomial through waypoints and return it as a lazy path object.
+
+    The interpolating polynomial is unique, so it is stored through the
+    Newton form that PiecewisePolynomial converts from. As with newton_fit,
+    waypoints that are not 2-D are fitted as a parametric curve.
+    """
+    return newton_fit(waypoints, num_points, parametric)
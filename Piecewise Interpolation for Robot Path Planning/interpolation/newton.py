@@ -1,4 +1,6 @@
 import numpy as np
+from interpolation.path import PiecewisePolynomial
+from utils.waypoints import chord_length_parameter
 
 def divided_differences(x, y):
     """Calculate the divided differences table for Newton interpolation."""
@@ -26,3 +28,37 @@ def newton_interpolate(waypoints, num_points=100):
     
     # STUDENT IMPLEMENTATION END
     return path
+
+def divided_differences_multi(x, Y):
+    """Divided differences of every column of Y over the same nodes x.
+
+    The node differences are shared, so each elimination step updates all
+    columns at once. Returns coefficients of shape (n, k).
+    """
+    x = np.asarray(x, dtype=float)
+    coef = np.array(Y, dtype=float)
+    n = len(x)
+    for j in range(1, n):
+        coef[j:] = (coef[j:] - coef[j - 1:-1]) / (x[j:] - x[:n - j])[:, None]
+    return coef
+
+def newton_fit(waypoints, num_points=100, parametric=None):
+    """Fit Newton's polynomial through waypoints and return it as a lazy path object.
+
+    By default 2-D waypoints give the graph y(x) that newton_interpolate
+    produces, and waypoints of any other dimension d give a parametric
+    curve over chord length with all d coordinates fitted together.
+    """
+    waypoints = np.asarray(waypoints, dtype=float)
+    if parametric is None:
+        parametric = waypoints.shape[1] != 2
+
+    if parametric:
+        t = chord_length_parameter(waypoints)
+        return PiecewisePolynomial.from_newton(t, divided_differences_multi(t, waypoints),
+                                               num_points)
+
+    x, y = waypoints[:, 0], waypoints[:, 1]
+    coef = divided_differences_multi(x, y[:, None])[:, 0]
+
+    return PiecewisePolynomial.from_newton(x, coef, num_points)
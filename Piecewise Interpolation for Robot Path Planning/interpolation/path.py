@@ -0,0 +1,284 @@
+import math
+import struct
+import numpy as np
+from numpy.lib.mixins import NDArrayOperatorsMixin
+
+
+def _taylor_shift(coeffs, shift):
+    """
+    Re-expand power-basis pieces about a shifted origin.
+
+    Piece p with coefficients c_j in s becomes the same polynomial in
+    s' = s - shift[p]: c'_k = sum_{j>=k} C(j, k) shift[p]**(j - k) c_j.
+    """
+    order = coeffs.shape[1]
+    j = np.arange(order)
+    binomial = np.array([[math.comb(jj, kk) for jj in j] for kk in j], dtype=float)
+    powers = np.asarray(shift, dtype=float)[:, None, None] ** np.maximum(j[None, :] - j[:, None], 0)
+    return np.einsum('pkj,pjd->pkd', binomial * powers, coeffs)
+
+
+class PiecewisePolynomial(NDArrayOperatorsMixin):
+    """
+    Immutable, lazily evaluated piecewise polynomial path.
+
+    Piece i covers [breakpoints[i], breakpoints[i + 1]] and is stored in the
+    local power basis:
+
+        r(t) = sum_j coeffs[i, j] * (t - breakpoints[i])**j
+
+    Only the breakpoints and coefficients are held in memory. Samples are
+    computed on demand; wherever an array is expected (indexing, numpy
+    functions, arithmetic) the path behaves like its ``to_array()`` result,
+    so code written for the (num_points, d) arrays of the *_interpolate
+    functions keeps working.
+    """
+
+    __slots__ = ('breakpoints', 'coeffs', 'num_points')
+
+    _HEADER = struct.Struct('<4sHIIII')
+    _MAGIC = b'PWPP'
+    _VERSION = 1
+
+    def __init__(self, breakpoints, coeffs, num_points=100):
+        breakpoints = np.array(breakpoints, dtype=float)
+        coeffs = np.array(coeffs, dtype=float)
+        if coeffs.ndim != 3 or len(breakpoints) != len(coeffs) + 1:
+            raise ValueError("coeffs must have shape (pieces, order, d) with "
+                             "len(breakpoints) == pieces + 1")
+
+        breakpoints.setflags(write=False)
+        coeffs.setflags(write=False)
+        object.__setattr__(self, 'breakpoints', breakpoints)
+        object.__setattr__(self, 'coeffs', coeffs)
+        object.__setattr__(self, 'num_points', int(num_points))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PiecewisePolynomial is immutable")
+
+    def __reduce__(self):
+        return (PiecewisePolynomial, (self.breakpoints, self.coeffs, self.num_points))
+
+    # -- Construction from fitted curves ----------------------------------
+
+    @classmethod
+    def from_cubic_spline(cls, x_points, coeffs_per_dim, num_points=100):
+        """Build from the (a, b, c, d) coefficients of each coordinate."""
+        coeffs = np.stack([np.column_stack(c) for c in coeffs_per_dim], axis=-1)
+        return cls(x_points, coeffs, num_points)
+
+    @classmethod
+    def from_b_spline(cls, control_points, degree, knots, num_points=100):
+        """Convert a clamped B-spline to one polynomial piece per knot span.
+
+        Each piece's Taylor coefficients r^(j)(u_s) / j! are evaluated from
+        the control points of the successive derivative curves.
+        """
+        from interpolation.b_spline import b_spline_derivative_control_points
+        from interpolation.evaluation import bspline_basis_matrix
+
+        control_points = np.asarray(control_points, dtype=float)
+        knots = np.asarray(knots, dtype=float)
+        breakpoints = np.unique(knots[degree:len(knots) - degree])
+        starts = breakpoints[:-1]
+
+        coeffs = np.empty((len(starts), degree + 1, control_points.shape[1]))
+        points, current_knots = control_points, knots
+        factorial = 1.0
+        for j in range(degree + 1):
+            if j > 0:
+                points, current_knots = b_spline_derivative_control_points(
+                    points, degree - j + 1, current_knots)
+                factorial *= j
+            basis = bspline_basis_matrix(current_knots, degree - j, starts)
+            coeffs[:, j] = (basis @ points) / factorial
+
+        return cls(breakpoints, coeffs, num_points)
+
+    @classmethod
+    def from_newton(cls, x, coef, num_points=100):
+        """Convert a Newton polynomial to power-basis pieces between its nodes.
+
+        1-D coefficients describe the graph (x, p(x)) produced by
+        newton_interpolate; coefficients of shape (n, d) describe a
+        parametric curve in d dimensions.
+
+        A single monomial expansion over the whole domain is hopelessly
+        ill-conditioned at high degree, so the polynomial is split at the
+        sorted nodes and expanded about the start of every piece, where
+        the local variable stays below one node spacing.
+        """
+        x = np.asarray(x, dtype=float)
+        coef = np.asarray(coef, dtype=float)
+        graph = coef.ndim == 1
+        coef_2d = coef[:, None] if graph else coef
+        breakpoints = np.unique(x)
+        if len(breakpoints) < 2:
+            breakpoints = np.array([x[0], x[0] + 1.0])
+        origins = breakpoints[:-1, None]
+
+        # Horner's scheme on polynomials in s = t - origin, for every piece
+        power = np.broadcast_to(coef_2d[-1:], (len(origins), 1, coef_2d.shape[1])).copy()
+        for k in range(len(x) - 2, -1, -1):
+            shifted = np.zeros((len(origins), power.shape[1] + 1, power.shape[2]))
+            shifted[:, 1:] += power
+            shifted[:, :-1] += (origins - x[k])[:, :, None] * power
+            shifted[:, 0] += coef_2d[k]
+            power = shifted
+
+        if graph:
+            identity = np.zeros((len(origins), power.shape[1], 1))
+            identity[:, 0, 0] = origins[:, 0]
+            if power.shape[1] > 1:
+                identity[:, 1, 0] = 1.0
+            power = np.concatenate((identity, power), axis=2)
+
+        return cls(breakpoints, power, num_points)
+
+    @classmethod
+    def concatenate(cls, paths, num_points=None):
+        """Join paths end to end, each starting where the previous one ends.
+
+        The parameter of every path is shifted (not scaled), so derivatives
+        are unchanged; pieces of lower order are padded with zeros.
+        """
+        order = max(path.order for path in paths)
+        breakpoints, coeffs = [paths[0].breakpoints[:1]], []
+        for path in paths:
+            breakpoints.append(path.breakpoints[1:] - path.breakpoints[0] + breakpoints[-1][-1])
+            coeffs.append(np.pad(path.coeffs, ((0, 0), (0, order - path.order), (0, 0))))
+        if num_points is None:
+            num_points = sum(path.num_points for path in paths)
+        return cls(np.concatenate(breakpoints), np.concatenate(coeffs), num_points)
+
+    # -- Evaluation --------------------------------------------------------
+
+    @property
+    def dim(self):
+        return self.coeffs.shape[2]
+
+    @property
+    def order(self):
+        return self.coeffs.shape[1]
+
+    @property
+    def domain(self):
+        return self.breakpoints[0], self.breakpoints[-1]
+
+    @property
+    def shape(self):
+        return (self.num_points, self.dim)
+
+    @property
+    def ndim(self):
+        return 2
+
+    @property
+    def nbytes(self):
+        return self.breakpoints.nbytes + self.coeffs.nbytes
+
+    def __call__(self, t):
+        """Evaluate the path at parameter values t; returns shape (len(t), d)."""
+        t = np.atleast_1d(np.asarray(t, dtype=float))
+        idx = np.searchsorted(self.breakpoints, t, side='right') - 1
+        idx = np.clip(idx, 0, len(self.coeffs) - 1)
+        s = (t - self.breakpoints[idx])[:, None]
+
+        local = self.coeffs[idx]
+        values = local[:, -1]
+        for j in range(self.order - 2, -1, -1):
+            values = values * s + local[:, j]
+        return values
+
+    def derivative(self, k=1):
+        """Return the k-th derivative as a new PiecewisePolynomial."""
+        coeffs = self.coeffs
+        for _ in range(k):
+            if coeffs.shape[1] == 1:
+                coeffs = np.zeros_like(coeffs)
+                break
+            coeffs = coeffs[:, 1:] * np.arange(1, coeffs.shape[1])[None, :, None]
+        return PiecewisePolynomial(self.breakpoints, coeffs, self.num_points)
+
+    def restrict(self, start, end, num_points=None):
+        """Return the part of the path between parameter values start and end."""
+        first = max(np.searchsorted(self.breakpoints, start, side='right') - 1, 0)
+        last = min(np.searchsorted(self.breakpoints, end, side='left'), len(self.coeffs))
+        last = max(last, first + 1)
+
+        coeffs = self.coeffs[first:last].copy()
+        coeffs[:1] = _taylor_shift(coeffs[:1], [start - self.breakpoints[first]])
+        breakpoints = np.concatenate(([start], self.breakpoints[first + 1:last], [end]))
+        return PiecewisePolynomial(breakpoints, coeffs,
+                                   self.num_points if num_points is None else num_points)
+
+    def reversed(self):
+        """Return the same curve traversed from end to start over the same domain."""
+        widths = np.diff(self.breakpoints)
+        coeffs = _taylor_shift(self.coeffs, widths)[::-1]
+        coeffs = coeffs * (-1.0) ** np.arange(self.order)[None, :, None]
+        breakpoints = self.breakpoints[0] + self.breakpoints[-1] - self.breakpoints[::-1]
+        return PiecewisePolynomial(breakpoints, coeffs, self.num_points)
+
+    def sample(self, n=None):
+        """Evaluate the path at n uniformly spaced parameter values."""
+        n = self.num_points if n is None else n
+        return self(np.linspace(self.breakpoints[0], self.breakpoints[-1], n))
+
+    def to_array(self):
+        """Return the path sampled at its default num_points."""
+        return self.sample(self.num_points)
+
+    def length(self, rtol=1e-10):
+        """Arc length of the path by Gauss-Legendre quadrature."""
+        from utils.metrics import curve_length
+        return curve_length(self.derivative(), self.breakpoints, rtol=rtol)
+
+    # -- Array coercion ----------------------------------------------------
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.to_array()
+        return array.astype(dtype, copy=False) if dtype is not None else array
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = tuple(x.to_array() if isinstance(x, PiecewisePolynomial) else x
+                       for x in inputs)
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __len__(self):
+        return self.num_points
+
+    def __getitem__(self, key):
+        return self.to_array()[key]
+
+    def __iter__(self):
+        return iter(self.to_array())
+
+    def __repr__(self):
+        return (f"PiecewisePolynomial(pieces={len(self.coeffs)}, order={self.order}, "
+                f"dim={self.dim}, domain=({self.domain[0]:g}, {self.domain[1]:g}), "
+                f"num_points={self.num_points})")
+
+    # -- Serialization -----------------------------------------------------
+
+    def to_bytes(self):
+        """Serialize to a compact little-endian binary representation."""
+        pieces, order, dim = self.coeffs.shape
+        header = self._HEADER.pack(self._MAGIC, self._VERSION, pieces, order, dim,
+                                   self.num_points)
+        return (header + self.breakpoints.astype('<f8').tobytes() +
+                self.coeffs.astype('<f8').tobytes())
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Deserialize a path written by to_bytes."""
+        magic, version, pieces, order, dim, num_points = cls._HEADER.unpack_from(data)
+        if magic != cls._MAGIC or version != cls._VERSION:
+            raise ValueError("Not a serialized PiecewisePolynomial")
+
+        offset = cls._HEADER.size
+        breakpoints = np.frombuffer(data, dtype='<f8', count=pieces + 1, offset=offset)
+        offset += breakpoints.nbytes
+        coeffs = np.frombuffer(data, dtype='<f8', count=pieces * order * dim, offset=offset)
+
+        return cls(breakpoints, coeffs.reshape(pieces, order, dim), num_points)
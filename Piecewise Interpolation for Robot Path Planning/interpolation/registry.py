@@ -0,0 +1,146 @@
+import functools
+import importlib
+import time
+
+from utils import telemetry
+
+# Interpolation methods by name. Functions are given as 'module:attribute'
+# entry points and only imported on first use, so listing methods or reading
+# their capabilities does not import any implementation.
+#
+# Capabilities:
+#   - local: Moving one waypoint only changes the path near that waypoint
+#   - batched: A batch entry point interpolates many waypoint sets at once
+#   - incremental: Appending a waypoint reuses the previous fit
+#   - analytic_derivative: Derivatives are exact, not finite differences
+METHODS = {}
+
+_loaded = {}
+
+_latency = telemetry.histogram('interpolation_latency_seconds',
+                               'Duration of interpolation calls through the registry')
+_errors = telemetry.counter('interpolation_errors_total',
+                            'Interpolation calls that raised an exception')
+
+
+def _instrument(name, kind, func):
+    """Wrap a method function to record its latency and errors."""
+    @functools.wraps(func)
+    def instrumented(*args, **kwargs):
+        if not telemetry.enabled:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            _errors.inc(method=name, kind=kind)
+            raise
+        finally:
+            _latency.observe(time.perf_counter() - start, method=name, kind=kind)
+
+    return instrumented
+
+
+def register_method(name, interpolate, fit=None, batch=None, label=None, local=False,
+                    incremental=False, analytic_derivative=False, test_cases=None):
+    """
+    Register an interpolation method.
+
+    Args:
+        name (str): Method name used throughout the project
+        interpolate (str or callable): Entry point of the waypoints -> path
+            function, e.g. 'interpolation.newton:newton_interpolate'
+        fit (str or callable): Entry point returning a PiecewisePolynomial
+        batch (str or callable): Entry point for batches of waypoint sets
+        label (str): Display name (default: derived from name)
+        local (bool): Local support capability
+        incremental (bool): Incremental update capability
+        analytic_derivative (bool): Analytic derivative capability
+        test_cases (list): Extra analytical test cases for run_method_tests
+    """
+    METHODS[name] = {
+        'label': label or name.replace('_', ' ').title(),
+        'entry_points': {'interpolate': interpolate, 'fit': fit, 'batch': batch},
+        'local': local,
+        'batched': batch is not None,
+        'incremental': incremental,
+        'analytic_derivative': analytic_derivative,
+        'test_cases': list(test_cases or [])
+    }
+    for kind in ('interpolate', 'fit', 'batch'):
+        _loaded.pop((name, kind), None)
+
+
+def get_method(name, kind='interpolate'):
+    """
+    Load the function of a registered method.
+
+    The returned function records its calls in the
+    interpolation_latency_seconds and interpolation_errors_total telemetry
+    metrics, labelled by method and kind.
+
+    Args:
+        name (str): Method name
+        kind (str): 'interpolate', 'fit' or 'batch'
+
+    Returns:
+        callable: The method's function
+
+    Raises:
+        KeyError: If the method is unknown or has no entry point of this kind
+    """
+    key = (name, kind)
+    if key not in _loaded:
+        entry_point = METHODS[name]['entry_points'][kind]
+        if entry_point is None:
+            raise KeyError(f"Method '{name}' has no {kind} function")
+        if isinstance(entry_point, str):
+            module_name, attribute = entry_point.split(':')
+            entry_point = getattr(importlib.import_module(module_name), attribute)
+        _loaded[key] = _instrument(name, kind, entry_point)
+    return _loaded[key]
+
+
+def method_info(name):
+    """Return the label and capabilities of a registered method."""
+    info = METHODS[name]
+    return {key: value for key, value in info.items() if key != 'entry_points'}
+
+
+def available_methods(**capabilities):
+    """
+    Names of the registered methods, in registration order.
+
+    Keyword arguments filter by capability, e.g.
+    available_methods(batched=True) or available_methods(local=True).
+    """
+    return [name for name, info in METHODS.items()
+            if all(info[key] == value for key, value in capabilities.items())]
+
+
+register_method('newton', 'interpolation.newton:newton_interpolate',
+                fit='interpolation.newton:newton_fit',
+                analytic_derivative=True, test_cases=['cubic'])
+register_method('lagrange', 'interpolation.lagrange:lagrange_interpolate',
+                fit='interpolation.lagrange:lagrange_fit',
+                analytic_derivative=True, test_cases=['cubic'])
+register_method('cubic_spline', 'interpolation.cubic_spline:cubic_spline_interpolate',
+                fit='interpolation.cubic_spline:cubic_spline_fit',
+                batch='interpolation.cubic_spline:cubic_spline_interpolate_batch',
+                label='Cubic spline', analytic_derivative=True, test_cases=['sine'])
+register_method('b_spline', 'interpolation.b_spline:b_spline_interpolate',
+                fit='interpolation.b_spline:b_spline_fit',
+                batch='interpolation.b_spline:b_spline_interpolate_batch',
+                label='B-spline', analytic_derivative=True, test_cases=['sine'])
+register_method('chebyshev', 'interpolation.chebyshev:chebyshev_interpolate',
+                fit='interpolation.chebyshev:chebyshev_fit',
+                analytic_derivative=True, test_cases=['sine'])
+register_method('akima', 'interpolation.hermite:akima_interpolate',
+                fit='interpolation.hermite:akima_fit',
+                local=True, analytic_derivative=True, test_cases=['sine'])
+register_method('catmull_rom', 'interpolation.hermite:catmull_rom_interpolate',
+                fit='interpolation.hermite:catmull_rom_fit',
+                label='Catmull-Rom', local=True, analytic_derivative=True, test_cases=['sine'])
+register_method('pchip', 'interpolation.hermite:pchip_interpolate',
+                fit='interpolation.hermite:pchip_fit',
+                label='PCHIP', local=True, analytic_derivative=True, test_cases=['sine'])
@@ -0,0 +1,226 @@
+import numpy as np
+
+from interpolation.path import PiecewisePolynomial
+from interpolation.registry import get_method
+from utils import telemetry
+
+_edge_fits = telemetry.counter('route_edge_fits_total', 'Route graph edges fitted')
+_edge_reuses = telemetry.counter('route_edge_cache_hits_total',
+                                 'Route graph edges served from the cache')
+
+# Sub-intervals of every polynomial piece in an edge's arc-length table
+TABLE_RESOLUTION = 16
+
+
+def quintic_blend(start, end, duration):
+    """
+    Quintic Hermite segments matching position, velocity and acceleration.
+
+    Args:
+        start (numpy.ndarray): Position, velocity and acceleration at s = 0,
+            shape (3, d) or (blends, 3, d)
+        end (numpy.ndarray): The same at s = duration
+        duration (float or numpy.ndarray): Parameter length of each segment
+
+    Returns:
+        numpy.ndarray: Power-basis coefficients of shape (6, d) or
+        (blends, 6, d)
+    """
+    p0, v0, a0 = np.moveaxis(np.asarray(start, dtype=float), -2, 0)
+    p1, v1, a1 = np.moveaxis(np.asarray(end, dtype=float), -2, 0)
+    h = np.asarray(duration, dtype=float)[..., None]
+    c3 = (20 * (p1 - p0) - (8 * v1 + 12 * v0) * h - (3 * a0 - a1) * h**2) / (2 * h**3)
+    c4 = (30 * (p0 - p1) + (14 * v1 + 16 * v0) * h + (3 * a0 - 2 * a1) * h**2) / (2 * h**4)
+    c5 = (12 * (p1 - p0) - 6 * (v1 + v0) * h - (a0 - a1) * h**2) / (2 * h**5)
+    return np.stack((p0, v0, a0 / 2, c3, c4, c5), axis=-2)
+
+
+class RouteGraph:
+    """
+    Corridor graph whose routes are stitched from cached edge curves.
+
+    An edge is a waypoint list between two named nodes. The first time an
+    edge is used it is fitted once with the chosen method, rescaled so its
+    parameter runs at unit average speed, and cached together with its
+    arc-length table and derivatives. A route through a sequence of nodes
+    is then assembled from the cached edges: at every junction a length of
+    blend_length is trimmed from both edges and replaced by a quintic blend
+    that matches position, velocity and acceleration on both sides, so the
+    route is C2 across junctions (where the method itself is C2).
+
+    A query does a fixed amount of work per edge (two table lookups and a
+    trim), builds all blends in one vectorized step and never refits, so
+    its cost grows with the number of edges in the route, not with the
+    number of waypoints.
+    """
+
+    def __init__(self, method='cubic_spline', blend_length=None, num_points=100):
+        """
+        Args:
+            method (str): Registered method with a fit function
+            blend_length (float): Distance from each junction, along both
+                edges, replaced by the blend. Capped at a quarter of either
+                edge's length; 0 joins edges without blending (default: a
+                tenth of the shorter edge)
+            num_points (int): Default number of samples per edge
+        """
+        self.method = method
+        self.blend_length = blend_length
+        self.num_points = num_points
+        self.nodes = {}
+        self.edges = {}
+        self._cache = {}
+
+    def add_edge(self, start, end, waypoints):
+        """
+        Add or replace the edge from node start to node end.
+
+        The first and last waypoints are the node positions. An edge can be
+        traversed in both directions.
+
+        Raises:
+            ValueError: If the edge has fewer than 2 waypoints or does not
+                end at the position of an existing node
+        """
+        waypoints = np.asarray(waypoints, dtype=float)
+        if len(waypoints) < 2:
+            raise ValueError("An edge needs at least 2 waypoints")
+        for node, position in ((start, waypoints[0]), (end, waypoints[-1])):
+            if node in self.nodes and not np.allclose(self.nodes[node], position):
+                raise ValueError(f"Edge {start}->{end} does not meet node {node} "
+                                 f"at {self.nodes[node]}")
+
+        self.nodes.setdefault(start, waypoints[0])
+        self.nodes.setdefault(end, waypoints[-1])
+        self.edges[(start, end)] = waypoints
+        self._cache.pop((start, end), None)
+        self._cache.pop((end, start), None)
+
+    def _fit_edge(self, waypoints):
+        from utils.metrics import arc_length_table
+
+        fit = get_method(self.method, 'fit')(waypoints, self.num_points)
+        start, end = fit.domain
+
+        # Arc-length table on a fixed subdivision of every piece
+        a, b = fit.breakpoints[:-1], fit.breakpoints[1:]
+        steps = np.arange(TABLE_RESOLUTION) / TABLE_RESOLUTION
+        t = np.append((a[:, None] + (b - a)[:, None] * steps).ravel(), end)
+        s = arc_length_table(fit.derivative(), t)
+        length = s[-1]
+        if length <= 0:
+            raise ValueError("Route graph edges must have nonzero length")
+
+        # Rescale the parameter to unit average speed, so blend durations
+        # and trims are in path units on every edge
+        scale = length / (end - start)
+        coeffs = fit.coeffs / scale ** np.arange(fit.order)[None, :, None]
+        path = PiecewisePolynomial((fit.breakpoints - start) * scale, coeffs, self.num_points)
+        return {'path': path, 'parameter': (t - start) * scale, 'arc_length': s,
+                'length': float(length)}
+
+    def _edge(self, start, end):
+        """Cached fit of an edge in the direction of travel."""
+        key = (start, end)
+        if key in self._cache:
+            if telemetry.enabled:
+                _edge_reuses.inc(method=self.method)
+            return self._cache[key]
+
+        if key in self.edges:
+            edge = self._fit_edge(self.edges[key])
+            if telemetry.enabled:
+                _edge_fits.inc(method=self.method)
+        elif (end, start) in self.edges:
+            forward = self._edge(end, start)
+            parameter = forward['parameter']
+            edge = {
+                'path': forward['path'].reversed(),
+                'parameter': parameter[-1] - parameter[::-1],
+                'arc_length': forward['length'] - forward['arc_length'][::-1],
+                'length': forward['length']
+            }
+        else:
+            raise KeyError(f"No edge between {start} and {end}")
+
+        path = edge['path']
+        edge['derivatives'] = (path, path.derivative(), path.derivative(2))
+        self._cache[key] = edge
+        return edge
+
+    def precompute(self):
+        """Fit every edge in both directions ahead of the first query."""
+        for start, end in self.edges:
+            self._edge(start, end)
+            self._edge(end, start)
+        return self
+
+    def route(self, nodes, num_points=None):
+        """
+        Assemble the path along a sequence of nodes from the cached edges.
+
+        Args:
+            nodes (list): Node names; consecutive nodes must share an edge
+            num_points (int): Samples of the path's to_array()
+                (default: num_points per edge)
+
+        Returns:
+            dict: Dictionary with the route:
+                - path: PiecewisePolynomial parameterized at roughly unit
+                  speed, so its domain is close to its length
+                - length: Arc length of the route, to the accuracy of the
+                  edge arc-length tables
+                - num_edges: Number of edges
+                - blend_lengths: Trimmed distance at every junction
+
+        Raises:
+            ValueError: If fewer than 2 nodes are given
+            KeyError: If two consecutive nodes are not connected
+        """
+        if len(nodes) < 2:
+            raise ValueError("A route needs at least 2 nodes")
+        from utils.metrics import curve_length
+
+        edges = [self._edge(a, b) for a, b in zip(nodes[:-1], nodes[1:])]
+
+        lengths = np.array([edge['length'] for edge in edges])
+        shorter = np.minimum(lengths[:-1], lengths[1:])
+        radii = 0.1 * shorter if self.blend_length is None else np.full_like(shorter,
+                                                                             self.blend_length)
+        radii = np.minimum(radii, 0.25 * shorter)
+        trims = np.concatenate(([0.0], radii, [0.0]))
+
+        # Trim every edge and take position, velocity and acceleration at
+        # both of its new ends, shape (edges, 3, 2, d)
+        pieces, states = [], []
+        for i, edge in enumerate(edges):
+            t = np.interp([trims[i], lengths[i] - trims[i + 1]],
+                          edge['arc_length'], edge['parameter'])
+            pieces.append(edge['path'].restrict(t[0], t[1]))
+            states.append([derivative(t) for derivative in edge['derivatives']])
+        states = np.array(states)
+        length = np.sum(lengths - trims[:-1] - trims[1:])
+
+        blending = radii > 0
+        if np.any(blending):
+            durations = 2 * radii[blending]
+            coeffs = quintic_blend(states[:-1, :, 1][blending], states[1:, :, 0][blending],
+                                   durations)
+            blends = PiecewisePolynomial(np.concatenate(([0.0], np.cumsum(durations))), coeffs)
+            length += curve_length(blends.derivative(), blends.breakpoints)
+            blends = iter(PiecewisePolynomial([0.0, h], c[None]) for h, c in zip(durations, coeffs))
+
+        segments = pieces[:1]
+        for joined, piece in zip(blending, pieces[1:]):
+            if joined:
+                segments.append(next(blends))
+            segments.append(piece)
+
+        if num_points is None:
+            num_points = self.num_points * len(edges)
+        return {
+            'path': PiecewisePolynomial.concatenate(segments, num_points),
+            'length': float(length),
+            'num_edges': len(edges),
+            'blend_lengths': radii
+        }
@@ -2,16 +2,11 @@ import os
 import sys
 import time
 import numpy as np
-import matplotlib.pyplot as plt
-from termcolor import colored
 
-# Import interpolation methods
-from interpolation import (
-    newton_interpolate,
-    lagrange_interpolate, 
-    cubic_spline_interpolate,
-    b_spline_interpolate
-)
+# Interpolation methods are loaded on first use through the registry;
+# plotting (matplotlib) and terminal colors (termcolor) are imported inside
+# the functions that need them, so computing paths stays cheap to start.
+from interpolation.registry import METHODS, available_methods, get_method, method_info
 
 # Import utilities
 from utils.waypoints import (
@@ -20,24 +15,105 @@ from utils.waypoints import (
     generate_waypoints_with_density
 )
 from utils.metrics import compare_methods
-from utils.visualization import (
-    plot_interpolation_comparison,
-    plot_curvature_comparison,
-    plot_local_control_effect,
-    plot_density_comparison
-)
-from utils.testing import run_method_tests
+from utils.similarity import deduplicate_paths
+from utils.checkpoint import CheckpointStore, IncrementalReport, content_hash, implementation_hash
+from utils import telemetry
 from simulation.physics import calculate_curvature
 
+# Candidate paths closer than this fraction of the waypoints' bounding box
+# diagonal (discrete Fréchet distance) are collapsed before metrics and plots
+DEDUP_TOLERANCE = 1e-3
+
+# Completed experiment results are checkpointed here, and the report is
+# updated in place, so an interrupted session resumes where it stopped.
+# Both are next to this file, wherever the runner is started from.
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+CHECKPOINT_DIR = os.path.join(PROJECT_DIR, 'checkpoints')
+REPORT_DIR = os.path.join(PROJECT_DIR, 'report_data')
+
+def colored(text, *args, **kwargs):
+    from termcolor import colored as termcolor_colored
+    return termcolor_colored(text, *args, **kwargs)
+
 class ProjectRunner:
-    def __init__(self):
+    def __init__(self, use_cache=True, checkpoint_dir=CHECKPOINT_DIR, report_dir=REPORT_DIR):
+        """
+        Args:
+            use_cache (bool): Load completed results from checkpoints and
+                only rewrite changed report files; without it every result
+                is recomputed and the whole report is rewritten
+            checkpoint_dir (str): Directory of the checkpointed results
+            report_dir (str): Directory of the report data
+        """
         self.results = {}
         self.current_waypoints = None
         self.waypoint_name = None
+        self.use_cache = use_cache
+        self.report_dir = report_dir
+        self.checkpoints = CheckpointStore(checkpoint_dir, enabled=use_cache)
         
     def clear_screen(self):
         os.system('cls' if os.name == 'nt' else 'clear')
         
+    def checkpointed(self, experiment, method, parameter, compute):
+        """
+        Result of one (method, waypoint set, parameter) unit of an experiment.
+        
+        The result is loaded from its checkpoint when the same inputs were
+        completed with the same code before, and otherwise computed and
+        checkpointed at once. method is a method name or a list of them.
+        """
+        key = content_hash(experiment, method, self.current_waypoints, parameter,
+                           self.implementation(method, compute))
+        return self.checkpoints.get_or_compute(key, compute)[0]
+    
+    def implementation(self, methods, *functions):
+        """Hash of the code of the given methods' entry points and of functions."""
+        names = [methods] if isinstance(methods, str) else list(methods)
+        entry_points = [get_method(name, kind) for name in names
+                        for kind, entry_point in METHODS[name]['entry_points'].items()
+                        if entry_point is not None]
+        return implementation_hash(*entry_points, *functions)
+    
+    def report_resumed(self, start_hits, total):
+        resumed = self.checkpoints.hits - start_hits
+        if resumed:
+            print(f"Resumed {resumed} of {total} results from checkpoints.")
+    
+    def _results_key(self, experiment):
+        methods = available_methods()
+        return content_hash('results', experiment, self.current_waypoints, methods,
+                            self.implementation(methods, ProjectRunner.restore_results))
+    
+    def save_results(self, experiment, results):
+        """Keep an experiment's results and checkpoint them for later sessions."""
+        self.results[experiment] = results
+        self.checkpoints.save(self._results_key(experiment), results)
+    
+    def restore_results(self):
+        """Load the checkpointed results of experiments run on the current waypoints."""
+        self.results = {}
+        for experiment in ('accuracy_smoothness', 'local_control', 'density', 'density_sweep'):
+            results = self.checkpoints.load(self._results_key(experiment))
+            if results is not None:
+                self.results[experiment] = results
+        if self.results:
+            print(f"Restored results of {len(self.results)} experiments from checkpoints.")
+        
+    def deduplicate(self, paths, label=str):
+        """Collapse near-duplicate candidate paths and report the skipped work."""
+        waypoints = self.current_waypoints
+        diagonal = np.sqrt(np.sum((waypoints.max(axis=0) - waypoints.min(axis=0))**2))
+        tolerance = DEDUP_TOLERANCE * diagonal
+        dedup = deduplicate_paths(paths, tolerance)
+        
+        for members in dedup['groups'].values():
+            if len(members) > 1:
+                print(f"  Near-identical: {' = '.join(label(key) for key in members)}")
+        print(f"Collapsed {dedup['duplicates']} of {len(paths)} paths within {tolerance:.3g} "
+              f"({dedup['comparisons']} distance checks); their metrics were skipped.")
+        return dedup
+        
     def print_header(self):
         print(colored("\n==== Numerical Methods: Path Smoothing Project ====", "cyan", attrs=["bold"]))
         print(colored("This tool helps you test and analyze your interpolation implementations\n", "cyan"))
@@ -73,11 +149,13 @@ class ProjectRunner:
                 input("Invalid choice. Press Enter to continue...")
     
     def test_implementations(self):
+        from utils.testing import run_method_tests
+        
         self.clear_screen()
         print(colored("Testing your interpolation implementations...", "yellow"))
         print("This will check if your implementations are mathematically correct.\n")
         
-        methods = ['newton', 'lagrange', 'cubic_spline', 'b_spline']
+        methods = available_methods()
         all_passed = True
         
         for method in methods:
@@ -131,6 +209,7 @@ class ProjectRunner:
             self.waypoint_name = 'random'
             num_points = int(input("Enter number of random points [3-10]: "))
             self.current_waypoints = generate_random_waypoints(min(max(num_points, 3), 10))
+            self.restore_results()
             input("\nRandom waypoints generated. Press Enter to continue...")
             return
         elif choice == '7':
@@ -143,6 +222,7 @@ class ProjectRunner:
         self.current_waypoints = get_test_waypoints(self.waypoint_name)
         
         # Visualize selected waypoints
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(8, 6))
         plt.plot(self.current_waypoints[:, 0], self.current_waypoints[:, 1], 'ro-')
         plt.title(f"Selected Waypoints: {self.waypoint_name}")
@@ -150,6 +230,7 @@ class ProjectRunner:
         plt.axis('equal')
         plt.show()
         
+        self.restore_results()
         input("\nWaypoints selected. Press Enter to continue...")
     
     def run_experiments(self):
@@ -162,9 +243,10 @@ class ProjectRunner:
         print("1. Accuracy vs. Smoothness")
         print("2. Local Control Properties")
         print("3. Waypoint Density Analysis")
-        print("4. Return to main menu")
+        print("4. Density Sweep (cost vs. accuracy)")
+        print("5. Return to main menu")
         
-        choice = input("\nEnter your choice [1-4]: ")
+        choice = input("\nEnter your choice [1-5]: ")
         
         if choice == '1':
             self.experiment_accuracy_smoothness()
@@ -173,45 +255,59 @@ class ProjectRunner:
         elif choice == '3':
             self.experiment_density()
         elif choice == '4':
+            self.experiment_density_sweep()
+        elif choice == '5':
             return
         else:
             input("Invalid choice. Press Enter to try again...")
             self.run_experiments()
     
     def experiment_accuracy_smoothness(self):
+        from utils.visualization import plot_interpolation_comparison, plot_curvature_comparison
+        
         self.clear_screen()
         print(colored("Experiment: Accuracy vs. Smoothness", "yellow"))
         print("This experiment shows how each method balances accuracy and smoothness.\n")
         
         # Get paths and curvatures for each method
-        methods = ['newton', 'lagrange', 'cubic_spline', 'b_spline']
+        methods = available_methods()
         paths = {}
         curvatures = {}
+        start_hits = self.checkpoints.hits
         
         for method in methods:
             print(f"Running {method} interpolation...")
-            # Call the appropriate interpolation function
-            if method == 'newton':
-                paths[method] = newton_interpolate(self.current_waypoints)
-            elif method == 'lagrange':
-                paths[method] = lagrange_interpolate(self.current_waypoints)
-            elif method == 'cubic_spline':
-                paths[method] = cubic_spline_interpolate(self.current_waypoints)
-            elif method == 'b_spline':
-                paths[method] = b_spline_interpolate(self.current_waypoints)
+            # Fitted curves, so compare_methods measures their exact length
+            paths[method] = self.checkpointed('accuracy_smoothness', method, None,
+                                              lambda: get_method(method, 'fit')(self.current_waypoints))
+        
+        # Metrics and plots only for one path of each near-identical group
+        print()
+        dedup = self.deduplicate(paths)
         
         # Get comparison metrics
-        from simulation.physics import calculate_curvature
-        for method in methods:
-            path = paths[method]
+        for method, path in dedup['unique'].items():
             curvatures[method] = calculate_curvature(path[:, 0], path[:, 1])
         
         # Plot comparison
-        plot_interpolation_comparison(self.current_waypoints, paths)
-        plot_curvature_comparison(paths, curvatures)
+        labels = {method: ' = '.join(members) for method, members in dedup['groups'].items()}
+        plot_interpolation_comparison(self.current_waypoints,
+                                      {labels[m]: path for m, path in dedup['unique'].items()})
+        plot_curvature_comparison({labels[m]: path for m, path in dedup['unique'].items()},
+                                  {labels[m]: curvature for m, curvature in curvatures.items()})
         
         # Calculate and display metrics
-        comparison = compare_methods(self.current_waypoints, paths)
+        unique_comparison = {
+            method: self.checkpointed('accuracy_metrics', method, None,
+                                      lambda: compare_methods(self.current_waypoints,
+                                                              {method: path})[method])
+            for method, path in dedup['unique'].items()
+        }
+        self.report_resumed(start_hits, len(paths) + len(dedup['unique']))
+        comparison = {method: unique_comparison[representative]
+                      for method, representative in dedup['representative'].items()}
+        curvatures = {method: curvatures[representative]
+                      for method, representative in dedup['representative'].items()}
         
         print("\nComparison Metrics:")
         print("------------------")
@@ -223,11 +319,12 @@ class ProjectRunner:
             print(f"{method:<15} {metrics['path_length']:<12.2f} {metrics['max_deviation']:<10.2f} "
                   f"{metrics['mean_deviation']:<10.2f} {metrics['max_curvature']:<10.4f}")
         
-        self.results['accuracy_smoothness'] = {
+        self.save_results('accuracy_smoothness', {
             'paths': paths,
             'curvatures': curvatures,
-            'metrics': comparison
-        }
+            'metrics': comparison,
+            'groups': dedup['groups']
+        })
         
         print("\nObservations to note:")
         print("1. Which method produces the smoothest path? (lowest max curvature)")
@@ -237,55 +334,70 @@ class ProjectRunner:
         input("\nPress Enter to return to experiments menu...")
     
     def experiment_local_control(self):
+        from utils.influence import influence_analysis, INFLUENCE_BUILDERS
+        from utils.visualization import plot_local_control_effect
+        
         self.clear_screen()
         print(colored("Experiment: Local Control Properties", "yellow"))
         print("This experiment shows how changing one waypoint affects the entire curve.\n")
         
         # Create modified waypoints with one point moved
-        modified_waypoints = self.current_waypoints.copy()
+        modified_waypoints = self.current_waypoints.astype(float)
         mid_idx = len(modified_waypoints) // 2
-        modified_waypoints[mid_idx, 1] += 50  # Move middle point up
+        shift = np.zeros(modified_waypoints.shape[1])
+        shift[1] = 50  # Move middle point up
+        modified_waypoints[mid_idx] += shift
+        
+        methods = available_methods()
+        start_hits = self.checkpoints.hits
+        
+        # Influence of every waypoint at once from each method's influence matrix
+        print("Building influence matrices...")
+        influence = {
+            method: self.checkpointed('influence', method, None,
+                                      lambda: influence_analysis(self.current_waypoints,
+                                                                 [method])[method])
+            for method in methods if method in INFLUENCE_BUILDERS
+        }
         
-        methods = ['newton', 'lagrange', 'cubic_spline', 'b_spline']
+        # Linear methods: path = S @ waypoints, and moving the waypoint moves
+        # the path by S[:, mid_idx] * shift. Akima and PCHIP tangents are
+        # nonlinear in the waypoints, so they are fitted to both sets.
         original_paths = {}
         modified_paths = {}
-        
+        changes = {}
         for method in methods:
-            print(f"Running {method} interpolation...")
-            # Original path
-            if method == 'newton':
-                original_paths[method] = newton_interpolate(self.current_waypoints)
-                modified_paths[method] = newton_interpolate(modified_waypoints)
-            elif method == 'lagrange':
-                original_paths[method] = lagrange_interpolate(self.current_waypoints)
-                modified_paths[method] = lagrange_interpolate(modified_waypoints)
-            elif method == 'cubic_spline':
-                original_paths[method] = cubic_spline_interpolate(self.current_waypoints)
-                modified_paths[method] = cubic_spline_interpolate(modified_waypoints)
-            elif method == 'b_spline':
-                original_paths[method] = b_spline_interpolate(self.current_waypoints)
-                modified_paths[method] = b_spline_interpolate(modified_waypoints)
+            if method in influence:
+                column = influence[method]['matrix'][:, mid_idx]
+                original_paths[method] = influence[method]['matrix'] @ self.current_waypoints
+                modified_paths[method] = original_paths[method] + np.outer(column, shift)
+                changes[method] = np.abs(column) * np.linalg.norm(shift)
+            else:
+                print(f"Running {method} interpolation...")
+                fit = get_method(method, 'fit')
+                original_paths[method], modified_paths[method] = self.checkpointed(
+                    'local_control', method, modified_waypoints,
+                    lambda: (fit(self.current_waypoints).to_array(),
+                             fit(modified_waypoints).to_array()))
+                changes[method] = np.linalg.norm(modified_paths[method] - original_paths[method],
+                                                 axis=1)
+        self.report_resumed(start_hits, len(methods))
         
         # Plot results
         plot_local_control_effect(methods, self.current_waypoints, modified_waypoints, 
                                   original_paths, modified_paths)
         
         # Calculate and display metrics
-        print("\nCalculating change metrics...")
         change_metrics = {}
         
         for method in methods:
-            orig = original_paths[method]
-            mod = modified_paths[method]
-            
-            # Calculate average change in path positions
-            changes = np.linalg.norm(orig - mod, axis=1)
-            avg_change = np.mean(changes)
-            max_change = np.max(changes)
+            avg_change = np.mean(changes[method])
+            max_change = np.max(changes[method])
             
             # Calculate percentage of path that changed significantly
             significant_threshold = 5.0  # Consider changes > 5 units as significant
-            significant_percent = np.sum(changes > significant_threshold) / len(changes) * 100
+            significant_percent = (np.sum(changes[method] > significant_threshold)
+                                   / len(changes[method]) * 100)
             
             change_metrics[method] = {
                 'avg_change': avg_change,
@@ -304,11 +416,21 @@ class ProjectRunner:
             print(f"{method:<15} {metrics['avg_change']:<12.2f} {metrics['max_change']:<12.2f} "
                   f"{metrics['significant_percent']:<15.2f}")
         
-        self.results['local_control'] = {
+        print("\nInfluence Footprint (all waypoints, influence > 1%):")
+        print("-----------------------------------------------")
+        print(f"{'Method':<15} {'Width %':<12} {'Moved Pt %':<12}")
+        print("-" * 39)
+        
+        for method, analysis in influence.items():
+            moved_width = analysis['footprint']['width'][mid_idx]
+            print(f"{method:<15} {analysis['mean_width'] * 100:<12.1f} {moved_width * 100:<12.1f}")
+        
+        self.save_results('local_control', {
             'original_paths': original_paths,
             'modified_paths': modified_paths,
-            'metrics': change_metrics
-        }
+            'metrics': change_metrics,
+            'influence': {method: analysis['footprint'] for method, analysis in influence.items()}
+        })
         
         print("\nObservations to note:")
         print("1. Which methods show more local control? (changes confined to area near modified point)")
@@ -319,6 +441,8 @@ class ProjectRunner:
 
 
     def experiment_density(self):
+        from utils.visualization import plot_density_comparison
+        
         self.clear_screen()
         print(colored("Experiment: Waypoint Density Analysis", "yellow"))
         print("This experiment shows how each method performs with different waypoint densities.\n")
@@ -339,31 +463,34 @@ class ProjectRunner:
                   f"({len(waypoints_sets[factor])} points)")
         
         # Run interpolation for each method and density
-        methods = ['newton', 'lagrange', 'cubic_spline', 'b_spline']
+        methods = available_methods()
         density_results = {}
+        start_hits = self.checkpoints.hits
         
         for method in methods:
             density_results[method] = {}
             print(f"\nRunning {method} interpolation for different densities...")
+            fit = get_method(method, 'fit')
             
             for factor in density_factors:
-                waypoints = waypoints_sets[factor]
-                
-                # Call the appropriate interpolation function
-                if method == 'newton':
-                    path = newton_interpolate(waypoints)
-                elif method == 'lagrange':
-                    path = lagrange_interpolate(waypoints)
-                elif method == 'cubic_spline':
-                    path = cubic_spline_interpolate(waypoints)
-                elif method == 'b_spline':
-                    path = b_spline_interpolate(waypoints)
-                
-                density_results[method][factor] = path
+                density_results[method][factor] = self.checkpointed(
+                    'density', method, waypoints_sets[factor],
+                    lambda: fit(waypoints_sets[factor]))
+        self.report_resumed(start_hits, len(methods) * len(density_factors))
         
         # Plot results
         plot_density_comparison(methods, waypoints_sets, density_results)
         
+        # Measure only one path of each near-identical group
+        print()
+        candidates = {(method, factor): density_results[method][factor]
+                      for method in methods for factor in density_factors}
+        dedup = self.deduplicate(candidates, label=lambda key: f"{key[0]} ({key[1]}x)")
+        # Exact arc length of the fitted curves, not the length of their samples
+        unique_lengths = {key: path.length() for key, path in dedup['unique'].items()}
+        density_lengths = {key: unique_lengths[representative]
+                           for key, representative in dedup['representative'].items()}
+        
         # Calculate and display metrics
         print("\nWaypoint Density Analysis:")
         print("------------------------")
@@ -372,14 +499,14 @@ class ProjectRunner:
         print("-" * 63)
         
         for method in methods:
-            lengths = [np.sum(np.sqrt(np.sum(np.diff(density_results[method][f], axis=0)**2, axis=1))) 
-                      for f in density_factors]
+            lengths = [density_lengths[(method, f)] for f in density_factors]
             print(f"{method:<15} {lengths[0]:<15.2f} {lengths[1]:<15.2f} {lengths[2]:<15.2f}")
         
-        self.results['density'] = {
+        self.save_results('density', {
             'waypoints_sets': waypoints_sets,
-            'paths': density_results
-        }
+            'paths': density_results,
+            'lengths': density_lengths
+        })
         
         print("\nObservations to note:")
         print("1. Which methods are most sensitive to changes in waypoint density?")
@@ -388,6 +515,47 @@ class ProjectRunner:
         
         input("\nPress Enter to return to experiments menu...")
     
+    def experiment_density_sweep(self):
+        from utils.sweep import density_sweep
+        from utils.visualization import plot_density_sweep
+        
+        self.clear_screen()
+        print(colored("Experiment: Density Sweep", "yellow"))
+        print("This experiment finds the cheapest waypoint density that meets a deviation budget.\n")
+        
+        budget = input("Enter maximum deviation budget [5.0]: ")
+        max_deviation = float(budget) if budget.strip() else 5.0
+        
+        density_factors = list(np.round(np.geomspace(0.5, 4.0, 16), 3))
+        methods = available_methods()
+        
+        print(f"\nSweeping {len(density_factors)} density factors...")
+        start_hits = self.checkpoints.hits
+        # One sweep for all methods, so the densities are resampled only once
+        sweep = self.checkpointed('density_sweep', methods, (density_factors, max_deviation),
+                                  lambda: density_sweep(self.current_waypoints, density_factors,
+                                                        methods, max_deviation=max_deviation))
+        self.report_resumed(start_hits, 1)
+        
+        plot_density_sweep(sweep)
+        
+        print("\nSparsest density meeting the budget:")
+        print(f"{'Method':<15} {'Factor':<10} {'Waypoints':<10} {'Time (ms)':<10} {'Max Dev':<10}")
+        print("-" * 55)
+        
+        for method in methods:
+            factor = sweep['cheapest'][method]
+            if factor is None:
+                print(f"{method:<15} {'none':<10}")
+                continue
+            record = next(r for r in sweep['curve'][method] if r['factor'] == factor)
+            print(f"{method:<15} {factor:<10.3f} {record['num_waypoints']:<10} "
+                  f"{record['time'] * 1000:<10.3f} {record['max_deviation']:<10.2f}")
+        
+        self.save_results('density_sweep', sweep)
+        
+        input("\nPress Enter to return to experiments menu...")
+    
     def visualize_method(self):
         if self.current_waypoints is None:
             input("Please select waypoints first. Press Enter to continue...")
@@ -395,48 +563,48 @@ class ProjectRunner:
             
         self.clear_screen()
         print(colored("Visualize Individual Method:", "yellow"))
-        print("1. Newton interpolation")
-        print("2. Lagrange interpolation")
-        print("3. Cubic spline interpolation")
-        print("4. B-spline interpolation")
-        print("5. Return to main menu")
         
-        choice = input("\nEnter your choice [1-5]: ")
+        method_names = available_methods() + ['auto']
+        for i, method in enumerate(method_names[:-1], 1):
+            print(f"{i}. {method_info(method)['label']} interpolation")
+        print(f"{len(method_names)}. Automatic method selection")
+        print(f"{len(method_names) + 1}. Return to main menu")
         
-        if choice == '5':
+        choice = input(f"\nEnter your choice [1-{len(method_names) + 1}]: ")
+        
+        if choice == str(len(method_names) + 1):
             return
             
-        if choice not in ['1', '2', '3', '4']:
+        if choice not in [str(i) for i in range(1, len(method_names) + 1)]:
             input("Invalid choice. Press Enter to try again...")
             self.visualize_method()
             return
         
-        method_idx = int(choice) - 1
-        method_names = ['newton', 'lagrange', 'cubic_spline', 'b_spline']
-        method = method_names[method_idx]
+        method = method_names[int(choice) - 1]
         
         self.clear_screen()
         print(f"Visualizing {method} interpolation for {self.waypoint_name} waypoints...")
         
         # Run interpolation
-        if method == 'newton':
-            path = newton_interpolate(self.current_waypoints)
-        elif method == 'lagrange':
-            path = lagrange_interpolate(self.current_waypoints)
-        elif method == 'cubic_spline':
-            path = cubic_spline_interpolate(self.current_waypoints)
-        elif method == 'b_spline':
-            path = b_spline_interpolate(self.current_waypoints)
+        if method == 'auto':
+            from interpolation.auto import auto_interpolate
+            path, selection = auto_interpolate(self.current_waypoints, return_choice=True)
+            print(f"Cost model selected {selection['method']} interpolation")
+        else:
+            path = get_method(method, 'fit')(self.current_waypoints)
             
         # Calculate curvature
         curvature = calculate_curvature(path[:, 0], path[:, 1])
         
         # Plot results
+        import matplotlib.pyplot as plt
+        from utils.visualization import plot_path
+        
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
         
         # Path plot
         ax1.plot(self.current_waypoints[:, 0], self.current_waypoints[:, 1], 'ro-', label='Waypoints')
-        ax1.plot(path[:, 0], path[:, 1], 'b-', label=f'{method} interpolation')
+        plot_path(ax1, path, 'b-', label=f'{method} interpolation')
         ax1.set_title(f'{method} interpolation path')
         ax1.grid(True)
         ax1.legend()
@@ -466,66 +634,112 @@ class ProjectRunner:
         print(colored("Generating Report Data", "yellow"))
         print("This will create a CSV file with metrics and save plots for your report.\n")
         
-        # Create output directory
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_dir = f"report_data_{timestamp}"
-        os.makedirs(output_dir, exist_ok=True)
+        # Update the report in place; files whose inputs are unchanged are kept
+        from utils.visualization import plot_interpolation_comparison, plot_curvature_comparison
+        
+        output_dir = self.report_dir
+        report = IncrementalReport(output_dir, rewrite=not self.use_cache)
         
         # Save experiment results
         if 'accuracy_smoothness' in self.results:
             print("Saving accuracy vs. smoothness results...")
             metrics = self.results['accuracy_smoothness']['metrics']
             
-            with open(f"{output_dir}/accuracy_smoothness.csv", 'w') as f:
-                f.write("Method,PathLength,MaxDeviation,MeanDeviation,MaxCurvature\n")
-                for method, m in metrics.items():
-                    f.write(f"{method},{m['path_length']:.4f},{m['max_deviation']:.4f},"
-                           f"{m['mean_deviation']:.4f},{m['max_curvature']:.4f}\n")
+            report.write_csv("accuracy_smoothness.csv",
+                             "Method,PathLength,MaxDeviation,MeanDeviation,MaxCurvature",
+                             [(method, m, lambda method=method, m=m:
+                               f"{method},{m['path_length']:.4f},{m['max_deviation']:.4f},"
+                               f"{m['mean_deviation']:.4f},{m['max_curvature']:.4f}")
+                              for method, m in metrics.items()])
             
-            # Save plot
-            fig = plot_interpolation_comparison(self.current_waypoints, 
-                                              self.results['accuracy_smoothness']['paths'])
-            fig.savefig(f"{output_dir}/accuracy_smoothness_paths.png", dpi=300)
-            plt.close(fig)
+            # Save plots, one line per group of near-identical paths
+            results = self.results['accuracy_smoothness']
+            groups = results['groups']
+            paths = {' = '.join(members): results['paths'][m] for m, members in groups.items()}
+            curvatures = {' = '.join(members): results['curvatures'][m]
+                          for m, members in groups.items()}
             
-            fig = plot_curvature_comparison(self.results['accuracy_smoothness']['paths'], 
-                                          self.results['accuracy_smoothness']['curvatures'])
-            fig.savefig(f"{output_dir}/accuracy_smoothness_curvatures.png", dpi=300)
-            plt.close(fig)
+            report.write_figure("accuracy_smoothness_paths.png", (self.current_waypoints, paths),
+                                lambda: plot_interpolation_comparison(self.current_waypoints, paths))
+            report.write_figure("accuracy_smoothness_curvatures.png", (paths, curvatures),
+                                lambda: plot_curvature_comparison(paths, curvatures))
         
         if 'local_control' in self.results:
             print("Saving local control results...")
             metrics = self.results['local_control']['metrics']
             
-            with open(f"{output_dir}/local_control.csv", 'w') as f:
-                f.write("Method,AvgChange,MaxChange,SignificantPercent\n")
-                for method, m in metrics.items():
-                    f.write(f"{method},{m['avg_change']:.4f},{m['max_change']:.4f},"
-                           f"{m['significant_percent']:.4f}\n")
+            report.write_csv("local_control.csv", "Method,AvgChange,MaxChange,SignificantPercent",
+                             [(method, m, lambda method=method, m=m:
+                               f"{method},{m['avg_change']:.4f},{m['max_change']:.4f},"
+                               f"{m['significant_percent']:.4f}")
+                              for method, m in metrics.items()])
+            
+            rows = []
+            for method, footprint in self.results['local_control']['influence'].items():
+                for i in range(len(footprint['width'])):
+                    values = {name: values[i] for name, values in footprint.items()}
+                    rows.append((f"{method},{i}", values, lambda method=method, i=i, f=values:
+                                 f"{method},{i},{f['start']},{f['end']},{f['width']:.4f},"
+                                 f"{f['significant_fraction']:.4f},{f['max_influence']:.4f}"))
+            report.write_csv("local_control_influence.csv",
+                             "Method,Waypoint,Start,End,Width,SignificantFraction,MaxInfluence", rows)
         
         if 'density' in self.results:
             print("Saving density analysis results...")
             
-            # Calculate path lengths
-            methods = ['newton', 'lagrange', 'cubic_spline', 'b_spline']
+            # Path lengths were measured by the experiment
+            methods = list(self.results['density']['paths'])
             density_factors = [0.5, 1.0, 2.0]
             
-            with open(f"{output_dir}/density_analysis.csv", 'w') as f:
-                f.write("Method,Density0.5,Density1.0,Density2.0\n")
-                
-                for method in methods:
-                    lengths = [np.sum(np.sqrt(np.sum(np.diff(self.results['density']['paths'][method][f], 
-                                                           axis=0)**2, axis=1))) 
-                              for f in density_factors]
-                    f.write(f"{method},{lengths[0]:.4f},{lengths[1]:.4f},{lengths[2]:.4f}\n")
+            rows = []
+            for method in methods:
+                lengths = [self.results['density']['lengths'][(method, f)] for f in density_factors]
+                rows.append((method, lengths, lambda method=method, lengths=lengths:
+                             f"{method},{lengths[0]:.4f},{lengths[1]:.4f},{lengths[2]:.4f}"))
+            report.write_csv("density_analysis.csv", "Method,Density0.5,Density1.0,Density2.0", rows)
         
+        # Latency, path quality and cache metrics collected in this session
+        telemetry.write_prometheus(os.path.join(output_dir, "telemetry.prom"))
+        
+        print(f"\nUpdated {len(report.written)} files, {len(report.unchanged)} unchanged.")
         print(f"\nReport data saved to {output_dir}/")
         print("You can use these files in your project report.")
         
         input("\nPress Enter to return to main menu...")
 
 
+def compute_path(argv):
+    """Non-interactive mode: interpolate a waypoint set and print the path as CSV."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Interpolate a waypoint set")
+    parser.add_argument('--method', default='cubic_spline', choices=available_methods())
+    parser.add_argument('--waypoints', default='complex', help="Test waypoint set name")
+    parser.add_argument('--num-points', type=int, default=100)
+    parser.add_argument('--telemetry', help="Write telemetry in Prometheus text format to this file")
+    parser.add_argument('--telemetry-interval', type=float, default=10.0,
+                        help="Seconds between telemetry exports (default: 10)")
+    args = parser.parse_args(argv)
+    
+    exporter = None
+    if args.telemetry:
+        # Exports while running and once more on stop
+        exporter = telemetry.PeriodicExporter(args.telemetry, args.telemetry_interval).start()
+    try:
+        fit = get_method(args.method, 'fit')(get_test_waypoints(args.waypoints),
+                                             num_points=args.num_points)
+        for point in fit.to_array():
+            print(','.join(f"{value:.6f}" for value in point))
+    finally:
+        if exporter is not None:
+            exporter.stop()
+
+
 if __name__ == '__main__':
-    app = ProjectRunner()
-    app.main_menu()
\ No newline at end of file
+    # --no-cache recomputes every result and rewrites the whole report
+    argv = [arg for arg in sys.argv[1:] if arg != '--no-cache']
+    if argv:
+        compute_path(argv)
+    else:
+        app = ProjectRunner(use_cache='--no-cache' not in sys.argv[1:])
+        app.main_menu()
\ No newline at end of file
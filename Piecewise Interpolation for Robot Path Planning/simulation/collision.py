@@ -0,0 +1,410 @@
+
+import json
+import numpy as np
+
+class ObstacleMap:
+    """
+    Obstacle set with an occupancy bitmap for fast path collision checks.
+
+    Obstacles are circles, polygons and occupied cells of occupancy grids.
+    build() rasterizes them conservatively into a uniform bitmap, where a
+    cell is marked when it may contain an obstacle, and computes the
+    distance transform of the bitmap. The distance transform gives a cheap
+    lower bound on the distance to the nearest obstacle anywhere in the
+    grid; the exact signed distance is only evaluated where that bound is
+    too small to decide a query.
+    """
+
+    def __init__(self, cell_size=5.0):
+        self.cell_size = float(cell_size)
+        self.circles = np.empty((0, 3))
+        self.polygons = []
+        self.boxes = np.empty((0, 4))
+        self.bitmap = None
+        self.distance_field = None
+        self.origin = None
+        self.extent = None
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create an obstacle map from a dictionary.
+
+        Args:
+            data (dict): Dictionary with optional keys:
+                - cell_size: Bitmap cell size
+                - circles: List of [x, y, radius]
+                - polygons: List of vertex lists [[x, y], ...]
+                - grid: {'occupancy': 2-D list, 'origin': [x, y],
+                  'resolution': float}; row index is y, column index is x
+
+        Returns:
+            ObstacleMap: Built obstacle map
+        """
+        obstacle_map = cls(data.get('cell_size', 5.0))
+        for x, y, radius in data.get('circles', []):
+            obstacle_map.add_circle((x, y), radius)
+        for vertices in data.get('polygons', []):
+            obstacle_map.add_polygon(vertices)
+        if 'grid' in data:
+            grid = data['grid']
+            obstacle_map.add_occupancy_grid(grid['occupancy'], grid.get('origin', (0, 0)),
+                                            grid.get('resolution', 1.0))
+        return obstacle_map.build()
+
+    @classmethod
+    def load(cls, filename):
+        """Load an obstacle map from a JSON file in the from_dict format."""
+        with open(filename) as f:
+            return cls.from_dict(json.load(f))
+
+    def add_circle(self, center, radius):
+        self.circles = np.vstack((self.circles, [center[0], center[1], radius]))
+        self.bitmap = None
+
+    def add_polygon(self, vertices):
+        vertices = np.asarray(vertices, dtype=float)
+        if len(vertices) < 3:
+            raise ValueError("A polygon needs at least 3 vertices")
+        self.polygons.append(vertices)
+        self.bitmap = None
+
+    def add_occupancy_grid(self, occupancy, origin=(0, 0), resolution=1.0):
+        rows, cols = np.nonzero(np.asarray(occupancy))
+        x0 = origin[0] + cols * resolution
+        y0 = origin[1] + rows * resolution
+        boxes = np.column_stack((x0, y0, x0 + resolution, y0 + resolution))
+        self.boxes = np.vstack((self.boxes, boxes))
+        self.bitmap = None
+
+    def bounds(self):
+        """Bounding box (xmin, ymin, xmax, ymax) of all obstacles."""
+        lows, highs = [], []
+        if len(self.circles):
+            lows.append(self.circles[:, :2] - self.circles[:, 2:])
+            highs.append(self.circles[:, :2] + self.circles[:, 2:])
+        for vertices in self.polygons:
+            lows.append(vertices)
+            highs.append(vertices)
+        if len(self.boxes):
+            lows.append(self.boxes[:, :2])
+            highs.append(self.boxes[:, 2:])
+        if not lows:
+            return None
+        low = np.min(np.vstack(lows), axis=0)
+        high = np.max(np.vstack(highs), axis=0)
+        return low[0], low[1], high[0], high[1]
+
+    def signed_distance(self, points, chunk_size=4096):
+        """
+        Signed distance from each point to the nearest obstacle.
+
+        Negative inside an obstacle. Evaluated in chunks of points against
+        all obstacles at once.
+
+        Args:
+            points (numpy.ndarray): Points of shape (n, 2)
+            chunk_size (int): Number of points per vectorized chunk
+
+        Returns:
+            numpy.ndarray: Signed distances, np.inf when there are no obstacles
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        result = np.full(len(points), np.inf)
+
+        for start in range(0, len(points), chunk_size):
+            p = points[start:start + chunk_size]
+            best = np.full(len(p), np.inf)
+
+            if len(self.circles):
+                d = np.sqrt(np.sum((p[:, None, :] - self.circles[None, :, :2])**2, axis=2))
+                best = np.minimum(best, np.min(d - self.circles[None, :, 2], axis=1))
+
+            if len(self.boxes):
+                low = self.boxes[None, :, :2] - p[:, None, :]
+                high = p[:, None, :] - self.boxes[None, :, 2:]
+                gap = np.maximum(np.maximum(low, high), 0.0)
+                outside = np.sqrt(np.sum(gap**2, axis=2))
+                inside = np.minimum(np.max(np.maximum(low, high), axis=2), 0.0)
+                best = np.minimum(best, np.min(outside + inside, axis=1))
+
+            for vertices in self.polygons:
+                best = np.minimum(best, _polygon_signed_distance(p, vertices))
+
+            result[start:start + chunk_size] = best
+
+        return result
+
+    def build(self):
+        """
+        Rasterize the obstacles into the occupancy bitmap.
+
+        Occupancy grid cells are marked by the range of bitmap cells they
+        overlap, all at once; circles and polygons by the exact signed
+        distance at the cell centres inside their bounding box. The cost
+        grows with the number of cells, not with cells times obstacles.
+        """
+        bounds = self.bounds()
+        if bounds is None:
+            self.bitmap = np.zeros((0, 0), dtype=bool)
+            self.distance_field = np.zeros((0, 0))
+            self.origin = np.zeros(2)
+            self.extent = None
+            return self
+
+        xmin, ymin, xmax, ymax = bounds
+        self.extent = np.array(bounds, dtype=float)
+        self.origin = np.array([xmin, ymin]) - self.cell_size
+        nx = int(np.ceil((xmax - self.origin[0]) / self.cell_size)) + 2
+        ny = int(np.ceil((ymax - self.origin[1]) / self.cell_size)) + 2
+        shape = np.array([nx, ny])
+
+        # Boxes: +1/-1 at the corners of each covered cell range, summed up
+        corners = np.zeros((nx + 1, ny + 1), dtype=int)
+        if len(self.boxes):
+            low = np.clip(np.floor((self.boxes[:, :2] - self.origin) / self.cell_size).astype(int),
+                          0, shape - 1)
+            high = np.clip(np.floor((self.boxes[:, 2:] - self.origin) / self.cell_size).astype(int),
+                           0, shape - 1) + 1
+            np.add.at(corners, (low[:, 0], low[:, 1]), 1)
+            np.add.at(corners, (high[:, 0], low[:, 1]), -1)
+            np.add.at(corners, (low[:, 0], high[:, 1]), -1)
+            np.add.at(corners, (high[:, 0], high[:, 1]), 1)
+        bitmap = np.cumsum(np.cumsum(corners, axis=0), axis=1)[:nx, :ny] > 0
+
+        # Circles and polygons: a cell is marked when the obstacle comes
+        # within half a cell diagonal of its centre
+        half_diagonal = self.cell_size * np.sqrt(0.5)
+        shapes = [(circle[:2] - circle[2], circle[:2] + circle[2],
+                   lambda p, c=circle: np.sqrt(np.sum((p - c[:2])**2, axis=1)) - c[2])
+                  for circle in self.circles]
+        shapes += [(vertices.min(axis=0), vertices.max(axis=0),
+                    lambda p, v=vertices: _polygon_signed_distance(p, v))
+                   for vertices in self.polygons]
+        for low, high, distance in shapes:
+            low = np.clip(np.floor((low - self.origin) / self.cell_size).astype(int), 0, shape - 1)
+            high = np.clip(np.floor((high - self.origin) / self.cell_size).astype(int),
+                           0, shape - 1) + 1
+            ix, iy = np.meshgrid(np.arange(low[0], high[0]), np.arange(low[1], high[1]),
+                                 indexing='ij')
+            centers = self.origin + (np.column_stack((ix.ravel(), iy.ravel())) + 0.5) * self.cell_size
+            near = distance(centers) <= half_diagonal
+            bitmap[ix.ravel()[near], iy.ravel()[near]] = True
+
+        self.bitmap = bitmap
+        self.distance_field = _distance_transform(bitmap) * self.cell_size
+        return self
+
+    def occupied(self, points):
+        """Broad-phase bitmap lookup: True where a point lies in a marked cell."""
+        if self.bitmap is None:
+            self.build()
+        cells = np.floor((points - self.origin) / self.cell_size).astype(int)
+        nx, ny = self.bitmap.shape
+        inside = ((cells[:, 0] >= 0) & (cells[:, 0] < nx) &
+                  (cells[:, 1] >= 0) & (cells[:, 1] < ny))
+        hits = np.zeros(len(points), dtype=bool)
+        hits[inside] = self.bitmap[cells[inside, 0], cells[inside, 1]]
+        return hits
+
+    def distance_bound(self, points):
+        """
+        Lower bound on the distance from each point to the obstacles.
+
+        The bound is never above the signed distance where that is positive
+        and never above 0 inside an obstacle.
+
+        Inside the grid it is the distance transform of the point's cell
+        less one cell diagonal (the point and the obstacle can each be
+        anywhere in their cell); everywhere it is at least the distance to
+        the bounding box of all obstacles.
+
+        Args:
+            points (numpy.ndarray): Points of shape (n, 2)
+
+        Returns:
+            numpy.ndarray: Lower bounds, np.inf when there are no obstacles
+        """
+        if self.bitmap is None:
+            self.build()
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        if self.extent is None:
+            return np.full(len(points), np.inf)
+
+        gap = np.maximum(np.maximum(self.extent[:2] - points, points - self.extent[2:]), 0.0)
+        bound = np.sqrt(np.sum(gap**2, axis=1))
+
+        cells = np.floor((points - self.origin) / self.cell_size).astype(int)
+        nx, ny = self.bitmap.shape
+        inside = ((cells[:, 0] >= 0) & (cells[:, 0] < nx) &
+                  (cells[:, 1] >= 0) & (cells[:, 1] < ny))
+        field = self.distance_field[cells[inside, 0], cells[inside, 1]]
+        bound[inside] = np.maximum(bound[inside], field - self.cell_size * np.sqrt(2.0))
+        return bound
+
+    def _clearance(self, points, needed):
+        """Distance bound, replaced by the exact signed distance where it is at most needed."""
+        distance = self.distance_bound(points)
+        refine = distance <= needed
+        if np.any(refine):
+            distance[refine] = self.signed_distance(points[refine])
+        return distance
+
+    def _first_hit(self, start, end, tolerance):
+        """
+        First colliding point of a batch of segments, by conservative bisection.
+
+        An interval of a segment is clear when the distance at both of its
+        ends exceeds half its length, since no point of the interval is
+        farther than that from one of its ends. Otherwise it is bisected,
+        until an end lies inside an obstacle or the interval is shorter
+        than tolerance (a graze within tolerance counts as a hit). Intervals
+        past the earliest hit found so far are dropped.
+
+        Returns:
+            float: segment index + parameter of the first hit, or np.inf
+        """
+        lengths = np.sqrt(np.sum((end - start)**2, axis=1))
+        segment = np.arange(len(start))
+        u0 = np.zeros(len(start))
+        u1 = np.ones(len(start))
+        first = np.inf
+
+        while len(segment):
+            direction = end[segment] - start[segment]
+            points = np.vstack((start[segment] + u0[:, None] * direction,
+                                start[segment] + u1[:, None] * direction))
+            half = 0.5 * (u1 - u0) * lengths[segment]
+            d0, d1 = np.split(self._clearance(points, np.tile(half, 2)), 2)
+
+            entered = d0 <= 0
+            clear = (d0 > half) & (d1 > half)
+            grazed = ~entered & ~clear & (2 * half <= tolerance)
+            hits = segment[entered | grazed] + u0[entered | grazed]
+            if len(hits):
+                first = min(first, float(np.min(hits)))
+
+            split = ~entered & ~clear & ~grazed & (segment + u0 < first)
+            middle = 0.5 * (u0[split] + u1[split])
+            segment = np.concatenate((segment[split], segment[split]))
+            u0, u1 = (np.concatenate((u0[split], middle)),
+                      np.concatenate((middle, u1[split])))
+
+        return first
+
+    def check_path(self, path, early_exit=True, clearance=True, chunk_segments=256,
+                   tolerance=None):
+        """
+        Check a path for collisions along its swept segments.
+
+        The check is conservative: a segment is only accepted when the
+        distance at its ends proves it clear, otherwise it is bisected (see
+        _first_hit), so thin obstacles between two path points are never
+        skipped. Segments are processed in chunks and the check stops at the
+        first chunk that contains a collision, so rejected paths cost little.
+
+        Args:
+            path (numpy.ndarray): Path points of shape (n, 2)
+            early_exit (bool): Skip the clearance statistics once a
+                collision is found
+            clearance (bool): Compute clearance statistics at the path points
+            chunk_segments (int): Segments processed per vectorized chunk
+            tolerance (float): Length below which an interval that cannot be
+                proven clear counts as a collision (default: 1e-6 cell sizes)
+
+        Returns:
+            dict: Dictionary with collision results:
+                - collision: Whether any swept segment hits an obstacle
+                - first_collision: Normalized arc-length parameter in [0, 1]
+                  of the first collision, or None
+                - first_collision_segment: Index of the first colliding
+                  segment, or None
+                - min_clearance: Minimum signed distance of the path points
+                  to obstacles (None when not computed)
+                - mean_clearance: Mean distance of the path points to
+                  obstacles (None when not computed)
+        """
+        if self.bitmap is None:
+            self.build()
+        if tolerance is None:
+            tolerance = 1e-6 * self.cell_size
+
+        path = np.asarray(path, dtype=float)
+        seg_lengths = np.sqrt(np.sum(np.diff(path, axis=0)**2, axis=1))
+        cumulative = np.concatenate(([0.0], np.cumsum(seg_lengths)))
+        total = cumulative[-1] if cumulative[-1] > 0 else 1.0
+
+        first_collision = None
+        first_segment = None
+
+        for start in range(0, len(seg_lengths), chunk_segments):
+            stop = min(start + chunk_segments, len(seg_lengths))
+            hit = self._first_hit(path[start:stop], path[start + 1:stop + 1], tolerance)
+            if not np.isfinite(hit):
+                continue
+
+            offset = min(int(hit), stop - start - 1)
+            first_segment = start + offset
+            arc = cumulative[first_segment] + (hit - offset) * seg_lengths[first_segment]
+            first_collision = float(arc / total)
+            break
+
+        collision = first_segment is not None
+        min_clearance = mean_clearance = None
+        if clearance and not (collision and early_exit):
+            distances = self.signed_distance(path)
+            min_clearance = float(np.min(distances))
+            mean_clearance = float(np.mean(np.maximum(distances, 0.0)))
+
+        return {
+            'collision': collision,
+            'first_collision': first_collision,
+            'first_collision_segment': first_segment,
+            'min_clearance': min_clearance,
+            'mean_clearance': mean_clearance
+        }
+
+def _distance_transform(marked):
+    """
+    Exact Euclidean distance, in cells, from every cell to the nearest marked one.
+
+    Separable: the distance along the first axis is found with running
+    maxima/minima of the marked indices, then combined along the second
+    axis over growing offsets k, stopping once k**2 exceeds every distance.
+    """
+    nx, ny = marked.shape
+    index = np.arange(nx, dtype=float)[:, None]
+    before = np.maximum.accumulate(np.where(marked, index, -np.inf), axis=0)
+    after = np.minimum.accumulate(np.where(marked, index, np.inf)[::-1], axis=0)[::-1]
+    squared = np.minimum(index - before, after - index)**2
+
+    best = squared.copy()
+    k = 1
+    while k < ny and k * k < np.max(best):
+        best[:, k:] = np.minimum(best[:, k:], squared[:, :-k] + k * k)
+        best[:, :-k] = np.minimum(best[:, :-k], squared[:, k:] + k * k)
+        k += 1
+    return np.sqrt(best)
+
+def _polygon_signed_distance(points, vertices):
+    """Signed distance from points to a simple polygon (negative inside)."""
+    start = vertices
+    end = np.roll(vertices, -1, axis=0)
+    edge = end - start
+
+    # Distance to every edge for every point
+    rel = points[:, None, :] - start[None, :, :]
+    edge_len_sq = np.sum(edge**2, axis=1)
+    u = np.clip(np.sum(rel * edge[None], axis=2) / np.where(edge_len_sq > 0, edge_len_sq, 1.0),
+                0.0, 1.0)
+    closest = start[None] + u[..., None] * edge[None]
+    distance = np.min(np.sqrt(np.sum((points[:, None, :] - closest)**2, axis=2)), axis=1)
+
+    # Even-odd rule for the inside test
+    y = points[:, 1][:, None]
+    crosses = (start[None, :, 1] > y) != (end[None, :, 1] > y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_cross = start[None, :, 0] + (y - start[None, :, 1]) * edge[None, :, 0] / edge[None, :, 1]
+    inside = np.sum(crosses & (points[:, 0][:, None] < x_cross), axis=1) % 2 == 1
+
+    return np.where(inside, -distance, distance)
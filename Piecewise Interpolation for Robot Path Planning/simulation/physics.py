@@ -1,7 +1,11 @@
 
 import numpy as np
 
-def calculate_curvature(x, y):
+# Turning angle (radians) between consecutive samples below which a path is
+# treated as straight by calculate_curvature_nd and calculate_torsion
+ANGLE_TOLERANCE = 1e-8
+
+def calculate_curvature(x, y, axis=-1):
     """
     Calculate curvature of a path at each point using finite differences.
     
@@ -11,6 +15,8 @@ def calculate_curvature(x, y):
     Args:
         x (numpy.ndarray): Array of x coordinates
         y (numpy.ndarray): Array of y coordinates
+        axis (int): Axis along the path, so a batch of paths of shape
+            (batch, n) is handled in one call
         
     Returns:
         numpy.ndarray: Curvature at each point
@@ -20,23 +26,89 @@ def calculate_curvature(x, y):
     y = np.asarray(y)
     
     # Calculate first derivatives
-    dx = np.gradient(x)
-    dy = np.gradient(y)
+    dx = np.gradient(x, axis=axis)
+    dy = np.gradient(y, axis=axis)
     
     # Calculate second derivatives
-    ddx = np.gradient(dx)
-    ddy = np.gradient(dy)
+    ddx = np.gradient(dx, axis=axis)
+    ddy = np.gradient(dy, axis=axis)
     
     # Calculate curvature
     numerator = np.abs(dx * ddy - dy * ddx)
     denominator = (dx**2 + dy**2)**(3/2)
     
     # Handle divide by zero (straight line segments)
-    curvature = np.zeros_like(x)
+    curvature = np.zeros_like(x, dtype=float)
     mask = denominator > 1e-10
     curvature[mask] = numerator[mask] / denominator[mask]
     
     return curvature
 
+def calculate_curvature_nd(points, axis=-2):
+    """
+    Calculate curvature of a path in any number of dimensions.
+    
+    Curvature formula (reduces to calculate_curvature for d = 2):
+        κ = sqrt(|r'|^2 |r''|^2 - (r'·r'')^2) / |r'|^3
+    
+    Args:
+        points (numpy.ndarray): Path points of shape (n, d), or a batch of
+            shape (batch, n, d)
+        axis (int): Axis along the path
+        
+    Returns:
+        numpy.ndarray: Curvature at each point
+    """
+    points = np.asarray(points, dtype=float)
+    
+    d1 = np.gradient(points, axis=axis)
+    d2 = np.gradient(d1, axis=axis)
+    
+    speed_sq = np.sum(d1**2, axis=-1)
+    cross_sq = speed_sq * np.sum(d2**2, axis=-1) - np.sum(d1 * d2, axis=-1)**2
+    numerator = np.sqrt(np.maximum(cross_sq, 0.0))
+    denominator = speed_sq**(3/2)
+    
+    # Handle divide by zero (straight line segments): the threshold is on
+    # the turning angle between samples, so it does not depend on the
+    # sample spacing or the units of the path
+    curvature = np.zeros(speed_sq.shape)
+    mask = cross_sq > ANGLE_TOLERANCE**2 * speed_sq**2
+    curvature[mask] = numerator[mask] / denominator[mask]
+    
+    return curvature
 
-
+def calculate_torsion(points, axis=-2):
+    """
+    Calculate torsion of a 3-D path at each point using finite differences.
+    
+    Torsion formula:
+        τ = (r' × r'')·r''' / |r' × r''|^2
+    
+    Args:
+        points (numpy.ndarray): Path points of shape (n, 3), or a batch of
+            shape (batch, n, 3)
+        axis (int): Axis along the path
+        
+    Returns:
+        numpy.ndarray: Torsion at each point (0 where the path is straight)
+    """
+    points = np.asarray(points, dtype=float)
+    if points.shape[-1] != 3:
+        raise ValueError("Torsion is only defined for 3-D paths")
+    
+    d1 = np.gradient(points, axis=axis)
+    d2 = np.gradient(d1, axis=axis)
+    d3 = np.gradient(d2, axis=axis)
+    
+    cross = np.cross(d1, d2)
+    cross_sq = np.sum(cross**2, axis=-1)
+    speed_sq = np.sum(d1**2, axis=-1)
+    
+    # Straight segments have no osculating plane; as in
+    # calculate_curvature_nd the threshold is relative to |r'|^4
+    torsion = np.zeros(cross_sq.shape)
+    mask = cross_sq > ANGLE_TOLERANCE**2 * speed_sq**2
+    torsion[mask] = np.sum(cross * d3, axis=-1)[mask] / cross_sq[mask]
+    
+    return torsion
\ No newline at end of file
@@ -0,0 +1,99 @@
+
+import numpy as np
+from simulation.physics import calculate_curvature
+
+def arc_length_parameter(paths):
+    """
+    Cumulative arc length along one path or a batch of paths.
+
+    Args:
+        paths (numpy.ndarray): Path points of shape (n, 2) or (batch, n, 2)
+
+    Returns:
+        numpy.ndarray: Arc length at each point, shape (n,) or (batch, n)
+    """
+    paths = np.asarray(paths, dtype=float)
+    segment_lengths = np.sqrt(np.sum(np.diff(paths, axis=-2)**2, axis=-1))
+    zeros = np.zeros(segment_lengths.shape[:-1] + (1,))
+    return np.concatenate((zeros, np.cumsum(segment_lengths, axis=-1)), axis=-1)
+
+def time_optimal_velocity_profile(paths, v_max, a_lat_max, a_lon_max, a_dec_max=None,
+                                  v_start=0.0, v_end=0.0):
+    """
+    Compute the time-optimal speed profile along paths under dynamic limits.
+
+    The speed at each point is capped by v_max and by the lateral
+    acceleration limit v^2 * κ <= a_lat_max. A forward pass then enforces
+    the acceleration limit and a backward pass the deceleration limit.
+    Both passes are prefix minima in transformed variables:
+
+        forward:  v_i^2 - 2 a s_i   is non-increasing in i
+        backward: v_i^2 + 2 d s_i   is non-decreasing in i
+
+    so each pass is a single np.minimum.accumulate over the whole batch
+    instead of a per-point loop.
+
+    Args:
+        paths (numpy.ndarray): Path points of shape (n, 2) or (batch, n, 2)
+        v_max (float): Maximum speed
+        a_lat_max (float): Maximum lateral acceleration
+        a_lon_max (float): Maximum longitudinal acceleration
+        a_dec_max (float): Maximum deceleration (default: a_lon_max)
+        v_start (float): Speed at the first point
+        v_end (float): Speed at the last point
+
+    Returns:
+        dict: Dictionary with the timing of each path:
+            - time: Time stamp at each point, shape (n,) or (batch, n)
+            - velocity: Speed at each point
+            - acceleration: Longitudinal acceleration on each segment,
+              shape (n-1,) or (batch, n-1)
+            - arc_length: Cumulative arc length at each point
+            - curvature: Curvature at each point
+            - duration: Total traversal time of each path
+    """
+    paths = np.asarray(paths, dtype=float)
+    if a_dec_max is None:
+        a_dec_max = a_lon_max
+
+    s = arc_length_parameter(paths)
+    curvature = calculate_curvature(paths[..., 0], paths[..., 1], axis=-1)
+
+    # Speed limits from v_max and lateral acceleration
+    v_cap_sq = np.full(s.shape, float(v_max)**2)
+    curved = curvature > 1e-12
+    v_cap_sq[curved] = np.minimum(v_cap_sq[curved], a_lat_max / curvature[curved])
+    v_cap_sq[..., 0] = np.minimum(v_cap_sq[..., 0], v_start**2)
+    v_cap_sq[..., -1] = np.minimum(v_cap_sq[..., -1], v_end**2)
+
+    # Forward pass: acceleration limit
+    forward = np.minimum.accumulate(v_cap_sq - 2 * a_lon_max * s, axis=-1)
+    v_sq = forward + 2 * a_lon_max * s
+
+    # Backward pass: deceleration limit
+    backward = v_sq + 2 * a_dec_max * s
+    backward = np.flip(np.minimum.accumulate(np.flip(backward, axis=-1), axis=-1), axis=-1)
+    v_sq = np.maximum(backward - 2 * a_dec_max * s, 0.0)
+    velocity = np.sqrt(v_sq)
+
+    # Time stamps from the average speed on each segment
+    ds = np.diff(s, axis=-1)
+    mean_speed = 0.5 * (velocity[..., 1:] + velocity[..., :-1])
+    dt = np.zeros_like(ds)
+    moving = ds > 0
+    with np.errstate(divide='ignore'):
+        dt[moving] = ds[moving] / mean_speed[moving]
+    zeros = np.zeros(ds.shape[:-1] + (1,))
+    time = np.concatenate((zeros, np.cumsum(dt, axis=-1)), axis=-1)
+
+    acceleration = np.zeros_like(ds)
+    acceleration[moving] = np.diff(v_sq, axis=-1)[moving] / (2 * ds[moving])
+
+    return {
+        'time': time,
+        'velocity': velocity,
+        'acceleration': acceleration,
+        'arc_length': s,
+        'curvature': curvature,
+        'duration': time[..., -1]
+    }
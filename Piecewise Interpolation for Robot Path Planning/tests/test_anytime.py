@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from config import TEST_WAYPOINTS
+from interpolation import anytime
+from interpolation.anytime import (METRICS_COST_SMOOTHING, anytime_interpolate,
+                                   sampling_error_bound)
+
+WAYPOINTS = np.array(TEST_WAYPOINTS['complex'], dtype=float)
+
+
+class FakeClock:
+    """Clock that advances by step seconds on every reading."""
+
+    def __init__(self, step=0.0):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+def test_frozen_clock_refines_up_to_max_points():
+    result = anytime_interpolate(WAYPOINTS, budget=1.0, start_points=16, max_points=256,
+                                 clock=FakeClock())
+    assert result['level'] == 4
+    assert result['num_points'] == 256
+    assert result['path'].shape == (256, 2)
+    assert result['deadline_met']
+    assert [stage['stage'] for stage in result['stages']] == ['fit'] + ['sample'] * 5 + ['metrics']
+    assert result['metrics'] is not None
+
+
+def test_refinement_stops_at_tolerance():
+    result = anytime_interpolate(WAYPOINTS, budget=1.0, tolerance=1.0, clock=FakeClock())
+    assert result['error_bound'] <= 1.0
+    previous = sampling_error_bound(result['fit'], result['num_points'] // 2)
+    assert result['level'] == 0 or previous > 1.0
+
+
+def test_budget_limits_the_level():
+    # Every stage takes one tick, so each level is predicted to take two;
+    # the budget starts at tick 1, the fit ends at tick 3 and level k at
+    # tick 5 + 3 k, and level 3 would be predicted to end at tick 14
+    clock = FakeClock(step=1e-3)
+    result = anytime_interpolate(WAYPOINTS, budget=0.0125, metrics=False, clock=clock)
+    assert result['level'] == 2
+    assert result['num_points'] == 64
+    assert all(stage['time'] == pytest.approx(1e-3) for stage in result['stages'])
+    assert result['elapsed'] == pytest.approx(0.012)
+    assert result['deadline_met']
+    assert result['metrics'] is None
+
+
+def test_spent_budget_still_returns_the_first_level():
+    clock = FakeClock()
+    clock.now = 10.0
+    result = anytime_interpolate(WAYPOINTS, budget=0.002, clock=clock, start_time=0.0)
+    assert result['level'] == 0
+    assert result['num_points'] == 16
+    assert result['metrics'] is None
+    assert not result['deadline_met']
+
+
+def test_expensive_metrics_are_skipped_and_their_estimate_decays():
+    costs = {'cubic_spline': 1.0}
+    result = anytime_interpolate(WAYPOINTS, budget=0.01, clock=FakeClock(),
+                                 metrics_costs=costs)
+    # The reserved metrics time also stops refinement after the first level
+    assert result['level'] == 0
+    assert result['metrics'] is None
+    assert costs['cubic_spline'] == pytest.approx(1.0 - METRICS_COST_SMOOTHING)
+
+
+def test_measured_metrics_cost_is_a_moving_average():
+    costs = {'cubic_spline': 0.004}
+    result = anytime_interpolate(WAYPOINTS, budget=0.01, clock=FakeClock(),
+                                 metrics_costs=costs, max_points=64)
+    assert result['metrics'] is not None
+    # The frozen clock measures the metrics stage at 0 s
+    assert costs['cubic_spline'] == pytest.approx(0.004 + METRICS_COST_SMOOTHING * (0 - 0.004))
+
+    costs = {}
+    anytime_interpolate(WAYPOINTS, budget=0.01, clock=FakeClock(), metrics_costs=costs)
+    assert costs == {'cubic_spline': 0.0}
+
+
+def test_metrics_costs_are_not_shared_between_calls():
+    first = anytime_interpolate(WAYPOINTS, budget=0.01, clock=FakeClock())
+    second = anytime_interpolate(WAYPOINTS, budget=0.01, clock=FakeClock())
+    assert first['level'] == second['level']
+    assert not hasattr(anytime, 'METRICS_COST')
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from config import TEST_WAYPOINTS
+from interpolation.auto import (COST_MODEL, auto_interpolate, calibrate_cost_model,
+                                estimate_lebesgue_constant, estimate_method_costs,
+                                polynomial_nodes)
+from interpolation.registry import available_methods
+
+
+def _waypoints(name):
+    return np.array(TEST_WAYPOINTS[name], dtype=float)
+
+
+def test_cost_model_covers_registered_methods():
+    assert set(COST_MODEL) == set(available_methods())
+
+
+def test_calibration_fits_a_power_law_without_touching_the_model():
+    before = {method: dict(model) for method, model in COST_MODEL.items()}
+    calibration = calibrate_cost_model(sizes=(4, 8), repeats=1, methods=['cubic_spline'],
+                                       update=False)
+    assert set(calibration['cubic_spline']['timings']) == {4, 8}
+    assert calibration['cubic_spline']['scale'] > 0
+    assert COST_MODEL == before
+
+
+@pytest.mark.parametrize('name', ['circle', 'sharp_turns'])
+def test_graph_polynomials_rejected_without_increasing_x(name):
+    estimates = estimate_method_costs(_waypoints(name))
+    for method in ('newton', 'lagrange'):
+        assert not estimates[method]['stable']
+        assert estimates[method]['lebesgue_constant'] == np.inf
+
+
+def test_lebesgue_constant_uses_graph_nodes():
+    waypoints = _waypoints('complex')
+    estimates = estimate_method_costs(waypoints)
+    expected = estimate_lebesgue_constant(waypoints[:, 0])
+    assert estimates['newton']['lebesgue_constant'] == pytest.approx(expected)
+    assert polynomial_nodes('graph', waypoints[::-1]) is None
+
+
+@pytest.mark.parametrize('name', sorted(TEST_WAYPOINTS))
+@pytest.mark.parametrize('max_deviation', [None, 1.0])
+def test_selected_path_is_finite(name, max_deviation):
+    path, choice = auto_interpolate(_waypoints(name), max_deviation=max_deviation,
+                                    return_choice=True)
+    assert np.all(np.isfinite(path))
+    if max_deviation is None:
+        assert choice['met_bounds']
+
+
+def test_non_finite_candidates_are_skipped(monkeypatch):
+    # Duplicate x makes the graph polynomial divide by zero
+    waypoints = np.array([[0, 0], [1, 1], [1, 2], [2, 0]], dtype=float)
+    monkeypatch.setitem(COST_MODEL, 'newton', dict(COST_MODEL['newton'], nodes=None, scale=0.0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        path, choice = auto_interpolate(waypoints, return_choice=True)
+    assert choice['method'] != 'newton'
+    assert np.all(np.isfinite(path))
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from config import TEST_WAYPOINTS
+from interpolation.b_spline import b_spline_fit, b_spline_interpolate_batch
+from interpolation.cubic_spline import cubic_spline_fit, cubic_spline_interpolate_batch
+from interpolation.evaluation import _cached_cubic_spline_matrix, clear_evaluation_cache
+from utils.waypoints import generate_waypoint_batch
+
+PAIRS = [(cubic_spline_interpolate_batch, cubic_spline_fit),
+         (b_spline_interpolate_batch, b_spline_fit)]
+
+
+@pytest.mark.parametrize('batch_func, fit_func', PAIRS)
+def test_batch_matches_fit(batch_func, fit_func):
+    waypoint_batch = generate_waypoint_batch(np.random.default_rng(3), 20, 7, 'corridor')
+    # Repeated sets share their parameterization (and B-spline factorization)
+    waypoint_batch = np.concatenate((waypoint_batch, waypoint_batch[:5]))
+    expected = np.stack([fit_func(waypoints, num_points=50).to_array()
+                         for waypoints in waypoint_batch])
+    np.testing.assert_allclose(batch_func(waypoint_batch, num_points=50), expected, atol=1e-8)
+
+
+def test_cubic_spline_batch_uses_chord_length():
+    waypoints = np.array(TEST_WAYPOINTS['sharp_turns'], dtype=float)
+    np.testing.assert_allclose(cubic_spline_interpolate_batch(waypoints[None])[0],
+                               cubic_spline_fit(waypoints).to_array(), atol=1e-8)
+
+
+def test_cubic_spline_batch_reuses_cached_evaluation_matrices():
+    waypoint_batch = generate_waypoint_batch(np.random.default_rng(5), 8, 6, 'corridor')
+    waypoint_batch = np.concatenate((waypoint_batch, waypoint_batch[:3]))
+    clear_evaluation_cache()
+
+    first = cubic_spline_interpolate_batch(waypoint_batch, num_points=40)
+    info = _cached_cubic_spline_matrix.cache_info()
+    assert (info.misses, info.hits) == (8, 0)
+
+    # A later batch with the same parameterizations builds no new matrix
+    second = cubic_spline_interpolate_batch(waypoint_batch[::-1], num_points=40)
+    info = _cached_cubic_spline_matrix.cache_info()
+    assert (info.misses, info.hits) == (8, 8)
+    np.testing.assert_allclose(second, first[::-1])
@@ -0,0 +1,76 @@
+import time
+
+import numpy as np
+import pytest
+
+from config import TEST_WAYPOINTS
+from interpolation.chebyshev import (chebyshev_coefficients, chebyshev_fit, chebyshev_interpolate,
+                                     chebyshev_lobatto_nodes, chebyshev_series, clenshaw)
+from interpolation.cubic_spline import cubic_spline_fit
+from interpolation.path import PiecewisePolynomial
+from interpolation.registry import get_method
+from utils.similarity import discrete_frechet_distance
+
+
+def lobatto_parameters(n):
+    return (1 - chebyshev_lobatto_nodes(n - 1)) / 2
+
+
+# The waypoints are interpolated at Chebyshev-Lobatto parameters, not at
+# their chord lengths: a single polynomial through near-uniform parameters
+# is the Newton interpolant and oscillates like Runge's example.
+@pytest.mark.parametrize('name', sorted(TEST_WAYPOINTS))
+def test_fit_interpolates_waypoints_at_lobatto_parameters(name):
+    waypoints = np.array(TEST_WAYPOINTS[name], dtype=float)
+    fit = chebyshev_fit(waypoints)
+    assert isinstance(fit, PiecewisePolynomial)
+    tolerance = chebyshev_series(waypoints)['tolerance']
+    np.testing.assert_allclose(fit(lobatto_parameters(len(waypoints))), waypoints, atol=tolerance)
+
+
+@pytest.mark.parametrize('n', [4, 20, 60, 400])
+def test_pieces_match_chebyshev_series(n):
+    waypoints = np.random.default_rng(n).uniform(0, 500, (n, 2))
+    t = np.linspace(0, 1, 1001)
+    expected = clenshaw(chebyshev_coefficients(waypoints), 1 - 2 * t)
+    np.testing.assert_allclose(chebyshev_fit(waypoints)(t), expected, atol=1e-6)
+
+
+def test_smooth_route_is_truncated_within_tolerance():
+    # A smooth route sampled at the Lobatto parameters needs a low degree
+    t = lobatto_parameters(400)
+    waypoints = np.column_stack((500 * t, 200 * np.sin(3 * t)))
+    series = chebyshev_series(waypoints, tolerance=1e-6)
+    assert series['degree'] < 20
+    assert series['error_bound'] <= 1e-6
+
+    fit = chebyshev_fit(waypoints, tolerance=1e-6)
+    np.testing.assert_allclose(fit(t), waypoints, atol=1e-6)
+    assert fit.coeffs.shape[1] <= series['degree'] + 1
+
+
+def test_interpolate_is_one_clenshaw_pass_over_truncated_series():
+    waypoints = np.array(TEST_WAYPOINTS['dense_curve'], dtype=float)
+    coeffs = chebyshev_series(waypoints, tolerance=1e-3)['coeffs']
+    expected = clenshaw(coeffs, 1 - 2 * np.linspace(0, 1, 50))
+    np.testing.assert_allclose(chebyshev_interpolate(waypoints, 50, tolerance=1e-3), expected)
+
+
+def test_fit_scales_to_many_waypoints():
+    waypoints = np.random.default_rng(0).uniform(0, 500, (400, 2))
+    start = time.perf_counter()
+    chebyshev_fit(waypoints)
+    assert time.perf_counter() - start < 0.5
+
+
+def test_registered_fit_and_interpolate_agree():
+    waypoints = np.array(TEST_WAYPOINTS['zigzag'], dtype=float)
+    fit = get_method('chebyshev', 'fit')(waypoints, num_points=64)
+    np.testing.assert_allclose(fit.to_array(), chebyshev_interpolate(waypoints, 64), atol=1e-9)
+
+
+def test_differs_from_cubic_spline():
+    waypoints = np.array(TEST_WAYPOINTS['zigzag'], dtype=float)
+    distance = discrete_frechet_distance(chebyshev_fit(waypoints).to_array(),
+                                         cubic_spline_fit(waypoints).to_array())
+    assert distance > 1.0
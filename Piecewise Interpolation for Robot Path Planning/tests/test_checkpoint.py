@@ -0,0 +1,111 @@
+import json
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import pytest
+
+from utils.checkpoint import IncrementalReport
+
+
+def rows(values, calls):
+    """CSV rows (key, inputs, format) that record which rows were formatted."""
+    def format_row(key, value):
+        calls.append(key)
+        return f"{key},{value}"
+    return [(key, value, lambda key=key, value=value: format_row(key, value))
+            for key, value in values.items()]
+
+
+def figure(calls, name='figure'):
+    def draw():
+        calls.append(name)
+        fig, ax = plt.subplots(figsize=(1, 1))
+        ax.plot([0, 1], [0, 1])
+        return fig
+    return draw
+
+
+def read_manifest(directory):
+    with open(directory / IncrementalReport.MANIFEST) as f:
+        return json.load(f)
+
+
+def test_write_csv_keeps_the_text_of_unchanged_rows(tmp_path):
+    calls = []
+    IncrementalReport(tmp_path).write_csv('table.csv', 'key,value', rows({'a': 1, 'b': 2}, calls))
+    assert calls == ['a', 'b']
+
+    # Hand-edit a row: an unchanged row keeps its text instead of being formatted
+    (tmp_path / 'table.csv').write_text('key,value\na,kept\nb,2\n')
+    calls.clear()
+    report = IncrementalReport(tmp_path)
+    report.write_csv('table.csv', 'key,value', rows({'a': 1, 'b': 3, 'c': 4}, calls))
+    assert calls == ['b', 'c']
+    assert (tmp_path / 'table.csv').read_text() == 'key,value\na,kept\nb,3\nc,4\n'
+    assert report.written == ['table.csv']
+
+
+def test_unchanged_csv_is_not_rewritten(tmp_path):
+    calls = []
+    IncrementalReport(tmp_path).write_csv('table.csv', 'key,value', rows({'a': 1}, calls))
+    mtime = (tmp_path / 'table.csv').stat().st_mtime_ns
+
+    calls.clear()
+    report = IncrementalReport(tmp_path)
+    report.write_csv('table.csv', 'key,value', rows({'a': 1}, calls))
+    assert calls == []
+    assert report.unchanged == ['table.csv']
+    assert (tmp_path / 'table.csv').stat().st_mtime_ns == mtime
+
+
+def test_write_figure_skips_unchanged_figures(tmp_path):
+    calls = []
+    IncrementalReport(tmp_path).write_figure('plot.png', [1, 2], figure(calls), dpi=10)
+    assert calls == ['figure']
+
+    report = IncrementalReport(tmp_path)
+    report.write_figure('plot.png', [1, 2], figure(calls), dpi=10)
+    assert calls == ['figure']
+    assert report.unchanged == ['plot.png']
+
+    report.write_figure('plot.png', [1, 3], figure(calls), dpi=10)
+    assert calls == ['figure', 'figure']
+
+    # A missing file is redrawn even when its inputs are unchanged
+    (tmp_path / 'plot.png').unlink()
+    IncrementalReport(tmp_path).write_figure('plot.png', [1, 3], figure(calls), dpi=10)
+    assert calls == ['figure'] * 3
+
+
+def test_manifest_is_saved_after_every_file(tmp_path):
+    calls = []
+    report = IncrementalReport(tmp_path)
+    report.write_csv('table.csv', 'key,value', rows({'a': 1}, calls))
+    assert set(read_manifest(tmp_path)) == {'table.csv'}
+    report.write_figure('plot.png', 'inputs', figure(calls), dpi=10)
+    assert set(read_manifest(tmp_path)) == {'table.csv', 'plot.png'}
+
+    # A report interrupted by a failing figure keeps the files written before it
+    def fail():
+        raise RuntimeError("interrupted")
+    interrupted = IncrementalReport(tmp_path)
+    interrupted.write_csv('table.csv', 'key,value', rows({'a': 2}, calls))
+    with pytest.raises(RuntimeError):
+        interrupted.write_figure('plot.png', 'changed', fail)
+
+    calls.clear()
+    resumed = IncrementalReport(tmp_path)
+    resumed.write_csv('table.csv', 'key,value', rows({'a': 2}, calls))
+    assert calls == []
+    assert resumed.unchanged == ['table.csv']
+
+
+def test_rewrite_ignores_the_manifest(tmp_path):
+    calls = []
+    IncrementalReport(tmp_path).write_csv('table.csv', 'key,value', rows({'a': 1}, calls))
+    calls.clear()
+    report = IncrementalReport(tmp_path, rewrite=True)
+    report.write_csv('table.csv', 'key,value', rows({'a': 1}, calls))
+    assert calls == ['a']
+    assert report.written == ['table.csv']
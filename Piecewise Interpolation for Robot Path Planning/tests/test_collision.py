@@ -0,0 +1,72 @@
+import numpy as np
+
+from simulation.collision import ObstacleMap, _distance_transform
+
+
+def wall_map():
+    obstacle_map = ObstacleMap(5.0)
+    obstacle_map.add_polygon([[100, 0], [101, 0], [101, 200], [100, 200]])
+    return obstacle_map.build()
+
+
+def test_thin_wall_between_path_points_collides():
+    path = np.array([[0, 100], [101.6, 100], [200, 100]])
+    result = wall_map().check_path(path)
+    assert result['collision']
+    assert result['first_collision_segment'] == 0
+    assert np.isclose(result['first_collision'], 100 / 200, atol=1e-6)
+
+
+def test_path_beside_wall_is_clear():
+    path = np.array([[0, 210], [101.6, 205], [200, 210]])
+    result = wall_map().check_path(path)
+    assert not result['collision']
+    assert np.isclose(result['min_clearance'], np.hypot(0.6, 5))
+
+
+def test_distance_transform_matches_brute_force():
+    rng = np.random.default_rng(0)
+    marked = rng.random((40, 30)) < 0.05
+    cells = np.argwhere(np.ones_like(marked))
+    targets = np.argwhere(marked)
+    expected = np.min(np.sqrt(np.sum((cells[:, None] - targets[None])**2, axis=2)), axis=1)
+    assert np.allclose(_distance_transform(marked), expected.reshape(marked.shape))
+
+
+def test_distance_bound_is_below_signed_distance():
+    rng = np.random.default_rng(1)
+    obstacle_map = ObstacleMap(3.0)
+    obstacle_map.add_circle((10, 10), 4)
+    obstacle_map.add_polygon([[30, 0], [40, 5], [32, 20]])
+    obstacle_map.add_occupancy_grid(rng.random((10, 10)) < 0.3, (50, 50), 2.0)
+    obstacle_map.build()
+
+    points = rng.uniform(-20, 90, (5000, 2))
+    bound = obstacle_map.distance_bound(points)
+    assert np.all(bound <= np.maximum(obstacle_map.signed_distance(points), 0) + 1e-9)
+
+
+def test_first_collision_matches_dense_sampling():
+    rng = np.random.default_rng(2)
+    obstacle_map = ObstacleMap(2.0)
+    obstacle_map.add_occupancy_grid(rng.random((30, 30)) < 0.05, (0, 0), 1.0)
+    obstacle_map.build()
+
+    path = np.column_stack((np.linspace(0, 30, 40), 15 + 10 * np.sin(np.linspace(0, 5, 40))))
+    result = obstacle_map.check_path(path)
+
+    lengths = np.sqrt(np.sum(np.diff(path, axis=0)**2, axis=1))
+    arc = np.concatenate(([0.0], np.cumsum(lengths)))
+    s = np.linspace(0, arc[-1], 400001)
+    dense = np.column_stack([np.interp(s, arc, path[:, k]) for k in range(2)])
+    inside = np.flatnonzero(obstacle_map.signed_distance(dense) <= 0)
+
+    assert result['collision'] == (len(inside) > 0)
+    if len(inside):
+        assert abs(result['first_collision'] - s[inside[0]] / arc[-1]) < 1e-4
+
+
+def test_empty_map_has_no_collisions():
+    result = ObstacleMap().build().check_path(np.array([[0.0, 0.0], [10.0, 0.0]]))
+    assert not result['collision']
+    assert result['min_clearance'] == np.inf
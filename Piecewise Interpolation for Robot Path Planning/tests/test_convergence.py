@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from interpolation.registry import METHODS, register_method
+from interpolation.cubic_spline import cubic_spline_fit
+from utils.testing import convergence_study
+
+
+def _singular_fit(waypoints, num_points=100):
+    if len(waypoints) > 8:
+        raise np.linalg.LinAlgError('Singular matrix')
+    return cubic_spline_fit(waypoints, num_points)
+
+
+def _broken_fit(waypoints, num_points=100):
+    raise TypeError('not a numerical failure')
+
+
+@pytest.fixture
+def registered(monkeypatch):
+    def register(name, fit):
+        monkeypatch.setitem(METHODS, name, None)
+        register_method(name, None, fit=fit)
+    return register
+
+
+def test_study_runs_batched_and_fitted_methods():
+    study = convergence_study(['cubic_spline', 'akima'], ['sine'], [4, 8, 16, 32], repeats=1)
+    assert len(study['records']) == 8
+    assert all(r['error'] is None and np.isfinite(r['max_error']) for r in study['records'])
+    # Cubic splines converge at fourth order on smooth data, up to the
+    # second-order error of comparing through linear interpolation
+    assert study['rates']['cubic_spline']['sine'] > 1.5
+
+
+def test_numerical_failures_are_recorded(registered):
+    registered('singular', _singular_fit)
+    study = convergence_study(['singular'], ['sine'], [4, 8, 16], repeats=1)
+    errors = [r['error'] for r in study['records']]
+    assert errors[:2] == [None, None]
+    assert 'Singular matrix' in errors[2]
+    assert study['records'][2]['max_error'] == np.inf
+
+
+def test_other_exceptions_propagate(registered):
+    registered('broken', _broken_fit)
+    with pytest.raises(TypeError):
+        convergence_study(['broken'], ['sine'], [4], repeats=1)
@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+
+from utils.decimation import decimate_waypoints, visvalingam_whyatt
+
+
+def test_visvalingam_whyatt_keeps_narrow_spike():
+    # The spike's triangle is smaller than tolerance**2 / 2 but it is 2.28 high
+    waypoints = np.array([[0, 0], [5, 0], [5.05, 2.28], [5.1, 0], [10, 0]])
+    assert 2 in visvalingam_whyatt(waypoints, 0.5)
+
+
+@pytest.mark.parametrize('method', ['douglas_peucker', 'visvalingam_whyatt'])
+@pytest.mark.parametrize('tolerance', [0.1, 0.5, 2.0])
+def test_decimation_bounds_deviation(method, tolerance):
+    rng = np.random.default_rng(0)
+    waypoints = np.cumsum(rng.normal(size=(300, 2)), axis=0)
+    result = decimate_waypoints(waypoints, tolerance, method)
+    assert result['max_deviation'] <= tolerance
+    assert result['reduction'] > 1
+    assert result['indices'][0] == 0 and result['indices'][-1] == len(waypoints) - 1
@@ -0,0 +1,171 @@
+import numpy as np
+import pytest
+
+from config import TEST_WAYPOINTS
+from interpolation.b_spline import averaged_knot_vector, b_spline_fit
+from interpolation.cubic_spline import (BOUNDARY_CONDITIONS, cubic_spline_fit,
+                                        cubic_spline_interpolate_batch, spline_coefficients)
+from interpolation.evaluation import bspline_basis_matrix
+from interpolation.lagrange import lagrange_fit
+from interpolation.newton import divided_differences_multi, newton_fit
+from utils.waypoints import chord_length_parameter
+
+CURVES = ['simple_curve', 'complex', 'zigzag', 'dense_curve']
+
+
+def _waypoints(name):
+    return np.array(TEST_WAYPOINTS[name], dtype=float)
+
+
+def reference_basis(i, k, t, knots):
+    """Cox-de Boor recursion, right-continuous except at the last knot."""
+    if k == 0:
+        if knots[i] <= t < knots[i + 1]:
+            return 1.0
+        return float(t == knots[-1] and knots[i] < knots[i + 1] == knots[-1])
+    value = 0.0
+    if knots[i + k] > knots[i]:
+        value += (t - knots[i]) / (knots[i + k] - knots[i]) * reference_basis(i, k - 1, t, knots)
+    if knots[i + k + 1] > knots[i + 1]:
+        value += ((knots[i + k + 1] - t) / (knots[i + k + 1] - knots[i + 1])
+                  * reference_basis(i + 1, k - 1, t, knots))
+    return value
+
+
+def reference_natural_spline(x, y, x_eval):
+    """Natural cubic spline through a dense solve for the second derivatives."""
+    n = len(x)
+    h = np.diff(x)
+    A = np.zeros((n, n))
+    rhs = np.zeros(n)
+    A[0, 0] = A[-1, -1] = 1.0
+    for i in range(1, n - 1):
+        A[i, i - 1:i + 2] = h[i - 1], 2 * (h[i - 1] + h[i]), h[i]
+        rhs[i] = 6 * ((y[i + 1] - y[i]) / h[i] - (y[i] - y[i - 1]) / h[i - 1])
+    m = np.linalg.solve(A, rhs)
+    i = np.clip(np.searchsorted(x, x_eval, side='right') - 1, 0, n - 2)
+    s, u = x_eval - x[i], x[i + 1] - x_eval
+    return ((m[i] * u**3 + m[i + 1] * s**3) / (6 * h[i])
+            + (y[i] / h[i] - m[i] * h[i] / 6) * u + (y[i + 1] / h[i] - m[i + 1] * h[i] / 6) * s)
+
+
+@pytest.mark.parametrize('name', CURVES)
+def test_cubic_spline_fit_matches_reference(name):
+    waypoints = _waypoints(name)
+    fit = cubic_spline_fit(waypoints)
+    t = chord_length_parameter(waypoints)
+    t_eval = np.linspace(0, 1, 57)
+    expected = np.column_stack([reference_natural_spline(t, waypoints[:, j], t_eval)
+                                for j in range(2)])
+    np.testing.assert_allclose(fit(t_eval), expected, atol=1e-8)
+
+
+@pytest.mark.parametrize('n, degree', [(3, 2), (4, 3), (5, 3), (9, 3)])
+def test_not_a_knot_spline_reproduces_polynomials(n, degree):
+    # Three points only determine the parabola through them
+    x = np.cumsum(np.random.default_rng(n).uniform(0.2, 1.0, n))
+    polynomial = np.polynomial.Polynomial(np.arange(1.0, degree + 2))
+    a, b, c, d = spline_coefficients(x, polynomial(x)[:, None], 'not-a-knot')
+    np.testing.assert_allclose(a[:, 0], polynomial(x[:-1]))
+    np.testing.assert_allclose(b[:, 0], polynomial.deriv(1)(x[:-1]))
+    np.testing.assert_allclose(c[:, 0], polynomial.deriv(2)(x[:-1]) / 2)
+    np.testing.assert_allclose(d[:, 0], polynomial.deriv(3)(x[:-1]) / 6, atol=1e-9)
+
+
+@pytest.mark.parametrize('name', CURVES + ['two_points'])
+def test_clamped_spline_has_zero_end_velocity(name):
+    waypoints = _waypoints(name) if name != 'two_points' else np.array([[0.0, 0.0], [3.0, 4.0]])
+    fit = cubic_spline_fit(waypoints, boundary_condition='clamped')
+    t = chord_length_parameter(waypoints)
+    np.testing.assert_allclose(fit(t), waypoints, atol=1e-9)
+    np.testing.assert_allclose(fit.derivative()([0.0, 1.0]), 0.0, atol=1e-9)
+
+
+@pytest.mark.parametrize('boundary_condition', BOUNDARY_CONDITIONS)
+def test_boundary_conditions_match_between_fit_and_batch(boundary_condition):
+    waypoint_batch = np.stack([_waypoints('complex'), _waypoints('complex')[::-1]])
+    expected = np.stack([cubic_spline_fit(waypoints, 50, boundary_condition).to_array()
+                         for waypoints in waypoint_batch])
+    np.testing.assert_allclose(cubic_spline_interpolate_batch(waypoint_batch, 50, boundary_condition),
+                               expected, atol=1e-8)
+
+
+def test_unknown_boundary_condition_is_rejected():
+    with pytest.raises(ValueError, match='periodic'):
+        cubic_spline_fit(_waypoints('complex'), boundary_condition='periodic')
+
+
+@pytest.mark.parametrize('n, k', [(2, 1), (3, 2), (5, 3), (11, 3)])
+def test_basis_matrix_matches_reference_recursion(n, k):
+    t_params = np.sort(np.random.default_rng(n).uniform(0, 1, n))
+    t_params[[0, -1]] = 0, 1
+    knots = averaged_knot_vector(t_params, k)
+    assert len(knots) == n + k + 1
+    t = np.linspace(0, 1, 23)
+    expected = np.array([[reference_basis(i, k, v, knots) for i in range(n)] for v in t])
+    np.testing.assert_allclose(bspline_basis_matrix(knots, k, t).toarray(), expected, atol=1e-12)
+
+
+@pytest.mark.parametrize('name', CURVES)
+def test_b_spline_fit_passes_through_waypoints(name):
+    waypoints = _waypoints(name)
+    fit = b_spline_fit(waypoints)
+    np.testing.assert_allclose(fit(chord_length_parameter(waypoints)), waypoints, atol=1e-8)
+
+
+def test_b_spline_collocation_is_well_conditioned():
+    # Uneven chord lengths, where uniform internal knots give a singular system
+    x = np.linspace(0, 1, 32)
+    waypoints = np.column_stack((x, x**3))
+    t_params = chord_length_parameter(waypoints)
+    collocation = bspline_basis_matrix(averaged_knot_vector(t_params, 3), 3, t_params).toarray()
+    assert np.linalg.cond(collocation) < 1e3
+    np.testing.assert_allclose(b_spline_fit(waypoints)(t_params), waypoints, atol=1e-10)
+
+
+def test_newton_fit_reproduces_polynomial_graph():
+    x = np.array([0.0, 0.5, 1.5, 2.0, 3.0])
+    waypoints = np.column_stack((x, 2 - x + 0.5 * x**3))
+    path = newton_fit(waypoints, num_points=40).to_array()
+    np.testing.assert_allclose(path[:, 0], np.linspace(0, 3, 40))
+    np.testing.assert_allclose(path[:, 1], 2 - path[:, 0] + 0.5 * path[:, 0]**3, atol=1e-10)
+
+
+def test_parametric_polynomial_fits_pass_through_waypoints():
+    waypoints = np.array([[0, 0, 0], [1, 2, 1], [3, 1, 2], [4, 3, 0]], dtype=float)
+    t = chord_length_parameter(waypoints)
+    for fit in (newton_fit(waypoints), lagrange_fit(waypoints)):
+        np.testing.assert_allclose(fit(t), waypoints, atol=1e-9)
+
+
+def test_lagrange_fit_equals_newton_fit():
+    waypoints = _waypoints('simple_curve')
+    np.testing.assert_allclose(lagrange_fit(waypoints).to_array(),
+                               newton_fit(waypoints).to_array())
+
+
+def nested_newton(x, coef, t):
+    """Reference evaluation of the Newton form by nested multiplication."""
+    values = np.broadcast_to(coef[-1], (len(t),) + coef.shape[1:]).copy()
+    for k in range(len(x) - 2, -1, -1):
+        values = values * (t - x[k]).reshape((-1,) + (1,) * (coef.ndim - 1)) + coef[k]
+    return values
+
+
+@pytest.mark.parametrize('n', [15, 20])
+def test_high_degree_newton_fit_passes_through_waypoints(n):
+    rng = np.random.default_rng(n)
+    waypoints = np.cumsum(rng.uniform(20, 60, (n, 2)), axis=0)
+    waypoints[:, 1] = 0.5 * waypoints[:, 1] + rng.normal(0, 30, n)
+
+    graph = newton_fit(waypoints)
+    np.testing.assert_allclose(graph(waypoints[:, 0]), waypoints, rtol=0, atol=1e-6)
+
+    t = chord_length_parameter(waypoints)
+    parametric = newton_fit(waypoints, parametric=True)
+    np.testing.assert_allclose(parametric(t), waypoints, rtol=0, atol=1e-6)
+
+    t_eval = np.linspace(0, 1, 301)
+    reference = nested_newton(t, divided_differences_multi(t, waypoints), t_eval)
+    np.testing.assert_allclose(parametric(t_eval), reference, rtol=0,
+                               atol=1e-6 * np.max(np.abs(reference)))
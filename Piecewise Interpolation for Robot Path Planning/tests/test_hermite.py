@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from config import TEST_WAYPOINTS
+from interpolation.hermite import akima_fit, catmull_rom_fit, pchip_fit
+from utils.waypoints import chord_length_parameter
+
+
+@pytest.mark.parametrize('fit_func', [akima_fit, pchip_fit, catmull_rom_fit])
+@pytest.mark.parametrize('name', ['simple_curve', 'zigzag', 'sharp_turns', 'circle'])
+def test_hermite_fits_pass_through_waypoints(fit_func, name):
+    waypoints = np.array(TEST_WAYPOINTS[name], dtype=float)
+    fit = fit_func(waypoints)
+    alpha = 0.5 if fit_func is catmull_rom_fit else 1.0
+    np.testing.assert_allclose(fit(chord_length_parameter(waypoints, alpha)), waypoints,
+                               atol=1e-8)
+
+
+def test_chord_length_parameter_alpha():
+    waypoints = np.array([[0, 0], [1, 0], [1, 4]], dtype=float)
+    np.testing.assert_allclose(chord_length_parameter(waypoints), [0, 0.2, 1])
+    np.testing.assert_allclose(chord_length_parameter(waypoints, 0.5), [0, 1 / 3, 1])
+    np.testing.assert_allclose(chord_length_parameter(waypoints, 0.0), [0, 0.5, 1])
+    batch = np.stack((waypoints, 2 * waypoints))
+    np.testing.assert_allclose(chord_length_parameter(batch, 0.5)[1], [0, 1 / 3, 1])
@@ -0,0 +1,28 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGES = ('interpolation', 'simulation', 'utils')
+
+
+def _modules():
+    modules = ['config', 'project_runner']
+    for package in PACKAGES:
+        for name in sorted(os.listdir(os.path.join(ROOT, package))):
+            if name.endswith('.py'):
+                module = name[:-3]
+                modules.append(package if module == '__init__' else f'{package}.{module}')
+    return modules
+
+
+@pytest.mark.parametrize('module', _modules())
+def test_module_imports_on_its_own(module):
+    # A fresh interpreter per module, so an import cycle is not hidden by
+    # another module having been imported first
+    result = subprocess.run([sys.executable, '-c', f'import {module}'], cwd=ROOT,
+                            env=dict(os.environ, MPLBACKEND='Agg'),
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from interpolation.registry import get_method
+from utils.influence import INFLUENCE_BUILDERS, influence_analysis, influence_footprint
+from utils.waypoints import get_test_waypoints
+
+
+@pytest.mark.parametrize('method', list(INFLUENCE_BUILDERS))
+@pytest.mark.parametrize('name', ['complex', 'zigzag', 'dense_curve'])
+def test_influence_matrix_reproduces_the_fit(method, name):
+    waypoints = get_test_waypoints(name)
+    matrix = INFLUENCE_BUILDERS[method](waypoints, 100)
+    expected = get_method(method, 'fit')(waypoints).to_array()
+    assert matrix.shape == (100, len(waypoints))
+    assert np.allclose(matrix @ waypoints, expected, rtol=0, atol=1e-9)
+
+
+def test_footprint_of_a_known_matrix():
+    matrix = np.zeros((10, 3))
+    matrix[2:5, 0] = 0.5
+    matrix[[1, 8], 1] = [0.2, -0.3]
+    matrix[:, 2] = 0.005
+    footprint = influence_footprint(matrix, threshold=0.01)
+
+    assert list(footprint['start']) == [2, 1, -1]
+    assert list(footprint['end']) == [4, 8, -1]
+    assert np.allclose(footprint['width'], [0.3, 0.8, 0.0])
+    assert np.allclose(footprint['significant_fraction'], [0.3, 0.2, 0.0])
+    assert np.allclose(footprint['max_influence'], [0.5, 0.3, 0.005])
+
+
+def test_local_methods_have_narrower_footprints():
+    waypoints = get_test_waypoints('dense_curve')
+    analysis = influence_analysis(waypoints, ['newton', 'cubic_spline', 'catmull_rom'])
+    widths = {method: result['footprint']['width'] for method, result in analysis.items()}
+
+    # A global polynomial moves the whole path; Catmull-Rom only the two
+    # segments on each side of an interior waypoint
+    assert np.all(widths['newton'] > 0.9)
+    segments = len(waypoints) - 1
+    assert np.all(widths['catmull_rom'][1:-1] <= 4 / segments + 0.02)
+    assert np.mean(widths['catmull_rom']) < np.mean(widths['cubic_spline']) < 1
@@ -0,0 +1,90 @@
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from utils.decimation import decimation_deviation
+from utils.lod import PathPyramid
+from utils.visualization import LOD_MIN_POINTS, plot_path
+
+
+def spiral(n, noise=0.0):
+    t = np.linspace(0, 20 * np.pi, n)
+    points = np.column_stack((t * np.cos(t), t * np.sin(t)))
+    return points + np.random.default_rng(0).normal(0, noise, points.shape)
+
+
+def level_indices(path, level):
+    """Indices of a level's points in the full path (levels keep points in order)."""
+    indices = []
+    i = 0
+    for point in level:
+        while not np.array_equal(path[i], point):
+            i += 1
+        indices.append(i)
+    return np.array(indices)
+
+
+@pytest.mark.parametrize('noise', [0.0, 0.01])
+def test_levels_shrink_and_error_bounds_hold(noise):
+    path = spiral(20000, noise)
+    pyramid = PathPyramid(path)
+    counts = [len(level) for level in pyramid.levels]
+
+    assert pyramid.num_levels > 2
+    assert all(coarse <= 0.5 * fine for fine, coarse in zip(counts, counts[1:]))
+    assert np.all(np.diff(pyramid.error_bounds) >= 0)
+    assert counts[-1] <= 64
+
+    for level, bound in zip(pyramid.levels, pyramid.error_bounds):
+        deviation = decimation_deviation(path, level_indices(path, level))
+        assert np.max(deviation) <= bound + 1e-9
+
+
+def test_first_level_is_below_half_a_screen_pixel():
+    path = spiral(20000)
+    pyramid = PathPyramid(path)
+    extent = np.max(path.max(axis=0) - path.min(axis=0))
+    assert pyramid.error_bounds[1] <= 0.5 * extent / 4096
+
+
+def test_select_level_is_the_coarsest_within_the_pixel_size():
+    pyramid = PathPyramid(spiral(20000))
+    xlim, ylim = (-70, 70), (-70, 70)
+    for pixels in [(100, 100), (800, 800), (20000, 20000)]:
+        level = pyramid.select_level(xlim, ylim, pixels)
+        allowed = 0.5 * 140 / pixels[0]
+        assert pyramid.error_bounds[level] <= allowed
+        assert level == pyramid.num_levels - 1 or pyramid.error_bounds[level + 1] > allowed
+
+
+def test_dense_path_builds_quickly():
+    start = time.perf_counter()
+    PathPyramid(spiral(100000))
+    assert time.perf_counter() - start < 5.0
+
+
+def test_save_and_load_round_trip(tmp_path):
+    pyramid = PathPyramid(spiral(5000))
+    pyramid.save(tmp_path / 'pyramid.npz')
+    loaded = PathPyramid.load(tmp_path / 'pyramid.npz')
+    assert loaded.error_bounds == pyramid.error_bounds
+    for expected, level in zip(pyramid.levels, loaded.levels):
+        np.testing.assert_array_equal(level, expected)
+
+
+def test_plot_path_draws_dense_paths_from_a_pyramid():
+    fig, ax = plt.subplots(figsize=(4, 4), dpi=50)
+    try:
+        path = spiral(LOD_MIN_POINTS + 1)
+        line = plot_path(ax, path)
+        drawn = len(line.get_xdata())
+        assert 0 < drawn < len(path) / 10
+
+        small = spiral(100)
+        assert len(plot_path(ax, small).get_xdata()) == len(small)
+    finally:
+        plt.close(fig)
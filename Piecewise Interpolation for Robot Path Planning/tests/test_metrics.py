@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from config import TEST_WAYPOINTS
+from interpolation.path import PiecewisePolynomial
+from interpolation.registry import get_method
+from utils.metrics import curvature_metrics, streaming_curvature_metrics
+
+
+def parabola():
+    """The curve (t, t^2) on [0, 2] as two pieces."""
+    coeffs = np.array([[[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]],
+                       [[1.0, 1.0], [1.0, 2.0], [0.0, 1.0]]])
+    return PiecewisePolynomial(np.array([0.0, 1.0, 2.0]), coeffs)
+
+
+def test_curve_length_matches_analytic_parabola_length():
+    # Integral of sqrt(1 + 4 t^2) from 0 to 2
+    expected = np.sqrt(17) + np.arcsinh(4) / 4
+    assert parabola().length() == pytest.approx(expected, rel=1e-9)
+
+
+@pytest.mark.parametrize('method', ['cubic_spline', 'b_spline', 'akima', 'catmull_rom', 'newton'])
+@pytest.mark.parametrize('name', ['complex', 'zigzag', 'dense_curve'])
+def test_curve_length_matches_adaptive_quadrature(method, name):
+    integrate = pytest.importorskip('scipy.integrate')
+    fit = get_method(method, 'fit')(np.array(TEST_WAYPOINTS[name], dtype=float))
+    speed = fit.derivative()
+
+    expected = sum(integrate.quad(lambda t: np.linalg.norm(speed(t)[0]), a, b,
+                                  epsabs=0, epsrel=1e-12, limit=200)[0]
+                   for a, b in zip(fit.breakpoints[:-1], fit.breakpoints[1:]) if b > a)
+    assert fit.length() == pytest.approx(expected, rel=1e-9)
+
+
+def reference_intervals(curvature, limit):
+    """Runs [start, end) of consecutive points above limit, with their peak."""
+    edges = np.diff(np.concatenate(([0], (curvature > limit).astype(int), [0])))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    return [(start, end, curvature[start:end].max()) for start, end in zip(starts, ends)]
+
+
+@pytest.fixture(scope='module')
+def wiggly_path():
+    fit = get_method('cubic_spline', 'fit')(np.array(TEST_WAYPOINTS['zigzag'], dtype=float),
+                                            num_points=997)
+    return fit.to_array()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 5, 7, 64, 996, 997, 10**6])
+def test_streaming_metrics_match_whole_path(wiggly_path, chunk_size):
+    full = curvature_metrics(wiggly_path)
+    limit = np.median(full['curvature'])
+    full = curvature_metrics(wiggly_path, limit)
+    streamed = streaming_curvature_metrics(wiggly_path, limit, chunk_size=chunk_size)
+
+    assert streamed['num_points'] == len(wiggly_path)
+    assert streamed['max_curvature'] == full['max_curvature']
+    assert streamed['mean_curvature'] == pytest.approx(full['mean_curvature'], rel=1e-12)
+    assert streamed['violation_count'] == full['violation_count']
+    assert streamed['violation_percentage'] == pytest.approx(full['violation_percentage'])
+    assert streamed['violation_intervals'] == reference_intervals(full['curvature'], limit)
+
+
+def test_streaming_metrics_accept_uneven_chunks(wiggly_path):
+    full = curvature_metrics(wiggly_path)
+    limit = np.median(full['curvature'])
+    sizes = np.random.default_rng(1).integers(0, 40, 200)
+    cuts = np.cumsum(sizes)[np.cumsum(sizes) < len(wiggly_path)]
+    streamed = streaming_curvature_metrics(iter(np.split(wiggly_path, cuts)), limit)
+    assert streamed['violation_intervals'] == reference_intervals(full['curvature'], limit)
+    assert streamed['max_curvature'] == full['max_curvature']
+
+
+@pytest.mark.parametrize('chunk_size', [3, 7, 50])
+def test_violation_intervals_span_chunk_boundaries(wiggly_path, chunk_size):
+    full = curvature_metrics(wiggly_path)
+    limit = np.median(full['curvature'])
+    intervals = streaming_curvature_metrics(wiggly_path, limit, chunk_size=chunk_size)[
+        'violation_intervals']
+    # Runs are reported once, whole, even when chunks cut through them
+    spanning = [(start, end) for start, end, _ in intervals
+                if start // chunk_size != (end - 1) // chunk_size]
+    assert spanning
+    assert all(end < next_start for (_, end, _), (next_start, _, _) in zip(intervals, intervals[1:]))
+
+
+def test_streaming_metrics_of_a_lazy_fit(wiggly_path):
+    fit = get_method('cubic_spline', 'fit')(np.array(TEST_WAYPOINTS['zigzag'], dtype=float),
+                                            num_points=997)
+    streamed = streaming_curvature_metrics(fit, 0.01, chunk_size=100)
+    expected = streaming_curvature_metrics(wiggly_path, 0.01, chunk_size=100)
+    assert streamed['violation_intervals'] == expected['violation_intervals']
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from simulation.physics import calculate_curvature, calculate_curvature_nd, calculate_torsion
+
+
+def helix(radius=1.0, pitch=0.5, samples=2000, turns=3, scale=1.0):
+    # Curvature radius / (radius^2 + pitch^2), torsion pitch / (radius^2 + pitch^2)
+    t = np.linspace(0, 2 * np.pi * turns, samples)
+    return scale * np.column_stack((radius * np.cos(t), radius * np.sin(t), pitch * t))
+
+
+@pytest.mark.parametrize('scale', [1.0, 1e-4, 1e4])
+def test_helix_curvature_and_torsion(scale):
+    points = helix(scale=scale)
+    interior = slice(3, -3)
+    np.testing.assert_allclose(calculate_curvature_nd(points)[interior], 0.8 / scale, rtol=1e-4)
+    np.testing.assert_allclose(calculate_torsion(points)[interior], 0.4 / scale, rtol=1e-4)
+
+
+def test_dense_helix_is_not_treated_as_straight():
+    points = helix(samples=20000)
+    assert np.all(calculate_torsion(points)[3:-3] > 0.39)
+
+
+def test_batch_of_helices():
+    batch = np.stack((helix(), helix(pitch=-0.5)))
+    torsion = calculate_torsion(batch)
+    np.testing.assert_allclose(torsion[0, 3:-3], 0.4, rtol=1e-4)
+    np.testing.assert_allclose(torsion[1, 3:-3], -0.4, rtol=1e-4)
+    np.testing.assert_allclose(calculate_curvature_nd(batch)[:, 2:-2], 0.8, rtol=1e-4)
+
+
+def test_straight_line_has_no_curvature_or_torsion():
+    points = np.linspace([0.0, 0.0, 0.0], [3.0, -1.0, 2.0], 500)
+    assert np.all(calculate_curvature_nd(points) < 1e-9)
+    np.testing.assert_array_equal(calculate_torsion(points), 0.0)
+
+
+def test_nd_curvature_matches_planar_curvature():
+    t = np.linspace(0, 2 * np.pi, 300)
+    points = np.column_stack((3 * np.cos(t), np.sin(t)))
+    np.testing.assert_allclose(calculate_curvature_nd(points),
+                               calculate_curvature(points[:, 0], points[:, 1]), rtol=1e-9)
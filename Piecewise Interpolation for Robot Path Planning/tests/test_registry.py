@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+
+import interpolation
+from interpolation.registry import available_methods, get_method, method_info
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_package_import_loads_no_method():
+    code = ("import sys, interpolation, project_runner\n"
+            "loaded = [m for m in sys.modules if m.startswith('interpolation.')]\n"
+            "assert set(loaded) <= {'interpolation.registry', 'interpolation.path'}, loaded\n"
+            "interpolation.RouteGraph\n"
+            "assert 'interpolation.route_graph' in sys.modules\n")
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_lazy_exports_resolve():
+    for name in interpolation.__all__:
+        assert callable(getattr(interpolation, name))
+    assert interpolation.cubic_spline_fit is get_method('cubic_spline', 'fit').__wrapped__
+
+
+def test_capabilities():
+    assert available_methods(local=True) == ['akima', 'catmull_rom', 'pchip']
+    assert not method_info('b_spline')['local']
+    assert not method_info('newton')['incremental']
+    assert available_methods(batched=True) == ['cubic_spline', 'b_spline']
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from interpolation.route_graph import RouteGraph
+from utils import telemetry
+
+EDGES = {
+    ('A', 'B'): [[0, 0], [30, 8], [60, -5], [100, 0]],
+    ('B', 'C'): [[100, 0], [120, 30], [150, 80]],
+    ('C', 'D'): [[150, 80], [110, 110], [80, 105], [50, 120]],
+    ('B', 'D'): [[100, 0], [80, 60], [50, 120]],
+}
+
+
+def build_graph(**kwargs):
+    graph = RouteGraph(**kwargs)
+    for (start, end), waypoints in EDGES.items():
+        graph.add_edge(start, end, waypoints)
+    return graph
+
+
+def junction_jumps(path, k):
+    """Largest jump of the k-th derivative across the path's breakpoints."""
+    derivative = path.derivative(k) if k else path
+    widths = np.diff(path.breakpoints)[:-1]
+    left = np.einsum('pjd,pj->pd', derivative.coeffs[:-1],
+                     widths[:, None] ** np.arange(derivative.order))
+    right = derivative.coeffs[1:, 0]
+    return np.max(np.sqrt(np.sum((left - right)**2, axis=1)))
+
+
+@pytest.mark.parametrize('nodes', [['A', 'B', 'C', 'D'], ['A', 'B', 'D', 'C', 'B']])
+@pytest.mark.parametrize('k', [0, 1, 2])
+def test_route_is_c2_across_junctions(nodes, k):
+    path = build_graph().route(nodes)['path']
+    assert junction_jumps(path, k) < 2e-9
+
+
+@pytest.mark.parametrize('nodes', [['A', 'B', 'C', 'D'], ['D', 'B', 'C']])
+def test_reversed_route_traces_the_same_curve(nodes):
+    graph = build_graph()
+    forward = graph.route(nodes)
+    backward = graph.route(nodes[::-1])
+    start, end = forward['path'].domain
+    assert backward['path'].domain == pytest.approx((start, end))
+
+    t = np.linspace(start, end, 501)
+    np.testing.assert_allclose(backward['path'](end + start - t), forward['path'](t), atol=1e-9)
+    assert backward['length'] == pytest.approx(forward['length'], rel=1e-12)
+
+
+@pytest.mark.parametrize('blend_length', [None, 0.0, 5.0])
+def test_route_length_matches_the_curve(blend_length):
+    result = build_graph(blend_length=blend_length).route(['A', 'B', 'C', 'D'])
+    assert result['length'] == pytest.approx(result['path'].length(), rel=2e-3)
+    # Unit-speed edges make the domain close to the length
+    assert result['path'].domain[1] == pytest.approx(result['length'], rel=0.05)
+
+
+def test_cached_edges_are_not_refitted(monkeypatch):
+    graph = build_graph()
+    fitted = []
+    fit_edge = graph._fit_edge
+    monkeypatch.setattr(graph, '_fit_edge', lambda waypoints: fitted.append(1) or fit_edge(waypoints))
+
+    graph.route(['A', 'B', 'C'])
+    assert len(fitted) == 2
+    # Reversed edges reuse the forward fit
+    graph.route(['C', 'B', 'A'])
+    graph.route(['A', 'B', 'C', 'D'])
+    assert len(fitted) == 3
+
+    # Replacing an edge drops its fit in both directions
+    graph.add_edge('A', 'B', [[0, 0], [50, 20], [100, 0]])
+    graph.route(['B', 'A'])
+    assert len(fitted) == 4
+
+
+def test_edge_fits_and_cache_hits_are_counted():
+    telemetry.reset()
+    graph = build_graph().precompute()
+    fits = telemetry.counter('route_edge_fits_total').value(method='cubic_spline')
+    graph.route(['A', 'B', 'C', 'D'])
+    assert telemetry.counter('route_edge_fits_total').value(method='cubic_spline') == fits == 4
+    assert telemetry.counter('route_edge_cache_hits_total').value(method='cubic_spline') >= 3
+
+
+def test_invalid_routes_are_rejected():
+    graph = build_graph()
+    with pytest.raises(KeyError):
+        graph.route(['A', 'C'])
+    with pytest.raises(ValueError):
+        graph.route(['A'])
+    with pytest.raises(ValueError):
+        graph.add_edge('A', 'C', [[1, 1], [150, 80]])
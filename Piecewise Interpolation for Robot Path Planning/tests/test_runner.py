@@ -0,0 +1,126 @@
+import builtins
+import os
+
+import numpy as np
+import pytest
+
+import project_runner
+from project_runner import ProjectRunner, compute_path
+from utils import checkpoint
+from utils.waypoints import get_test_waypoints
+
+
+@pytest.fixture
+def runner(tmp_path):
+    runner = ProjectRunner(checkpoint_dir=str(tmp_path / 'checkpoints'),
+                           report_dir=str(tmp_path / 'report'))
+    runner.current_waypoints = get_test_waypoints()
+    return runner
+
+
+def test_directories_are_next_to_the_runner():
+    root = os.path.dirname(os.path.abspath(project_runner.__file__))
+    assert os.path.dirname(project_runner.CHECKPOINT_DIR) == root
+    assert os.path.dirname(project_runner.REPORT_DIR) == root
+
+
+def test_directories_are_created_on_first_write(runner, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ProjectRunner(checkpoint_dir='checkpoints', report_dir='report')
+    assert os.listdir(tmp_path) == []
+
+    runner.checkpointed('test', 'cubic_spline', None, lambda: 1)
+    assert os.listdir(tmp_path) == ['checkpoints']
+
+
+def test_checkpoint_key_tracks_the_implementation(runner, monkeypatch):
+    calls = []
+
+    def compute():
+        calls.append(None)
+        return len(calls)
+
+    assert runner.checkpointed('test', 'cubic_spline', None, compute) == 1
+    assert runner.checkpointed('test', 'cubic_spline', None, compute) == 1
+
+    # Simulate an edit of the method's source file
+    module = os.path.abspath(
+        os.path.join(os.path.dirname(project_runner.__file__), 'interpolation', 'cubic_spline.py'))
+    monkeypatch.setitem(checkpoint._source_hashes, module, 'edited')
+    assert runner.checkpointed('test', 'cubic_spline', None, compute) == 2
+    assert runner.checkpointed('test', 'newton', None, compute) == 3
+
+
+def test_no_cache_recomputes_and_stores_nothing(tmp_path):
+    runner = ProjectRunner(use_cache=False, checkpoint_dir=str(tmp_path / 'checkpoints'))
+    runner.current_waypoints = get_test_waypoints()
+    runner.checkpointed('test', 'cubic_spline', None, lambda: 1)
+    runner.save_results('test', {'value': 1})
+    assert runner.checkpoints.hits == 0
+    assert not os.path.exists(tmp_path / 'checkpoints')
+
+
+@pytest.fixture
+def headless(monkeypatch):
+    pytest.importorskip('termcolor')
+    matplotlib = pytest.importorskip('matplotlib')
+    matplotlib.use('Agg')
+    monkeypatch.setattr(builtins, 'input', lambda *args: '')
+    monkeypatch.setattr(ProjectRunner, 'clear_screen', lambda self: None)
+
+
+@pytest.mark.parametrize('method', ['newton', 'cubic_spline', 'b_spline', 'pchip'])
+def test_compute_path_prints_the_fitted_path(method, capsys):
+    compute_path(['--method', method, '--waypoints', 'complex', '--num-points', '7'])
+    rows = capsys.readouterr().out.splitlines()
+    path = np.array([[float(value) for value in row.split(',')] for row in rows])
+    waypoints = get_test_waypoints('complex')
+    assert path.shape == (7, 2)
+    assert np.allclose(path[[0, -1]], waypoints[[0, -1]], atol=1e-6)
+
+
+def test_method_tests_pass_for_every_method(runner, headless, capsys):
+    runner.test_implementations()
+    assert 'FAILED' not in capsys.readouterr().out
+
+
+def test_local_control_and_visualization_run_every_method(runner, headless, monkeypatch):
+    with np.errstate(all='ignore'):
+        runner.experiment_local_control()
+    metrics = runner.results['local_control']['metrics']
+    assert set(metrics) == set(project_runner.available_methods())
+
+    for choice in range(1, len(metrics) + 2):
+        answers = iter([str(choice)])
+        monkeypatch.setattr(builtins, 'input', lambda *args: next(answers, ''))
+        with np.errstate(all='ignore'):
+            runner.visualize_method()
+
+
+def run_session(checkpoint_dir, report_dir):
+    runner = ProjectRunner(checkpoint_dir=checkpoint_dir, report_dir=report_dir)
+    runner.current_waypoints = get_test_waypoints()
+    runner.restore_results()
+    runner.experiment_accuracy_smoothness()
+    runner.experiment_local_control()
+    runner.experiment_density()
+    runner.experiment_density_sweep()
+    runner.generate_report()
+    return runner
+
+
+def test_second_session_resumes_every_result(tmp_path, headless):
+    directories = str(tmp_path / 'checkpoints'), str(tmp_path / 'report')
+    report_files = lambda: {entry.name: entry.stat().st_mtime_ns
+                            for entry in os.scandir(directories[1])
+                            if entry.name.endswith(('.csv', '.png'))}
+    with np.errstate(all='ignore'):
+        first = run_session(*directories)
+        written = report_files()
+        second = run_session(*directories)
+
+    assert first.checkpoints.hits == 0 and first.checkpoints.misses > 0
+    assert second.checkpoints.misses == 0
+    assert second.checkpoints.hits == first.checkpoints.misses
+    assert set(second.results) == set(first.results)
+    assert written and report_files() == written
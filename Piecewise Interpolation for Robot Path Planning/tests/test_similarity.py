@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from config import TEST_WAYPOINTS
+from interpolation.cubic_spline import cubic_spline_fit
+from utils.similarity import (PathIndex, deduplicate_paths, discrete_frechet_distance,
+                              hausdorff_distance, resample_paths)
+
+
+def horizontal(y, x0=10.2, length=100.0, n=20):
+    return np.column_stack((np.linspace(x0, x0 + length, n), np.full(n, y)))
+
+
+def test_hausdorff_distance_of_known_sets():
+    p = np.array([[0.0, 0.0], [1.0, 0.0]])
+    q = np.array([[0.0, 1.0], [1.0, 1.0], [5.0, 1.0]])
+    assert hausdorff_distance(p, q) == pytest.approx(np.sqrt(17))
+    assert hausdorff_distance(q, p) == pytest.approx(np.sqrt(17))
+    assert hausdorff_distance(p, p) == 0.0
+
+
+def test_hausdorff_distance_ignores_order_unlike_frechet():
+    path = cubic_spline_fit(np.array(TEST_WAYPOINTS['zigzag'], dtype=float)).to_array()
+    backwards = path[::-1]
+    assert hausdorff_distance(path, backwards) == 0.0
+    assert discrete_frechet_distance(path, backwards) > 10.0
+
+    shuffled = np.random.default_rng(0).permutation(path)
+    other = path + [0.5, -0.25]
+    assert hausdorff_distance(shuffled, other) == pytest.approx(hausdorff_distance(path, other))
+    assert hausdorff_distance(path, other) <= discrete_frechet_distance(path, other) + 1e-12
+
+
+def test_hausdorff_distance_batches_broadcast():
+    rng = np.random.default_rng(1)
+    p, q = rng.normal(size=(4, 10, 2)), rng.normal(size=(4, 7, 2))
+    expected = [hausdorff_distance(a, b) for a, b in zip(p, q)]
+    np.testing.assert_allclose(hausdorff_distance(p, q), expected)
+    np.testing.assert_allclose(hausdorff_distance(p, q[0]), [hausdorff_distance(a, q[0]) for a in p])
+
+
+# With tolerance 1 the cells are 4 units wide, and the second grid is
+# offset by half a cell: its boundaries lie at y = 2, 6, 10, ...
+@pytest.mark.parametrize('y0, y1', [(7.9, 8.1),    # across a boundary of the first grid
+                                    (5.9, 6.1)])   # across a boundary of the second grid
+def test_index_catches_duplicates_across_either_grid_boundary(y0, y1):
+    index = PathIndex(tolerance=1.0)
+    first, second = (index._signatures(resample_paths(horizontal(y), index.num_samples))
+                     for y in (y0, y1))
+    assert sum(a == b for a, b in zip(first, second)) == 1
+
+    assert index.add('a', horizontal(y0)) == 'a'
+    assert index.add('b', horizontal(y1)) == 'a'
+    assert index.comparisons == 1
+
+
+def test_index_only_compares_paths_in_shared_buckets():
+    index = PathIndex(tolerance=1.0)
+    index.add('a', horizontal(9.0))
+    # Different buckets in both grids: kept without an exact comparison
+    assert index.add('far', horizontal(30.0)) == 'far'
+    assert index.comparisons == 0
+    # Same bucket of the first grid but beyond tolerance: compared and kept
+    assert index.add('near', horizontal(10.5)) == 'near'
+    assert index.comparisons == 1
+
+
+def test_index_rejects_unknown_metric():
+    with pytest.raises(ValueError):
+        PathIndex(1.0, metric='euclidean')
+
+
+@pytest.mark.parametrize('metric', ['frechet', 'hausdorff'])
+def test_deduplicate_paths_groups_and_counts(metric):
+    waypoints = np.array(TEST_WAYPOINTS['complex'], dtype=float)
+    base = cubic_spline_fit(waypoints).to_array()
+    paths = {
+        'base': base,
+        'fit': cubic_spline_fit(waypoints, num_points=250),
+        'line': horizontal(300.0, length=400.0),
+        'nudged': base + 0.05,
+        'line_copy': horizontal(300.02, length=400.0, n=37),
+    }
+    result = deduplicate_paths(paths, tolerance=0.5, metric=metric)
+
+    assert list(result['unique']) == ['base', 'line']
+    assert result['unique']['line'] is paths['line']
+    assert result['groups'] == {'base': ['base', 'fit', 'nudged'], 'line': ['line', 'line_copy']}
+    assert result['representative'] == {'base': 'base', 'fit': 'base', 'line': 'line',
+                                        'nudged': 'base', 'line_copy': 'line'}
+    assert result['duplicates'] == 3
+    assert result['comparisons'] == 3
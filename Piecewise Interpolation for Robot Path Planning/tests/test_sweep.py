@@ -0,0 +1,34 @@
+import numpy as np
+
+from config import TEST_WAYPOINTS
+from interpolation.registry import available_methods, get_method
+from utils.sweep import density_sweep, resample_densities
+
+FACTORS = [0.5, 1.0, 1.5, 2.0, 3.0]
+
+
+def test_sweep_covers_all_methods_in_one_call():
+    waypoints = np.array(TEST_WAYPOINTS['dense_curve'], dtype=float)
+    sweep = density_sweep(waypoints, FACTORS, max_deviation=9.0)
+    assert list(sweep['curve']) == available_methods()
+    for records in sweep['curve'].values():
+        assert [r['factor'] for r in records] == FACTORS
+        assert all(np.isfinite(r['max_deviation']) for r in records)
+
+
+def test_cheapest_is_fewest_waypoints_meeting_budget():
+    waypoints = np.array(TEST_WAYPOINTS['dense_curve'], dtype=float)
+    sweep = density_sweep(waypoints, FACTORS, ['cubic_spline', 'akima'], max_deviation=9.0)
+    for method, records in sweep['curve'].items():
+        meeting = [r for r in records if r['max_deviation'] <= 9.0]
+        fewest = min(r['num_waypoints'] for r in meeting)
+        chosen = next(r for r in records if r['factor'] == sweep['cheapest'][method])
+        assert chosen['num_waypoints'] == fewest
+
+
+def test_batched_and_fitted_paths_agree():
+    waypoints = np.array(TEST_WAYPOINTS['zigzag'], dtype=float)
+    sets = resample_densities(waypoints, [2.0])[2.0]
+    batch = get_method('cubic_spline', 'batch')(sets, num_points=50)
+    fit = get_method('cubic_spline', 'fit')(sets[0], num_points=50)
+    np.testing.assert_allclose(batch[0], fit.to_array(), atol=1e-8)
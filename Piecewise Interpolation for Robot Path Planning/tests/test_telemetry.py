@@ -0,0 +1,112 @@
+import json
+import time
+
+import numpy as np
+import pytest
+
+from config import TEST_WAYPOINTS
+from interpolation.registry import get_method
+from project_runner import compute_path
+from utils import telemetry
+
+
+@pytest.fixture(autouse=True)
+def clean_telemetry():
+    telemetry.reset()
+    yield
+    telemetry.reset()
+
+
+def metric_lines(name):
+    """Lines of the Prometheus export that belong to one metric."""
+    return [line for line in telemetry.to_prometheus().splitlines()
+            if (line.split()[2] if line.startswith('#') else line).startswith(name)]
+
+
+def test_prometheus_text_format():
+    telemetry.counter('test_requests_total', 'Requests').inc(3, method='a"b')
+    telemetry.gauge('test_level', 'Level').set(2.5)
+
+    assert metric_lines('test_requests_total') == [
+        '# HELP test_requests_total Requests',
+        '# TYPE test_requests_total counter',
+        'test_requests_total{method="a\\"b"} 3',
+    ]
+    assert metric_lines('test_level') == [
+        '# HELP test_level Level',
+        '# TYPE test_level gauge',
+        'test_level 2.5',
+    ]
+    assert telemetry.to_prometheus().endswith('\n')
+
+
+def test_histogram_buckets_are_cumulative_and_inclusive():
+    histogram = telemetry.histogram('test_seconds', 'Durations', buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value, kind='fit')
+
+    assert metric_lines('test_seconds') == [
+        '# HELP test_seconds Durations',
+        '# TYPE test_seconds histogram',
+        'test_seconds_bucket{kind="fit",le="0.1"} 2',
+        'test_seconds_bucket{kind="fit",le="1.0"} 3',
+        'test_seconds_bucket{kind="fit",le="+Inf"} 4',
+        'test_seconds_sum{kind="fit"} 2.65',
+        'test_seconds_count{kind="fit"} 4',
+    ]
+    assert histogram.count(kind='fit') == 4
+
+
+def test_metric_type_conflicts_are_rejected():
+    telemetry.counter('test_conflict_total')
+    with pytest.raises(ValueError, match='counter'):
+        telemetry.gauge('test_conflict_total')
+
+
+def test_disabled_telemetry_records_nothing(monkeypatch):
+    waypoints = np.array(TEST_WAYPOINTS['complex'], dtype=float)
+    latency = telemetry.histogram('interpolation_latency_seconds')
+
+    get_method('cubic_spline', 'fit')(waypoints)
+    assert latency.count(method='cubic_spline', kind='fit') == 1
+
+    monkeypatch.setattr(telemetry, 'enabled', False)
+    get_method('cubic_spline', 'fit')(waypoints)
+    assert latency.count(method='cubic_spline', kind='fit') == 1
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_periodic_exporter_writes_while_running_and_on_stop(tmp_path):
+    counter = telemetry.counter('test_exports_total')
+    filename = tmp_path / 'metrics.prom'
+    with telemetry.PeriodicExporter(str(filename), interval=0.01):
+        wait_for(filename.exists)
+        counter.inc()
+    assert 'test_exports_total 1' in filename.read_text()
+    assert not (tmp_path / 'metrics.prom.tmp').exists()
+
+
+def test_periodic_exporter_appends_json_lines(tmp_path):
+    filename = tmp_path / 'metrics.jsonl'
+    exporter = telemetry.PeriodicExporter(str(filename), interval=0.01, format='jsonl').start()
+    wait_for(lambda: filename.exists() and len(filename.read_text().splitlines()) >= 2)
+    exporter.stop()
+    snapshots = [json.loads(line) for line in filename.read_text().splitlines()]
+    assert all('metrics' in snapshot for snapshot in snapshots)
+
+    with pytest.raises(ValueError):
+        telemetry.PeriodicExporter(str(filename), format='xml')
+
+
+def test_compute_path_exports_telemetry(tmp_path, capsys):
+    filename = tmp_path / 'cli.prom'
+    compute_path(['--method', 'akima', '--num-points', '5', '--telemetry', str(filename),
+                  '--telemetry-interval', '0.01'])
+    assert len(capsys.readouterr().out.splitlines()) == 5
+    assert 'interpolation_latency_seconds_count{kind="fit",method="akima"} 1' in filename.read_text()
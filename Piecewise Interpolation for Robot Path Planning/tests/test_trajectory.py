@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from config import TEST_WAYPOINTS
+from interpolation.cubic_spline import cubic_spline_fit
+from simulation.physics import calculate_curvature
+from simulation.trajectory import time_optimal_velocity_profile
+
+
+def line(length, n=2001):
+    return np.column_stack((np.linspace(0, length, n), np.zeros(n)))
+
+
+@pytest.mark.parametrize('length, duration', [(100.0, 20.0), (150.0, 25.0)])
+def test_straight_line_accelerates_cruises_and_brakes(length, duration):
+    # 10 s to reach v_max = 10 at 1 m/s^2 over 50 m, the same to stop
+    profile = time_optimal_velocity_profile(line(length), v_max=10.0, a_lat_max=1.0,
+                                            a_lon_max=1.0)
+    assert profile['duration'] == pytest.approx(duration, rel=1e-3)
+    assert profile['velocity'].max() == pytest.approx(10.0)
+    np.testing.assert_array_equal(profile['curvature'], 0.0)
+
+
+def test_circle_speed_is_bound_by_lateral_acceleration():
+    radius, a_lat = 10.0, 2.0
+    angle = np.linspace(0, 2 * np.pi, 2001)
+    circle = radius * np.column_stack((np.cos(angle), np.sin(angle)))
+    limit = np.sqrt(a_lat * radius)
+
+    profile = time_optimal_velocity_profile(circle, v_max=10.0, a_lat_max=a_lat, a_lon_max=1.0,
+                                            v_start=limit, v_end=limit)
+    # One-sided differences make the curvature less accurate next to the ends
+    np.testing.assert_allclose(profile['velocity'][2:-2], limit, rtol=1e-4)
+    assert profile['duration'] == pytest.approx(2 * np.pi * radius / limit, rel=1e-4)
+
+
+@pytest.mark.parametrize('name', ['complex', 'zigzag', 'sharp_turns'])
+def test_profile_respects_every_limit(name):
+    path = cubic_spline_fit(np.array(TEST_WAYPOINTS[name], dtype=float), num_points=400).to_array()
+    v_max, a_lat, a_lon, a_dec = 8.0, 3.0, 1.5, 2.5
+    profile = time_optimal_velocity_profile(path, v_max, a_lat, a_lon, a_dec,
+                                            v_start=1.0, v_end=0.5)
+    velocity = profile['velocity']
+    curvature = calculate_curvature(path[:, 0], path[:, 1])
+
+    assert velocity[0] == pytest.approx(1.0)
+    assert velocity[-1] == pytest.approx(0.5)
+    assert np.all(velocity <= v_max + 1e-9)
+    assert np.all(velocity**2 * curvature <= a_lat * (1 + 1e-9))
+    # Forward pass bounds acceleration, backward pass bounds deceleration
+    assert np.all(profile['acceleration'] <= a_lon * (1 + 1e-9))
+    assert np.all(profile['acceleration'] >= -a_dec * (1 + 1e-9))
+    assert np.all(np.diff(profile['time']) >= 0)
+
+
+def test_batch_matches_single_paths():
+    paths = np.stack([cubic_spline_fit(np.array(TEST_WAYPOINTS[name], dtype=float)).to_array()
+                      for name in ('complex', 'zigzag')])
+    batch = time_optimal_velocity_profile(paths, 8.0, 3.0, 1.5)
+    for i, path in enumerate(paths):
+        single = time_optimal_velocity_profile(path, 8.0, 3.0, 1.5)
+        np.testing.assert_allclose(batch['velocity'][i], single['velocity'])
+        assert batch['duration'][i] == pytest.approx(single['duration'])
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from utils.waypoints import generate_waypoint_batch, spawn_generators
+
+FAMILIES = ['uniform', 'corridor', 'loop', 'switchback']
+
+
+@pytest.mark.parametrize('family', FAMILIES)
+def test_same_seed_gives_same_batch(family):
+    first, second = (generate_waypoint_batch(spawn_generators(7, 2)[1], 10, 9, family)
+                     for _ in range(2))
+    np.testing.assert_array_equal(first, second)
+    other = generate_waypoint_batch(spawn_generators(8, 2)[1], 10, 9, family)
+    assert not np.array_equal(first, other)
+
+
+@pytest.mark.parametrize('family', FAMILIES)
+@pytest.mark.parametrize('num_points', [2, 3, 5, 8, 11])
+def test_no_consecutive_duplicate_waypoints(family, num_points):
+    batch = generate_waypoint_batch(np.random.default_rng(num_points), 200, num_points, family)
+    assert batch.shape == (200, num_points, 2)
+    steps = np.sqrt(np.sum(np.diff(batch, axis=1)**2, axis=-1))
+    assert np.all(steps > 1e-6)
+
+
+@pytest.mark.parametrize('num_points', [5, 7])
+def test_switchback_rows_climb_through_the_range(num_points):
+    batch = generate_waypoint_batch(np.random.default_rng(0), 1, num_points, 'switchback',
+                                    x_range=(0, 1), y_range=(0, 1), noise=0.0)[0]
+    rows = (num_points + 1) // 2
+    np.testing.assert_allclose(batch[::2, 1], np.arange(rows) / (rows - 1))
+    assert batch[-1, 1] == 1.0
@@ -0,0 +1,280 @@
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sys
+
+import numpy as np
+
+from utils import telemetry
+
+_hits = telemetry.counter('checkpoint_hits_total', 'Results loaded from checkpoints')
+_misses = telemetry.counter('checkpoint_misses_total', 'Results computed and checkpointed')
+
+# Modules whose source is part of an implementation hash live under this directory
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_source_hashes = {}
+
+
+def _update_hash(digest, value):
+    """Feed a value into a hash in a canonical, type-tagged form."""
+    if isinstance(value, dict):
+        digest.update(b'd%d' % len(value))
+        for key in sorted(value, key=repr):
+            _update_hash(digest, key)
+            _update_hash(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(b'l%d' % len(value))
+        for item in value:
+            _update_hash(digest, item)
+    elif isinstance(value, (np.ndarray, np.generic)) or hasattr(value, '__array__'):
+        array = np.ascontiguousarray(np.asarray(value))
+        digest.update(f'a{array.dtype.str}{array.shape}'.encode())
+        digest.update(array.tobytes())
+    else:
+        digest.update(f'{type(value).__name__}:{value!r}'.encode())
+
+
+def content_hash(*values):
+    """
+    Hash of the content of the given values.
+
+    Arrays are hashed by dtype, shape and data; dicts, lists and tuples by
+    their items; everything else by its repr. Equal inputs always give the
+    same hash, across runs and processes.
+
+    Returns:
+        str: Hexadecimal SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    _update_hash(digest, values)
+    return digest.hexdigest()
+
+
+def _project_modules(module, found):
+    """Collect the project modules reachable from a module through its globals."""
+    filename = getattr(module, '__file__', None)
+    if (module.__name__ in found or not filename
+            or not os.path.abspath(filename).startswith(PROJECT_ROOT + os.sep)):
+        return
+    found[module.__name__] = os.path.abspath(filename)
+    for value in list(vars(module).values()):
+        _referenced_modules(value, found)
+
+
+def _referenced_modules(value, found):
+    """Collect the project modules of a module, function or class and what they refer to."""
+    if inspect.ismodule(value):
+        _project_modules(value, found)
+    elif isinstance(getattr(value, '__module__', None), str) and value.__module__ in sys.modules:
+        _project_modules(sys.modules[value.__module__], found)
+
+
+def implementation_hash(*functions):
+    """
+    Hash of the code behind the given functions.
+
+    Covers the source file of every function's module and of every project
+    module reachable from it through module-level names or the function's
+    closure (imported functions, classes and modules), so editing a method
+    or a helper it calls changes the hash. Functions outside the project's
+    files are hashed by their code object. Sources are read once per
+    process.
+
+    Returns:
+        str: Hexadecimal SHA-256 digest
+    """
+    modules = {}
+    code = []
+    for function in functions:
+        function = inspect.unwrap(function)
+        module = sys.modules.get(getattr(function, '__module__', None) or '')
+        if module is not None:
+            _project_modules(module, modules)
+        for cell in getattr(function, '__closure__', None) or ():
+            try:
+                _referenced_modules(cell.cell_contents, modules)
+            except ValueError:
+                pass  # empty cell
+        if module is None or module.__name__ not in modules:
+            function_code = getattr(function, '__code__', None)
+            if function_code is not None:
+                code.append((function_code.co_code, repr(function_code.co_consts)))
+
+    sources = []
+    for filename in sorted(modules.values()):
+        if filename not in _source_hashes:
+            with open(filename, 'rb') as f:
+                _source_hashes[filename] = hashlib.sha256(f.read()).hexdigest()
+        sources.append((os.path.relpath(filename, PROJECT_ROOT), _source_hashes[filename]))
+    return content_hash(sources, code)
+
+
+def _atomic_write(filename, data, mode='wb'):
+    """Write a file through a temporary file and os.replace, so it is never partial."""
+    temporary = f'{filename}.{os.getpid()}.tmp'
+    with open(temporary, mode) as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, filename)
+
+
+class CheckpointStore:
+    """
+    Directory of pickled results keyed by a content hash of their inputs.
+
+    Each result is written atomically as soon as it is computed, so an
+    interrupted run loses at most the result in progress, and a restarted
+    run loads every completed result instead of recomputing it. The
+    directory is only created by the first save. A disabled store never
+    loads or saves anything, so every result is recomputed.
+    """
+
+    def __init__(self, directory='checkpoints', enabled=True):
+        self.directory = directory
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def _filename(self, key):
+        return os.path.join(self.directory, f'{key}.pkl')
+
+    def __contains__(self, key):
+        return self.enabled and os.path.exists(self._filename(key))
+
+    def load(self, key, default=None):
+        """Return the result stored under key, or default if there is none."""
+        if not self.enabled:
+            return default
+        try:
+            with open(self._filename(key), 'rb') as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return default
+
+    def save(self, key, value):
+        """Store a result under key, replacing the file atomically."""
+        if not self.enabled:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        _atomic_write(self._filename(key), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def get_or_compute(self, key, compute):
+        """
+        Load the result stored under key, or compute and store it.
+
+        Returns:
+            tuple: (result, whether it was loaded from the checkpoint)
+        """
+        missing = object()
+        value = self.load(key, missing)
+        if value is not missing:
+            self.hits += 1
+            if telemetry.enabled:
+                _hits.inc()
+            return value, True
+
+        value = compute()
+        self.save(key, value)
+        self.misses += 1
+        if telemetry.enabled:
+            _misses.inc()
+        return value, False
+
+
+class IncrementalReport:
+    """
+    Report directory that only rewrites the files whose inputs changed.
+
+    A manifest maps every CSV row and figure to the hash of its inputs.
+    A CSV is rewritten when a row is added, removed or changed, keeping the
+    text of unchanged rows; a figure is only redrawn when its hash differs
+    from the manifest or the file is missing. The manifest is saved after
+    every written file, so an interrupted report keeps what it finished.
+    With rewrite, the manifest is ignored and every file is written. The
+    directory is only created by the first write.
+    """
+
+    MANIFEST = 'manifest.json'
+
+    def __init__(self, directory='report_data', rewrite=False):
+        self.directory = directory
+        self.written = []
+        self.unchanged = []
+        self.manifest = {}
+        if not rewrite:
+            try:
+                with open(os.path.join(directory, self.MANIFEST)) as f:
+                    self.manifest = json.load(f)
+            except (OSError, ValueError):
+                pass
+
+    def _path(self, name):
+        os.makedirs(self.directory, exist_ok=True)
+        return os.path.join(self.directory, name)
+
+    def write_csv(self, name, header, rows):
+        """
+        Write a CSV file from rows with unique keys.
+
+        Args:
+            name (str): File name inside the report directory
+            header (str): Header line without newline
+            rows (list): (row key, inputs, format) tuples, where format()
+                returns the row text without newline; it is only called for
+                rows whose inputs changed
+        """
+        previous = self.manifest.get(name, {})
+        existing = {}
+        if os.path.exists(self._path(name)):
+            with open(self._path(name)) as f:
+                lines = f.read().splitlines()[1:]
+            existing = dict(zip(previous.get('keys', []), lines))
+
+        hashes = [content_hash(inputs) for _, inputs, _ in rows]
+        keys = [str(key) for key, _, _ in rows]
+        if (keys == previous.get('keys') and hashes == previous.get('hashes')
+                and len(existing) == len(keys)):
+            self.unchanged.append(name)
+            return
+
+        old_hashes = dict(zip(previous.get('keys', []), previous.get('hashes', [])))
+        lines = [existing[key] if key in existing and old_hashes.get(key) == digest else format()
+                 for key, digest, (_, _, format) in zip(keys, hashes, rows)]
+        _atomic_write(self._path(name), '\n'.join([header] + lines) + '\n', mode='w')
+        self.manifest[name] = {'keys': keys, 'hashes': hashes}
+        self.written.append(name)
+        self.save_manifest()
+
+    def write_figure(self, name, inputs, draw, dpi=300):
+        """
+        Save the figure returned by draw() unless its inputs are unchanged.
+
+        Args:
+            name (str): File name inside the report directory
+            inputs: Data the figure is drawn from, hashed with content_hash
+            draw (callable): Function returning a matplotlib figure
+            dpi (int): Resolution of the saved image
+        """
+        digest = content_hash(inputs)
+        if self.manifest.get(name) == digest and os.path.exists(self._path(name)):
+            self.unchanged.append(name)
+            return
+
+        import matplotlib.pyplot as plt
+        fig = draw()
+        root, extension = os.path.splitext(self._path(name))
+        temporary = f'{root}.{os.getpid()}.tmp{extension}'
+        fig.savefig(temporary, dpi=dpi)
+        plt.close(fig)
+        os.replace(temporary, self._path(name))
+        self.manifest[name] = digest
+        self.written.append(name)
+        self.save_manifest()
+
+    def save_manifest(self):
+        """Write the manifest (done after every written file)."""
+        _atomic_write(self._path(self.MANIFEST), json.dumps(self.manifest, indent=1), mode='w')
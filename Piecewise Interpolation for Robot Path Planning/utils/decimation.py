@@ -0,0 +1,237 @@
+import heapq
+import functools
+import numpy as np
+
+
+def point_segment_distances(points, seg_start, seg_end):
+    """
+    Distance from each point to the matching line segment.
+
+    Args:
+        points (numpy.ndarray): Array of points, shape (n, d)
+        seg_start (numpy.ndarray): Segment start points, shape (n, d) or (d,)
+        seg_end (numpy.ndarray): Segment end points, shape (n, d) or (d,)
+
+    Returns:
+        numpy.ndarray: Distance of each point to its segment
+    """
+    seg = seg_end - seg_start
+    seg_len_sq = np.sum(seg**2, axis=-1)
+    rel = points - seg_start
+
+    # Project onto the segment, clamping to its end points
+    safe_len_sq = np.where(seg_len_sq > 0, seg_len_sq, 1.0)
+    u = np.clip(np.sum(rel * seg, axis=-1) / safe_len_sq, 0.0, 1.0)
+    u = np.where(seg_len_sq > 0, u, 0.0)
+
+    closest = seg_start + u[..., None] * seg
+    return np.sqrt(np.sum((points - closest)**2, axis=-1))
+
+
+def decimation_deviation(waypoints, kept_indices):
+    """
+    Maximum distance from the original waypoints to a simplified polyline.
+
+    Args:
+        waypoints (numpy.ndarray): Original waypoints
+        kept_indices (numpy.ndarray): Sorted indices of the retained waypoints
+
+    Returns:
+        numpy.ndarray: Distance of each original waypoint to the segment of
+        the simplified polyline that replaced it (0 for retained points)
+    """
+    waypoints = np.asarray(waypoints, dtype=float)
+    kept_indices = np.asarray(kept_indices)
+
+    # Segment of the simplified polyline covering each original point
+    segment = np.searchsorted(kept_indices, np.arange(len(waypoints)), side='right') - 1
+    segment = np.clip(segment, 0, max(len(kept_indices) - 2, 0))
+
+    start = waypoints[kept_indices[segment]]
+    end = waypoints[kept_indices[np.minimum(segment + 1, len(kept_indices) - 1)]]
+
+    return point_segment_distances(waypoints, start, end)
+
+
+def douglas_peucker(waypoints, tolerance):
+    """
+    Simplify a polyline with the Douglas-Peucker algorithm.
+
+    Runs iteratively with an explicit stack; the distances of every point in
+    a span to its chord are computed in one vectorized step.
+
+    Args:
+        waypoints (numpy.ndarray): Waypoints, shape (n, d)
+        tolerance (float): Maximum allowed distance of a removed waypoint
+            from the simplified polyline
+
+    Returns:
+        numpy.ndarray: Sorted indices of the retained waypoints
+    """
+    waypoints = np.asarray(waypoints, dtype=float)
+    n = len(waypoints)
+    if n < 3:
+        return np.arange(n)
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+
+        distances = point_segment_distances(waypoints[first + 1:last],
+                                            waypoints[first], waypoints[last])
+        split = np.argmax(distances)
+        if distances[split] > tolerance:
+            split += first + 1
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+
+    return np.flatnonzero(keep)
+
+
+def visvalingam_whyatt(waypoints, tolerance):
+    """
+    Simplify a polyline with the Visvalingam-Whyatt algorithm.
+
+    Repeatedly removes the waypoint whose triangle with its neighbours has
+    the smallest area, using a heap with lazy invalidation. Removal stops
+    once the smallest effective area exceeds ``tolerance**2 / 2``, which is
+    the area of a triangle of height ``tolerance`` on a base of length
+    ``tolerance``.
+
+    An area threshold does not bound the distance of a removed point (a
+    long thin triangle has a small area), so the farthest out-of-tolerance
+    point of every simplified segment is then reinserted until no removed
+    waypoint is farther than ``tolerance`` from the result, as with
+    Douglas-Peucker.
+
+    Args:
+        waypoints (numpy.ndarray): Waypoints, shape (n, 2)
+        tolerance (float): Maximum allowed distance of a removed waypoint
+            from the simplified polyline
+
+    Returns:
+        numpy.ndarray: Sorted indices of the retained waypoints
+    """
+    waypoints = np.asarray(waypoints, dtype=float)
+    n = len(waypoints)
+    if n < 3:
+        return np.arange(n)
+
+    def area(i, j, k):
+        a, b, c = waypoints[i], waypoints[j], waypoints[k]
+        return 0.5 * abs((b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1]))
+
+    prev = np.arange(-1, n - 1)
+    nxt = np.arange(1, n + 1)
+    removed = np.zeros(n, dtype=bool)
+
+    # Initial areas for all interior points in one vectorized step
+    a, b, c = waypoints[:-2], waypoints[1:-1], waypoints[2:]
+    areas = 0.5 * np.abs((b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) -
+                         (c[:, 0] - a[:, 0]) * (b[:, 1] - a[:, 1]))
+    current = np.full(n, np.inf)
+    current[1:-1] = areas
+    heap = [(areas[i], i + 1) for i in range(n - 2)]
+    heapq.heapify(heap)
+
+    threshold = 0.5 * tolerance**2
+    max_area = 0.0
+
+    while heap:
+        point_area, i = heapq.heappop(heap)
+        if removed[i] or point_area != current[i]:
+            continue  # stale entry
+        if point_area > threshold:
+            break
+
+        removed[i] = True
+        # Effective area never decreases, so no later removal looks cheaper
+        max_area = max(max_area, point_area)
+        p, q = prev[i], nxt[i]
+        nxt[p] = q
+        prev[q] = p
+
+        for j in (p, q):
+            if 0 < j < n - 1:
+                current[j] = max(area(prev[j], j, nxt[j]), max_area)
+                heapq.heappush(heap, (current[j], j))
+
+    kept = np.flatnonzero(~removed)
+    while True:
+        deviations = decimation_deviation(waypoints, kept)
+        over = np.flatnonzero(deviations > tolerance)
+        if len(over) == 0:
+            return kept
+
+        # Reinsert the farthest violating point of every simplified segment
+        segment = np.searchsorted(kept, over) - 1
+        order = np.lexsort((-deviations[over], segment))
+        first = np.concatenate(([True], np.diff(segment[order]) != 0))
+        kept = np.union1d(kept, over[order][first])
+
+
+DECIMATION_METHODS = {
+    'douglas_peucker': douglas_peucker,
+    'visvalingam_whyatt': visvalingam_whyatt,
+}
+
+
+def decimate_waypoints(waypoints, tolerance, method='douglas_peucker'):
+    """
+    Remove redundant waypoints before interpolation.
+
+    Args:
+        waypoints (numpy.ndarray): Waypoints, shape (n, d)
+        tolerance (float): Geometric tolerance of the decimation
+        method (str): 'douglas_peucker' or 'visvalingam_whyatt'
+
+    Returns:
+        dict: Dictionary with decimation results:
+            - waypoints: Retained waypoints
+            - indices: Indices of the retained waypoints in the input
+            - max_deviation: Maximum distance of any removed waypoint from
+              the simplified polyline (at most ``tolerance``)
+            - reduction: Ratio of input to output waypoint count
+    """
+    if method not in DECIMATION_METHODS:
+        raise ValueError(f"Unknown decimation method '{method}'")
+
+    waypoints = np.asarray(waypoints, dtype=float)
+    indices = DECIMATION_METHODS[method](waypoints, tolerance)
+    deviations = decimation_deviation(waypoints, indices)
+
+    return {
+        'waypoints': waypoints[indices],
+        'indices': indices,
+        'max_deviation': float(np.max(deviations)) if len(deviations) else 0.0,
+        'reduction': len(waypoints) / max(len(indices), 1)
+    }
+
+
+def with_decimation(method_func, tolerance, method='douglas_peucker'):
+    """
+    Wrap an interpolation function with a decimation pre-stage.
+
+    The returned function accepts the same arguments as ``method_func`` and
+    records the result of the last decimation in its ``last_decimation``
+    attribute.
+
+    Example:
+        >>> smooth = with_decimation(cubic_spline_interpolate, tolerance=2.0)
+        >>> path = smooth(route, num_points=200)
+        >>> smooth.last_decimation['max_deviation']
+    """
+    @functools.wraps(method_func)
+    def decimated(waypoints, *args, **kwargs):
+        result = decimate_waypoints(waypoints, tolerance, method)
+        decimated.last_decimation = result
+        return method_func(result['waypoints'], *args, **kwargs)
+
+    decimated.last_decimation = None
+    return decimated
@@ -0,0 +1,186 @@
+import numpy as np
+
+from interpolation.b_spline import averaged_knot_vector
+from interpolation.cubic_spline import spline_coefficients
+from interpolation.hermite import catmull_rom_tangents, hermite_coefficients
+from interpolation.path import PiecewisePolynomial
+from interpolation.evaluation import (
+    bspline_basis_matrix,
+    b_spline_evaluation_matrix,
+    cubic_spline_evaluation_matrix
+)
+from utils.waypoints import chord_length_parameter
+
+
+def polynomial_influence(waypoints, num_points=100):
+    """
+    Influence matrix of Newton/Lagrange interpolation of the graph y(x).
+
+    Column i holds the Lagrange basis polynomial L_i at the path's x
+    values, evaluated in barycentric form for all columns at once.
+
+    Returns:
+        numpy.ndarray: Dense matrix of shape (num_points, n)
+    """
+    x = np.asarray(waypoints, dtype=float)[:, 0]
+    x_eval = np.linspace(x.min(), x.max(), num_points)
+
+    diff = x[:, None] - x[None, :]
+    np.fill_diagonal(diff, 1.0)
+    weights = 1.0 / np.prod(diff, axis=1)
+
+    offsets = x_eval[:, None] - x[None, :]
+    on_node = offsets == 0
+    offsets[on_node] = 1.0
+    terms = weights / offsets
+    influence = terms / np.sum(terms, axis=1, keepdims=True)
+
+    # Rows that fall exactly on a node reproduce that waypoint
+    rows = np.any(on_node, axis=1)
+    influence[rows] = on_node[rows]
+    return influence
+
+
+def cubic_spline_influence(waypoints, num_points=100):
+    """
+    Influence matrix of the natural cubic spline over chord length.
+
+    The spline coefficients of all n unit waypoint vectors come from a
+    single multi-RHS solve, and the cached evaluation matrix maps them to
+    the path samples.
+
+    Returns:
+        numpy.ndarray: Dense matrix of shape (num_points, n)
+    """
+    t = chord_length_parameter(waypoints)
+    n = len(t)
+    a, b, c, d = spline_coefficients(t, np.eye(n))
+    # Same [a0, b0, c0, d0, a1, ...] layout as the evaluation matrix
+    coeffs = np.stack((a, b, c, d), axis=1).reshape(4 * (n - 1), n)
+    return cubic_spline_evaluation_matrix(t, num_points) @ coeffs
+
+
+def b_spline_influence(waypoints, num_points=100, degree=3):
+    """
+    Influence matrix of B-spline interpolation over chord length.
+
+    The control points of all n unit waypoint vectors come from one
+    multi-RHS collocation solve, and the cached evaluation matrix maps
+    them to the path samples.
+
+    Returns:
+        numpy.ndarray: Dense matrix of shape (num_points, n)
+    """
+    t = chord_length_parameter(waypoints)
+    n = len(t)
+    k = min(degree, n - 1)
+    knots = averaged_knot_vector(t, k)
+    collocation = bspline_basis_matrix(knots, k, t).toarray()
+    control_points = np.linalg.solve(collocation, np.eye(n))
+    return b_spline_evaluation_matrix(knots, k, num_points) @ control_points
+
+
+def catmull_rom_influence(waypoints, num_points=100, alpha=0.5):
+    """
+    Influence matrix of the centripetal Catmull-Rom spline.
+
+    The tangents are linear in the waypoints, so the curve through the n
+    unit waypoint vectors gives all columns at once.
+
+    Returns:
+        numpy.ndarray: Dense matrix of shape (num_points, n)
+    """
+    t = chord_length_parameter(waypoints, alpha)
+    unit = np.eye(len(t))
+    coeffs = hermite_coefficients(t, unit, catmull_rom_tangents(t, unit))
+    return PiecewisePolynomial(t, coeffs, num_points).to_array()
+
+
+# Methods whose paths are linear in the waypoint coordinates, with the
+# parameterization held fixed. The interpolating splines have global
+# support (influence decays geometrically away from a waypoint but never
+# vanishes), so every matrix is dense. Akima and PCHIP tangents are
+# nonlinear in the waypoints and have no influence matrix.
+INFLUENCE_BUILDERS = {
+    'newton': polynomial_influence,
+    'lagrange': polynomial_influence,
+    'cubic_spline': cubic_spline_influence,
+    'b_spline': b_spline_influence,
+    'catmull_rom': catmull_rom_influence,
+}
+
+
+def influence_footprint(matrix, threshold=0.01):
+    """
+    Support of every waypoint's influence on the path.
+
+    A path sample is inside the footprint of waypoint i when moving the
+    waypoint by one unit moves the sample by more than threshold.
+
+    Args:
+        matrix (numpy.ndarray): Influence matrix of shape (num_points, n)
+        threshold (float): Influence threshold
+
+    Returns:
+        dict: Arrays over waypoints:
+            - start, end: First and last path sample in the footprint
+              (-1 when the waypoint has no footprint)
+            - width: Fraction of the path between start and end
+            - significant_fraction: Fraction of samples above threshold
+            - max_influence: Largest influence on any sample
+    """
+    num_points, n = matrix.shape
+    magnitude = np.abs(matrix)
+    max_influence = np.max(magnitude, axis=0)
+    rows, cols = np.nonzero(magnitude > threshold)
+
+    start = np.full(n, num_points)
+    end = np.full(n, -1)
+    np.minimum.at(start, cols, rows)
+    np.maximum.at(end, cols, rows)
+    start[end < 0] = -1
+
+    return {
+        'start': start,
+        'end': end,
+        'width': np.where(end >= 0, end - start + 1, 0) / num_points,
+        'significant_fraction': np.bincount(cols, minlength=n) / num_points,
+        'max_influence': max_influence
+    }
+
+
+def influence_analysis(waypoints, methods=None, num_points=100, threshold=0.01):
+    """
+    Sensitivity of each method's path to every waypoint at once.
+
+    All supported methods are linear in the waypoint coordinates (for a
+    fixed parameterization), so path = S @ waypoints. One matrix S per
+    method replaces re-interpolating the path once per moved waypoint:
+    moving waypoint i by delta moves path sample j by S[j, i] * delta.
+
+    Args:
+        waypoints (numpy.ndarray): Waypoints as [x, y] coordinates
+        methods (list): Methods from INFLUENCE_BUILDERS (default: all)
+        num_points (int): Number of points in the interpolated path
+        threshold (float): Influence threshold of the footprints
+
+    Returns:
+        dict: {method: {'matrix', 'footprint', 'mean_width'}} where matrix
+        is the (num_points, n) influence matrix and footprint is the output
+        of influence_footprint
+    """
+    waypoints = np.asarray(waypoints, dtype=float)
+    methods = methods or list(INFLUENCE_BUILDERS)
+
+    results = {}
+    for method in methods:
+        matrix = INFLUENCE_BUILDERS[method](waypoints, num_points)
+        footprint = influence_footprint(matrix, threshold)
+
+        results[method] = {
+            'matrix': matrix,
+            'footprint': footprint,
+            'mean_width': float(np.mean(footprint['width']))
+        }
+
+    return results
@@ -0,0 +1,163 @@
+import numpy as np
+from utils.decimation import douglas_peucker, decimation_deviation
+
+# Width in pixels of the largest view a whole path is drawn in; the default
+# tolerance of the first decimated level is half a pixel of that view
+SCREEN_PIXELS = 4096
+
+
+class PathPyramid:
+    """
+    Multi-resolution level-of-detail representation of a dense path.
+
+    Level 0 is the full path. Each coarser level is a Douglas-Peucker
+    decimation of the level below with at least twice the tolerance and at
+    most ``shrink`` times its points, and stores an error bound: the
+    maximum distance from the full path to that level's polyline (the sum
+    of the per-level deviations).
+
+    Every level is split into blocks of ``block_size`` points with a
+    bounding box each, so a view only touches the blocks it overlaps.
+    """
+
+    def __init__(self, path, base_tolerance=None, min_points=64, block_size=256,
+                 max_levels=24, shrink=0.5):
+        """
+        Build the pyramid.
+
+        Args:
+            path (numpy.ndarray): Path points of shape (n, 2)
+            base_tolerance (float): Tolerance of the first decimated level
+                (default: half a pixel when the whole path spans a
+                SCREEN_PIXELS wide view; views zoomed in further use the
+                visible blocks of the full path)
+            min_points (int): Stop once a level has at most this many points
+            block_size (int): Points per spatial block
+            max_levels (int): Maximum number of levels
+            shrink (float): Largest fraction of the points of the level
+                below that a new level may keep
+        """
+        path = np.asarray(path, dtype=float)
+        self.block_size = block_size
+
+        if base_tolerance is None:
+            extent = float(np.max(path.max(axis=0) - path.min(axis=0))) if len(path) else 0.0
+            base_tolerance = 0.5 * extent / SCREEN_PIXELS if extent > 0 else 1.0
+
+        self.levels = [path]
+        self.error_bounds = [0.0]
+
+        tolerance = base_tolerance
+        while len(self.levels[-1]) > min_points and len(self.levels) < max_levels:
+            previous = self.levels[-1]
+            kept = douglas_peucker(previous, tolerance)
+            if len(kept) == len(previous) and len(previous) <= 2:
+                break
+            if len(kept) > shrink * len(previous):
+                # Not worth a level; the count only shrinks with a coarser tolerance
+                tolerance *= 2
+                continue
+            deviation = float(np.max(decimation_deviation(previous, kept)))
+            self.levels.append(previous[kept])
+            self.error_bounds.append(self.error_bounds[-1] + deviation)
+            tolerance *= 2
+
+        self.block_bounds = [self._block_bounds(level) for level in self.levels]
+
+    def _block_bounds(self, points):
+        """Bounding boxes (xmin, ymin, xmax, ymax) of consecutive blocks.
+
+        Neighbouring blocks share their boundary point, so the segment
+        between blocks is covered by both.
+        """
+        starts = np.arange(0, max(len(points) - 1, 1), self.block_size)
+        ends = np.minimum(starts + self.block_size + 1, len(points))
+        low = np.minimum.reduceat(points, starts, axis=0)
+        high = np.maximum.reduceat(points, starts, axis=0)
+        # reduceat stops at the next start; extend by the shared end point
+        low = np.minimum(low, points[ends - 1])
+        high = np.maximum(high, points[ends - 1])
+        return np.hstack((low, high))
+
+    @property
+    def num_levels(self):
+        return len(self.levels)
+
+    def select_level(self, xlim, ylim, pixels, pixel_tolerance=0.5):
+        """
+        Choose the coarsest level whose error is below the pixel size.
+
+        Args:
+            xlim (tuple): Visible x range
+            ylim (tuple): Visible y range
+            pixels (tuple): Size of the view in display pixels (width, height)
+            pixel_tolerance (float): Allowed error in pixels
+
+        Returns:
+            int: Level index
+        """
+        width = abs(xlim[1] - xlim[0]) / max(pixels[0], 1)
+        height = abs(ylim[1] - ylim[0]) / max(pixels[1], 1)
+        allowed = pixel_tolerance * max(width, height)
+
+        level = 0
+        for i, bound in enumerate(self.error_bounds):
+            if bound <= allowed:
+                level = i
+        return level
+
+    def query(self, xlim, ylim, level):
+        """
+        Points of one level inside a view, as a polyline.
+
+        Only blocks whose bounding box intersects the view are returned.
+        Runs of non-adjacent blocks are separated by a NaN row, which
+        matplotlib draws as a line break.
+
+        Returns:
+            numpy.ndarray: Points of shape (m, 2)
+        """
+        points = self.levels[level]
+        bounds = self.block_bounds[level]
+        x0, x1 = sorted(xlim)
+        y0, y1 = sorted(ylim)
+
+        visible = np.flatnonzero((bounds[:, 0] <= x1) & (bounds[:, 2] >= x0) &
+                                 (bounds[:, 1] <= y1) & (bounds[:, 3] >= y0))
+        if len(visible) == 0:
+            return np.empty((0, 2))
+
+        pieces = []
+        run_start = visible[0]
+        for previous, block in zip(visible, np.append(visible[1:], -1)):
+            if block == previous + 1:
+                continue
+            start = run_start * self.block_size
+            stop = min((previous + 1) * self.block_size + 1, len(points))
+            pieces.append(points[start:stop])
+            pieces.append(np.full((1, 2), np.nan))
+            run_start = block
+
+        return np.vstack(pieces[:-1])
+
+    def view(self, xlim, ylim, pixels, pixel_tolerance=0.5):
+        """Select the level for a view and return its visible points."""
+        level = self.select_level(xlim, ylim, pixels, pixel_tolerance)
+        return self.query(xlim, ylim, level)
+
+    def save(self, filename):
+        """Store the pyramid in a .npz file next to the path."""
+        arrays = {f'level_{i}': level for i, level in enumerate(self.levels)}
+        np.savez(filename, error_bounds=np.array(self.error_bounds),
+                 block_size=self.block_size, **arrays)
+
+    @classmethod
+    def load(cls, filename):
+        """Load a pyramid written by save without rebuilding it."""
+        data = np.load(filename)
+        pyramid = cls.__new__(cls)
+        pyramid.block_size = int(data['block_size'])
+        pyramid.error_bounds = list(data['error_bounds'])
+        pyramid.levels = [data[f'level_{i}'] for i in range(len(pyramid.error_bounds))]
+        pyramid.block_bounds = [pyramid._block_bounds(level) for level in pyramid.levels]
+        return pyramid
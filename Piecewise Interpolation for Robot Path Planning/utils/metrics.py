@@ -1,18 +1,35 @@
 
 
 import numpy as np
-from simulation.physics import calculate_curvature
+from simulation.physics import calculate_curvature, calculate_curvature_nd
+from interpolation.path import PiecewisePolynomial
+from utils import telemetry
+
+_deviation_histogram = telemetry.histogram('path_max_deviation',
+                                           'Maximum waypoint deviation of compared paths',
+                                           telemetry.DEVIATION_BUCKETS)
+_curvature_histogram = telemetry.histogram('path_max_curvature',
+                                           'Maximum curvature of compared paths',
+                                           telemetry.CURVATURE_BUCKETS)
 
 def path_length(path):
     """
     Calculate the total length of a path.
     
+    PiecewisePolynomial paths are measured exactly from their coefficients
+    with curve_length. Raw arrays fall back to the polyline length, which
+    underestimates the length of the underlying curve.
+    
     Args:
-        path (numpy.ndarray): Array of path points as [x, y] coordinates
+        path (numpy.ndarray or PiecewisePolynomial): Path points as [x, y]
+            coordinates, or a fitted path object
         
     Returns:
         float: Total path length
     """
+    if isinstance(path, PiecewisePolynomial):
+        return path.length()
+    
     if len(path) < 2:
         return 0.0
     
@@ -22,6 +39,81 @@ def path_length(path):
     
     return np.sum(segment_lengths)
 
+# Gauss-Legendre nodes and weights on [-1, 1]
+GAUSS_LEGENDRE_ORDER = 10
+_GL_NODES, _GL_WEIGHTS = np.polynomial.legendre.leggauss(GAUSS_LEGENDRE_ORDER)
+
+def _gauss_legendre(derivative, a, b):
+    """Integrate |r'(t)| over each interval [a_i, b_i] in one vectorized call."""
+    half = 0.5 * (b - a)
+    mid = 0.5 * (b + a)
+    t = (mid[:, None] + half[:, None] * _GL_NODES).ravel()
+    speed = np.sqrt(np.sum(derivative(t)**2, axis=1)).reshape(len(a), -1)
+    return half * (speed @ _GL_WEIGHTS)
+
+def curve_length(derivative, breakpoints, rtol=1e-10, max_subdivisions=40):
+    """
+    Calculate the arc length of a fitted curve by Gauss-Legendre quadrature.
+    
+    The speed |r'(t)| is integrated over every polynomial piece between
+    consecutive breakpoints. Pieces are bisected until the estimate on the
+    piece agrees with the sum over its halves to rtol, so the total has
+    roughly rtol relative error without sampling the path.
+    
+    Args:
+        derivative (callable): Function t -> r'(t) of shape (len(t), d), e.g.
+            the derivative() of a PiecewisePolynomial
+        breakpoints (numpy.ndarray): Parameter values where the curve's
+            polynomial pieces join (including both ends)
+        rtol (float): Relative tolerance of the length
+        max_subdivisions (int): Maximum bisection depth
+        
+    Returns:
+        float: Arc length of the curve
+    """
+    breakpoints = np.unique(np.asarray(breakpoints, dtype=float))
+    a, b = breakpoints[:-1], breakpoints[1:]
+    estimate = _gauss_legendre(derivative, a, b)
+    
+    total = 0.0
+    for _ in range(max_subdivisions):
+        mid = 0.5 * (a + b)
+        left = _gauss_legendre(derivative, a, mid)
+        right = _gauss_legendre(derivative, mid, b)
+        refined = left + right
+        
+        converged = np.abs(refined - estimate) <= rtol * np.abs(refined) + 1e-300
+        total += np.sum(refined[converged])
+        
+        remaining = ~converged
+        if not np.any(remaining):
+            return float(total)
+        
+        a = np.concatenate((a[remaining], mid[remaining]))
+        b = np.concatenate((mid[remaining], b[remaining]))
+        estimate = np.concatenate((left[remaining], right[remaining]))
+    
+    return float(total + np.sum(estimate))
+
+def arc_length_table(derivative, t):
+    """
+    Cumulative arc length of a fitted curve at increasing parameter values.
+    
+    Each interval between consecutive values is integrated with one
+    Gauss-Legendre rule, so t should be fine enough that the speed is
+    smooth on every interval (e.g. a few values per polynomial piece).
+    
+    Args:
+        derivative (callable): Function t -> r'(t) of shape (len(t), d)
+        t (numpy.ndarray): Increasing parameter values
+        
+    Returns:
+        numpy.ndarray: Arc length from t[0] to each value, shape (len(t),)
+    """
+    t = np.asarray(t, dtype=float)
+    lengths = _gauss_legendre(derivative, t[:-1], t[1:])
+    return np.concatenate(([0.0], np.cumsum(lengths)))
+
 def path_deviation(original_points, interpolated_path):
     """
     Calculate the deviation of an interpolated path from original waypoints.
@@ -59,7 +151,8 @@ def curvature_metrics(path, max_curvature=None):
     Calculate curvature metrics for a path.
     
     Args:
-        path (numpy.ndarray): Array of path points as [x, y] coordinates
+        path (numpy.ndarray): Array of path points as [x, y] coordinates,
+            or of shape (n, d) for paths in d dimensions
         max_curvature (float): Maximum allowable curvature
         
     Returns:
@@ -80,7 +173,11 @@ def curvature_metrics(path, max_curvature=None):
         }
     
     # Calculate curvature
-    curvature_values = calculate_curvature(path[:, 0], path[:, 1])
+    path = np.asarray(path)
+    if path.shape[1] == 2:
+        curvature_values = calculate_curvature(path[:, 0], path[:, 1])
+    else:
+        curvature_values = calculate_curvature_nd(path)
     
     # Calculate violation metrics if max_curvature is provided
     violation_count = 0
@@ -99,7 +196,129 @@ def curvature_metrics(path, max_curvature=None):
         'violation_percentage': violation_percentage
     }
 
-def compare_methods(waypoints, paths_dict, max_curvature=None):
+def _iter_path_chunks(path, chunk_size):
+    """Yield consecutive (k, 2) chunks of a path without materializing it."""
+    if isinstance(path, PiecewisePolynomial):
+        t = np.linspace(path.domain[0], path.domain[1], path.num_points)
+        for start in range(0, path.num_points, chunk_size):
+            yield path(t[start:start + chunk_size])
+    elif hasattr(path, 'shape') and hasattr(path, '__getitem__'):
+        # Arrays and memory-mapped files are sliced lazily
+        for start in range(0, len(path), chunk_size):
+            yield np.asarray(path[start:start + chunk_size], dtype=float)
+    else:
+        for chunk in path:
+            yield np.asarray(chunk, dtype=float)
+
+def streaming_curvature_metrics(path, max_curvature=None, chunk_size=100000):
+    """
+    Calculate curvature metrics of a very long path chunk by chunk.
+    
+    Curvature uses a second np.gradient, so each point depends on its two
+    neighbours on either side. Consecutive chunks overlap by that much, so
+    the values are identical to curvature_metrics on the whole path, while
+    memory stays proportional to chunk_size. Violations are reported as
+    run-length intervals instead of per-point counts.
+    
+    Args:
+        path: Path as an (n, 2) array or memmap, a PiecewisePolynomial
+            (sampled lazily at its num_points), or an iterable of (k, 2) chunks
+        max_curvature (float): Maximum allowable curvature
+        chunk_size (int): Number of points per chunk when slicing arrays
+        
+    Returns:
+        dict: Dictionary with curvature metrics:
+            - max_curvature: Maximum curvature value
+            - mean_curvature: Mean curvature
+            - violation_count: Number of points exceeding max_curvature
+            - violation_percentage: Percentage of points exceeding max_curvature
+            - violation_intervals: List of (start, end, peak) records, one per
+              run of consecutive violating points [start, end), with the peak
+              curvature in the run
+            - num_points: Number of points processed
+    """
+    context = 2
+    carry = np.empty((0, 2))
+    emitted = 0          # Global index of the next point to emit
+    buffer_start = 0     # Global index of carry[0]
+    
+    total = 0.0
+    max_value = 0.0
+    violation_count = 0
+    intervals = []
+    open_run = None      # (start, peak) of a run that reaches the block end
+    
+    def emit(values, offset):
+        nonlocal total, max_value, violation_count, open_run
+        if len(values) == 0:
+            return
+        total += np.sum(values)
+        max_value = max(max_value, np.max(values))
+        if max_curvature is None:
+            return
+        
+        violating = values > max_curvature
+        violation_count += int(np.sum(violating))
+        
+        # Run boundaries within this block
+        edges = np.diff(np.concatenate(([False], violating, [False])).astype(np.int8))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        peaks = np.maximum.reduceat(values, starts) if len(starts) else []
+        
+        # A run left open by the previous block either continues or ends here
+        continued = None
+        if open_run is not None:
+            if len(starts) and starts[0] == 0:
+                continued = open_run
+            else:
+                intervals.append((open_run[0], offset, open_run[1]))
+            open_run = None
+        
+        for run_start, run_end, peak in zip(starts, ends, peaks):
+            run_start = offset + run_start
+            peak = float(peak)
+            if continued is not None:
+                run_start, peak = continued[0], max(continued[1], peak)
+                continued = None
+            
+            if run_end == len(values):
+                open_run = (run_start, peak)
+            else:
+                intervals.append((int(run_start), int(offset + run_end), peak))
+    
+    for chunk in _iter_path_chunks(path, chunk_size):
+        buffer = np.vstack((carry, chunk))
+        if len(buffer) < 2 * context + 1:
+            carry = buffer
+            continue
+        
+        curvature = calculate_curvature(buffer[:, 0], buffer[:, 1])
+        # Points near the buffer end still lack their right-hand neighbours
+        stop = len(buffer) - context
+        emit(curvature[emitted - buffer_start:stop], emitted)
+        emitted = buffer_start + stop
+        
+        carry = buffer[-2 * context:]
+        buffer_start += len(buffer) - len(carry)
+    
+    num_points = buffer_start + len(carry)
+    if num_points >= 3:
+        curvature = calculate_curvature(carry[:, 0], carry[:, 1])
+        emit(curvature[emitted - buffer_start:], emitted)
+    if open_run is not None:
+        intervals.append((int(open_run[0]), int(num_points), open_run[1]))
+    
+    return {
+        'max_curvature': float(max_value),
+        'mean_curvature': total / num_points if num_points >= 3 else 0.0,
+        'violation_count': violation_count,
+        'violation_percentage': 100.0 * violation_count / num_points if num_points >= 3 else 0.0,
+        'violation_intervals': intervals,
+        'num_points': num_points
+    }
+
+def compare_methods(waypoints, paths_dict, max_curvature=None, obstacle_map=None):
     """
     Compare different interpolation methods.
     
@@ -107,6 +326,8 @@ def compare_methods(waypoints, paths_dict, max_curvature=None):
         waypoints (numpy.ndarray): Original waypoints
         paths_dict (dict): Dictionary of {method_name: path_array}
         max_curvature (float): Maximum allowable curvature
+        obstacle_map (ObstacleMap): Obstacles to check the paths against;
+            adds 'collision', 'first_collision' and 'min_clearance'
         
     Returns:
         dict: Dictionary with comparison metrics for each method
@@ -128,6 +349,16 @@ def compare_methods(waypoints, paths_dict, max_curvature=None):
             'curvature_violations': curvature['violation_count'],
             'violation_percentage': curvature['violation_percentage']
         }
+        
+        if telemetry.enabled:
+            _deviation_histogram.observe(deviation['max_deviation'], method=method)
+            _curvature_histogram.observe(curvature['max_curvature'], method=method)
+        
+        if obstacle_map is not None:
+            collision = obstacle_map.check_path(path)
+            results[method]['collision'] = collision['collision']
+            results[method]['first_collision'] = collision['first_collision']
+            results[method]['min_clearance'] = collision['min_clearance']
     
     return results
 
@@ -0,0 +1,217 @@
+import numpy as np
+
+from utils import telemetry
+from utils.waypoints import chord_length_parameter, interpolate_batch
+
+_collapsed_counter = telemetry.counter('paths_collapsed_total',
+                                       'Candidate paths collapsed into a near-duplicate')
+
+
+def resample_paths(paths, num_samples):
+    """
+    Resample paths at points uniformly spaced in arc length.
+
+    Args:
+        paths (numpy.ndarray): One path (n, d) or a batch (batch, n, d)
+        num_samples (int): Number of points per path
+
+    Returns:
+        numpy.ndarray: Resampled paths of shape (num_samples, d) or
+        (batch, num_samples, d)
+    """
+    paths = np.asarray(paths, dtype=float)
+    single = paths.ndim == 2
+    if single:
+        paths = paths[None]
+    resampled = interpolate_batch(np.linspace(0, 1, num_samples),
+                                  chord_length_parameter(paths), paths)
+    return resampled[0] if single else resampled
+
+
+def _distance_matrices(p, q):
+    """Pairwise point distances of shape (..., n, m), with a batch axis added if needed."""
+    p = np.asarray(p, dtype=float)
+    q = np.asarray(q, dtype=float)
+    single = p.ndim == 2 and q.ndim == 2
+    p, q = np.broadcast_arrays(p[..., :, None, :], q[..., None, :, :])
+    distances = np.sqrt(np.sum((p - q)**2, axis=-1))
+    return distances[None] if single else distances, single
+
+
+def discrete_frechet_distance(p, q):
+    """
+    Discrete Fréchet distance between polylines, for one pair or a batch.
+
+    The coupling table c[i, j] = max(d(p_i, q_j), min(c[i-1, j],
+    c[i-1, j-1], c[i, j-1])) is filled one anti-diagonal at a time; every
+    cell of a diagonal depends only on the two previous diagonals, so each
+    step is one vectorized operation over the diagonal and the batch.
+
+    Args:
+        p (numpy.ndarray): Points of shape (n, d) or (batch, n, d)
+        q (numpy.ndarray): Points of shape (m, d) or (batch, m, d); batch
+            axes broadcast against p
+
+    Returns:
+        float or numpy.ndarray: Distance, or one distance per pair
+    """
+    distances, single = _distance_matrices(p, q)
+    n, m = distances.shape[-2:]
+
+    coupling = np.empty_like(distances)
+    coupling[..., 0, :] = np.maximum.accumulate(distances[..., 0, :], axis=-1)
+    coupling[..., :, 0] = np.maximum.accumulate(distances[..., :, 0], axis=-1)
+    for k in range(2, n + m - 1):
+        i = np.arange(max(1, k - m + 1), min(k, n))
+        j = k - i
+        reachable = np.minimum(np.minimum(coupling[..., i - 1, j], coupling[..., i - 1, j - 1]),
+                               coupling[..., i, j - 1])
+        coupling[..., i, j] = np.maximum(distances[..., i, j], reachable)
+
+    result = coupling[..., -1, -1]
+    return float(result[0]) if single else result
+
+
+def hausdorff_distance(p, q):
+    """
+    Symmetric Hausdorff distance between point sets, for one pair or a batch.
+
+    Unlike the Fréchet distance it ignores the order of the points, so it
+    is cheaper to reason about but does not detect a path traversed
+    differently.
+
+    Args:
+        p (numpy.ndarray): Points of shape (n, d) or (batch, n, d)
+        q (numpy.ndarray): Points of shape (m, d) or (batch, m, d)
+
+    Returns:
+        float or numpy.ndarray: Distance, or one distance per pair
+    """
+    distances, single = _distance_matrices(p, q)
+    result = np.maximum(np.max(np.min(distances, axis=-1), axis=-1),
+                        np.max(np.min(distances, axis=-2), axis=-1))
+    return float(result[0]) if single else result
+
+
+PATH_DISTANCES = {
+    'frechet': discrete_frechet_distance,
+    'hausdorff': hausdorff_distance,
+}
+
+
+class PathIndex:
+    """
+    Grid-hashed index that collapses near-duplicate paths.
+
+    Every path is resampled at num_samples points uniformly spaced in arc
+    length. Its signature is a few of those points snapped to a grid, so
+    a new path is only compared, with the exact distance, against the
+    representatives that share its bucket. Two grids offset by half a cell
+    are hashed, so a small difference across a cell boundary of one grid
+    is still caught by the other.
+
+    The index can miss a near-duplicate whose points straddle boundaries
+    in both grids; that path is kept as a new representative. Paths are
+    never collapsed unless their distance is within tolerance.
+    """
+
+    def __init__(self, tolerance, metric='frechet', num_samples=64, signature_samples=3,
+                 cell_size=None):
+        """
+        Args:
+            tolerance (float): Paths within this distance are collapsed
+            metric (str): 'frechet' or 'hausdorff'
+            num_samples (int): Arc-length samples per path for the distance
+            signature_samples (int): Samples (including both ends) hashed
+                into the signature
+            cell_size (float): Grid cell size (default: 4 * tolerance)
+        """
+        if metric not in PATH_DISTANCES:
+            raise ValueError(f"Unknown path distance '{metric}'")
+        self.tolerance = tolerance
+        self.distance = PATH_DISTANCES[metric]
+        self.num_samples = num_samples
+        self.cell_size = cell_size if cell_size is not None else 4 * tolerance
+        self.signature_indices = np.linspace(0, num_samples - 1,
+                                             signature_samples).round().astype(int)
+
+        self.representatives = []
+        self.assignments = {}
+        self.comparisons = 0
+        self._samples = []
+        self._buckets = {}
+
+    def _signatures(self, samples):
+        cells = samples[self.signature_indices] / max(self.cell_size, 1e-300)
+        return [(grid,) + tuple(np.floor(cells + offset).astype(int).ravel())
+                for grid, offset in enumerate((0.0, 0.5))]
+
+    def add(self, key, path):
+        """
+        Insert a path and return the key of its representative.
+
+        The representative is key itself when no indexed path is within
+        tolerance, otherwise the key of the closest one in the bucket.
+        """
+        samples = resample_paths(path, self.num_samples)
+        signatures = self._signatures(samples)
+
+        candidates = sorted({index for signature in signatures
+                             for index in self._buckets.get(signature, ())})
+        if candidates:
+            distances = self.distance(samples, np.stack([self._samples[i] for i in candidates]))
+            self.comparisons += len(candidates)
+            best = int(np.argmin(distances))
+            if distances[best] <= self.tolerance:
+                representative = self.representatives[candidates[best]]
+                self.assignments[key] = representative
+                if telemetry.enabled:
+                    _collapsed_counter.inc()
+                return representative
+
+        index = len(self.representatives)
+        self.representatives.append(key)
+        self._samples.append(samples)
+        for signature in signatures:
+            self._buckets.setdefault(signature, []).append(index)
+        self.assignments[key] = key
+        return key
+
+    def groups(self):
+        """Map every representative to the keys collapsed into it (itself first)."""
+        groups = {key: [] for key in self.representatives}
+        for key, representative in self.assignments.items():
+            groups[representative].append(key)
+        return groups
+
+
+def deduplicate_paths(paths, tolerance, metric='frechet', **index_options):
+    """
+    Collapse near-identical candidate paths before running expensive metrics.
+
+    Args:
+        paths (dict): {key: path} with paths of shape (n, d); arrays or
+            PiecewisePolynomial objects
+        tolerance (float): Paths within this distance are collapsed
+        metric (str): 'frechet' or 'hausdorff'
+        **index_options: Further PathIndex arguments
+
+    Returns:
+        dict: Dictionary with the deduplication:
+            - unique: {representative key: path}, in insertion order
+            - groups: {representative key: keys collapsed into it}
+            - representative: {key: representative key} for every path
+            - duplicates: Number of collapsed paths
+            - comparisons: Exact distance evaluations performed
+    """
+    index = PathIndex(tolerance, metric, **index_options)
+    for key, path in paths.items():
+        index.add(key, path)
+
+    return {
+        'unique': {key: paths[key] for key in index.representatives},
+        'groups': index.groups(),
+        'representative': dict(index.assignments),
+        'duplicates': len(paths) - len(index.representatives),
+        'comparisons': index.comparisons
+    }
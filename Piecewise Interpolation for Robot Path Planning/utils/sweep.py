@@ -0,0 +1,123 @@
+import time
+import numpy as np
+
+from interpolation.registry import available_methods, get_method, method_info
+from utils.metrics import path_deviation
+from utils.waypoints import chord_length_parameter, interpolate_batch
+
+def resample_densities(base_waypoints, density_factors):
+    """
+    Resample waypoint sets at many densities from one parameterization.
+
+    The chord-length parameterization of the base sets is computed once and
+    every density is derived from it in a single batched interpolation.
+    Unlike generate_waypoints_with_density, densities below 1 are also
+    resampled along the chord length rather than strided.
+
+    Args:
+        base_waypoints (numpy.ndarray): One set (n, 2) or a batch (batch, n, 2)
+        density_factors (list): Density multipliers
+
+    Returns:
+        dict: {factor: waypoints of shape (batch, m, 2)}
+    """
+    base = np.asarray(base_waypoints, dtype=float)
+    if base.ndim == 2:
+        base = base[None]
+
+    n = base.shape[1]
+    sizes = [max(2, int(round(n * factor))) for factor in density_factors]
+
+    # One query vector holding every density's parameters back to back
+    t = chord_length_parameter(base)
+    t_new = np.concatenate([np.linspace(0, 1, size) for size in sizes])
+    resampled = interpolate_batch(t_new, t, base)
+
+    splits = np.cumsum(sizes)[:-1]
+    return {factor: part for factor, part in
+            zip(density_factors, np.split(resampled, splits, axis=1))}
+
+
+def density_sweep(base_waypoints, density_factors, methods=None, num_points=100,
+                  max_deviation=None):
+    """
+    Measure cost and accuracy of each method across many waypoint densities.
+
+    Waypoint sets of equal size go through one call of a method's batch
+    function where it has one, and one call of its fit function per set
+    otherwise, so every method uses the chord-length parameterization of
+    its fit. The accuracy of each path is measured against the base
+    waypoints.
+
+    Args:
+        base_waypoints (numpy.ndarray): One set (n, 2) or a batch (batch, n, 2)
+        density_factors (list): Density multipliers to sweep
+        methods (list): Registered method names (default: all)
+        num_points (int): Number of points in each interpolated path
+        max_deviation (float): Deviation budget used to pick the sparsest
+            density per method
+
+    Returns:
+        dict: Dictionary with sweep results:
+            - factors: Sorted density factors
+            - num_waypoints: Waypoints per set for each factor
+            - curve: {method: list of per-factor records with 'factor',
+              'num_waypoints', 'time' (seconds per set), 'max_deviation'
+              and 'mean_deviation'}
+            - cheapest: {method: factor with the fewest waypoints among
+              those meeting max_deviation, or None}. The waypoint count is
+              chosen over the measured times, which are too noisy to rank
+              densities that differ by a few waypoints.
+    """
+    base = np.asarray(base_waypoints, dtype=float)
+    if base.ndim == 2:
+        base = base[None]
+    factors = sorted(density_factors)
+    methods = methods or available_methods()
+
+    waypoint_sets = resample_densities(base, factors)
+
+    # Factors that round to the same size produce the same sets
+    by_size = {}
+    for factor in factors:
+        by_size.setdefault(waypoint_sets[factor].shape[1], []).append(factor)
+
+    curve = {method: [] for method in methods}
+    for method in methods:
+        batched = method_info(method)['batched']
+        method_func = get_method(method, 'batch' if batched else 'fit')
+
+        for size, size_factors in sorted(by_size.items()):
+            sets = waypoint_sets[size_factors[0]]
+
+            start = time.perf_counter()
+            if batched:
+                paths = method_func(sets, num_points=num_points)
+            else:
+                paths = [method_func(waypoints, num_points=num_points).to_array()
+                         for waypoints in sets]
+            elapsed = (time.perf_counter() - start) / len(sets)
+
+            deviations = [path_deviation(original, path) for original, path in zip(base, paths)]
+            record = {
+                'num_waypoints': size,
+                'time': elapsed,
+                'max_deviation': float(max(d['max_deviation'] for d in deviations)),
+                'mean_deviation': float(np.mean([d['mean_deviation'] for d in deviations]))
+            }
+            for factor in size_factors:
+                curve[method].append(dict(record, factor=factor))
+
+    cheapest = {}
+    for method, records in curve.items():
+        meeting = [r for r in records
+                   if max_deviation is not None and r['max_deviation'] <= max_deviation]
+        cheapest[method] = (min(meeting, key=lambda r: (r['num_waypoints'], r['factor']))['factor']
+                            if meeting else None)
+
+    return {
+        'factors': factors,
+        'num_waypoints': [waypoint_sets[f].shape[1] for f in factors],
+        'curve': curve,
+        'cheapest': cheapest
+    }
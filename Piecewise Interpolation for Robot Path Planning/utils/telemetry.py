@@ -0,0 +1,267 @@
+import bisect
+import json
+import os
+import threading
+import time
+
+# Telemetry can be switched off globally; instrumented code checks this flag
+# before doing any work, so disabled telemetry costs a single attribute read.
+enabled = True
+
+# Default histogram buckets (upper bounds)
+LATENCY_BUCKETS = (1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3,
+                   1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEVIATION_BUCKETS = (1e-6, 1e-4, 1e-3, 0.01, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 25.0,
+                     50.0, 100.0)
+CURVATURE_BUCKETS = (1e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 0.01, 0.025, 0.05, 0.1, 0.25,
+                     0.5, 1.0)
+
+_metrics = {}
+_collectors = []
+_registry_lock = threading.Lock()
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key):
+    if not key:
+        return ''
+    pairs = []
+    for name, value in key:
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{name}="{value}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonically increasing count, one value per label set."""
+
+    type = 'counter'
+
+    def __init__(self, name, help=''):
+        self.name = name
+        self.help = help
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(_label_key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, key, value) for key, value in self._values.items()]
+
+    def snapshot(self):
+        with self._lock:
+            return [{'labels': dict(key), 'value': value} for key, value in self._values.items()]
+
+
+class Gauge(Counter):
+    """Value that can go up and down, one value per label set."""
+
+    type = 'gauge'
+
+    def set(self, value, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram:
+    """
+    Distribution of observed values in cumulative buckets.
+
+    Each label set keeps one count per bucket plus the sum and count of
+    all observations, as in the Prometheus histogram type.
+    """
+
+    type = 'histogram'
+
+    def __init__(self, name, help='', buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = _label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def count(self, **labels):
+        state = self._values.get(_label_key(labels))
+        return state[2] if state else 0
+
+    def samples(self):
+        samples = []
+        with self._lock:
+            for key, (counts, total, count) in self._values.items():
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                    cumulative += bucket_count
+                    samples.append((f'{self.name}_bucket', key + (('le', _format_value(bound)),),
+                                    cumulative))
+                samples.append((f'{self.name}_sum', key, total))
+                samples.append((f'{self.name}_count', key, count))
+        return samples
+
+    def snapshot(self):
+        with self._lock:
+            return [{'labels': dict(key), 'buckets': list(self.buckets), 'counts': list(counts),
+                     'sum': total, 'count': count}
+                    for key, (counts, total, count) in self._values.items()]
+
+
+def _get_or_create(cls, name, help, **kwargs):
+    metric = _metrics.get(name)
+    if metric is None:
+        with _registry_lock:
+            metric = _metrics.get(name)
+            if metric is None:
+                metric = _metrics[name] = cls(name, help, **kwargs)
+    if type(metric) is not cls:
+        raise ValueError(f"Metric '{name}' is already registered as a {metric.type}")
+    return metric
+
+
+def counter(name, help=''):
+    """Get or create the counter with this name."""
+    return _get_or_create(Counter, name, help)
+
+
+def gauge(name, help=''):
+    """Get or create the gauge with this name."""
+    return _get_or_create(Gauge, name, help)
+
+
+def histogram(name, help='', buckets=LATENCY_BUCKETS):
+    """Get or create the histogram with this name."""
+    return _get_or_create(Histogram, name, help, buckets=buckets)
+
+
+def register_collector(func):
+    """
+    Register a function that is called before every export.
+
+    Collectors update gauges from state that is cheaper to read on demand
+    than to track on every call, such as cache statistics.
+    """
+    _collectors.append(func)
+    return func
+
+
+def reset():
+    """Drop all recorded values (the metrics and collectors stay registered)."""
+    for metric in list(_metrics.values()):
+        with metric._lock:
+            metric._values.clear()
+
+
+def _collect():
+    for func in _collectors:
+        func()
+    return sorted(_metrics.values(), key=lambda metric: metric.name)
+
+
+def to_prometheus():
+    """Render all metrics in the Prometheus text exposition format."""
+    lines = []
+    for metric in _collect():
+        if metric.help:
+            lines.append(f'# HELP {metric.name} {metric.help}')
+        lines.append(f'# TYPE {metric.name} {metric.type}')
+        for name, key, value in metric.samples():
+            lines.append(f'{name}{_format_labels(key)} {_format_value(value)}')
+    return '\n'.join(lines) + '\n'
+
+
+def snapshot():
+    """Return all metrics as a JSON-serializable dictionary."""
+    return {
+        'timestamp': time.time(),
+        'metrics': {metric.name: {'type': metric.type, 'help': metric.help,
+                                  'values': metric.snapshot()}
+                    for metric in _collect()}
+    }
+
+
+def write_prometheus(filename):
+    """Write the Prometheus text format to a file, replacing it atomically."""
+    temporary = f'{filename}.tmp'
+    with open(temporary, 'w') as f:
+        f.write(to_prometheus())
+    os.replace(temporary, filename)
+
+
+def append_json_line(filename):
+    """Append one snapshot as a line of JSON to a file."""
+    with open(filename, 'a') as f:
+        f.write(json.dumps(snapshot()) + '\n')
+
+
+class PeriodicExporter:
+    """
+    Background thread writing the metrics to a file at a fixed interval.
+
+    The 'prometheus' format rewrites a text file for file-based scrapers
+    (e.g. the node exporter textfile collector); the 'jsonl' format appends
+    one snapshot per interval. A final export is written on stop().
+    """
+
+    FORMATS = {'prometheus': write_prometheus, 'jsonl': append_json_line}
+
+    def __init__(self, filename, interval=10.0, format='prometheus'):
+        if format not in self.FORMATS:
+            raise ValueError(f"Unknown telemetry format '{format}'")
+        self.filename = filename
+        self.interval = interval
+        self.export = self.FORMATS[format]
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='telemetry-exporter',
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.export(self.filename)
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            self.export(self.filename)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -1,12 +1,7 @@
+import time
 import numpy as np
 
-# Import interpolation methods - add this import
-from interpolation import (
-    newton_interpolate,
-    lagrange_interpolate, 
-    cubic_spline_interpolate,
-    b_spline_interpolate
-)
+from interpolation.registry import METHODS, available_methods, get_method, method_info
 
 def analytical_function(x, test_type='linear'):
     """Analytical function for testing interpolation accuracy"""
@@ -55,9 +50,9 @@ def test_method_on_function(method_func, test_type, num_sample_points=5, num_tes
         tolerance = 0.1
         if test_type == 'linear':
             tolerance = 0.01
-        elif test_type == 'quadratic' and method_func.__name__ == 'cubic_spline_interpolate':
+        elif test_type == 'quadratic' and method_func.__name__.startswith('cubic_spline_'):
             tolerance = 0.02
-        elif test_type == 'quadratic' and method_func.__name__ == 'b_spline_interpolate':
+        elif test_type == 'quadratic' and method_func.__name__.startswith('b_spline_'):
             tolerance = 0.05
         
         passed = max_error < tolerance
@@ -75,28 +70,21 @@ def test_method_on_function(method_func, test_type, num_sample_points=5, num_tes
             'error_message': f"Exception: {str(e)}"
         }
 
-def run_method_tests(method_name):
-    """Run all tests for a given interpolation method"""
-    if method_name == 'newton':
-        method_func = newton_interpolate
-    elif method_name == 'lagrange':
-        method_func = lagrange_interpolate
-    elif method_name == 'cubic_spline':
-        method_func = cubic_spline_interpolate
-    elif method_name == 'b_spline':
-        method_func = b_spline_interpolate
-    else:
-        return False, {"unknown_method": {"passed": False, "error_message": "Unknown method"}}
+def run_method_tests(method_name, kind='fit'):
+    """
+    Run all tests for a given interpolation method.
     
-    # Define test cases
-    test_cases = ['linear', 'quadratic']
-    
-    # Add specific test cases for each method
-    if method_name == 'newton' or method_name == 'lagrange':
-        test_cases.append('cubic')
+    Args:
+        method_name (str): Registered method name
+        kind (str): Entry point to test, 'fit' or 'interpolate' (the
+            *_interpolate functions, some of which are student exercises)
+    """
+    if method_name not in METHODS:
+        return False, {"unknown_method": {"passed": False, "error_message": "Unknown method"}}
+    method_func = get_method(method_name, kind)
     
-    if method_name == 'cubic_spline' or method_name == 'b_spline':
-        test_cases.append('sine')
+    # Define test cases, plus the specific ones registered for each method
+    test_cases = ['linear', 'quadratic'] + METHODS[method_name]['test_cases']
     
     # Run tests
     results = {}
@@ -108,4 +96,170 @@ def run_method_tests(method_name):
         if not result['passed']:
             all_passed = False
     
-    return all_passed, results
\ No newline at end of file
+    return all_passed, results
+
+CONVERGENCE_TEST_TYPES = ['linear', 'quadratic', 'cubic', 'sine', 'runge']
+
+def _test_range(test_type):
+    return (-1, 1) if test_type == 'runge' else (0, 1)
+
+def convergence_study(methods=None, test_types=None, sample_counts=None,
+                      num_test_points=1000, repeats=3):
+    """
+    Measure how error and compute time scale with the number of samples.
+    
+    Every analytical function is sampled at geometrically increasing sample
+    counts and interpolated with each method. For each sample count, the
+    sets of all test functions go through one call of a method's batch
+    function (with its cached evaluation matrices) where it has one, and
+    through its fit function otherwise; the time of a batch call is split
+    evenly over its sets. Ground truth is computed once per test type on
+    one stacked grid. Methods produce num_test_points points so that
+    resampling the path does not mask the interpolation error.
+    
+    A method that fails numerically (LinAlgError or FloatingPointError) on
+    a set gets an infinite error and the exception in the record's 'error'
+    field; any other exception is raised.
+    
+    Args:
+        methods (list): Registered method names (default: all)
+        test_types (list): Analytical functions to test (default: all,
+            including 'runge')
+        sample_counts (list): Sample counts to sweep (default: 4 to 64,
+            doubling)
+        num_test_points (int): Points at which the error is measured
+        repeats (int): Timing repeats; the fastest run is kept
+        
+    Returns:
+        dict: Dictionary with study results:
+            - records: List of dicts with 'method', 'test_type',
+              'num_samples', 'max_error', 'mean_error', 'time' and 'error'
+              (None, or the repr of the numerical failure)
+            - rates: {method: {test_type: fitted order p in max_error ~ n^-p}}
+            - pareto: {test_type: records on the error-versus-time Pareto
+              front across methods and sample counts, sorted by time}
+    """
+    methods = methods or available_methods()
+    test_types = test_types or CONVERGENCE_TEST_TYPES
+    sample_counts = sample_counts or [4, 8, 16, 32, 64]
+    
+    # Ground truth for every test function on one stacked grid
+    unit = np.linspace(0, 1, num_test_points)
+    ranges = np.array([_test_range(t) for t in test_types], dtype=float)
+    x_test = ranges[:, :1] + unit * (ranges[:, 1:] - ranges[:, :1])
+    y_true = np.stack([analytical_function(x_test[i], t) for i, t in enumerate(test_types)])
+    
+    records = []
+    for method in methods:
+        batched = method_info(method)['batched']
+        method_func = get_method(method, 'batch' if batched else 'fit')
+        
+        for n in sample_counts:
+            x_sample = ranges[:, :1] + np.linspace(0, 1, n) * (ranges[:, 1:] - ranges[:, :1])
+            y_sample = np.stack([analytical_function(x_sample[i], t)
+                                 for i, t in enumerate(test_types)])
+            waypoint_sets = np.stack((x_sample, y_sample), axis=-1)
+            
+            paths, elapsed, error = None, np.inf, None
+            if batched:
+                paths, elapsed, error = _timed(
+                    lambda: method_func(waypoint_sets, num_points=num_test_points), repeats)
+            if paths is not None:
+                times = [elapsed / len(test_types)] * len(test_types)
+                errors = [None] * len(test_types)
+            else:
+                # One call per set, so a failing set does not fail the others
+                if batched:
+                    compute = lambda w: method_func(w[None], num_points=num_test_points)[0]
+                else:
+                    compute = lambda w: method_func(w, num_points=num_test_points).to_array()
+                results = [_timed(lambda: compute(waypoints), repeats)
+                           for waypoints in waypoint_sets]
+                paths, times, errors = (list(values) for values in zip(*results))
+            
+            for i, test_type in enumerate(test_types):
+                max_error = mean_error = np.inf
+                if errors[i] is None:
+                    y_interp = np.interp(x_test[i], paths[i][:, 0], paths[i][:, 1])
+                    error = np.abs(y_interp - y_true[i])
+                    max_error, mean_error = float(np.max(error)), float(np.mean(error))
+                
+                records.append({
+                    'method': method,
+                    'test_type': test_type,
+                    'num_samples': n,
+                    'max_error': max_error,
+                    'mean_error': mean_error,
+                    'time': times[i],
+                    'error': errors[i]
+                })
+    
+    return {
+        'records': records,
+        'rates': convergence_rates(records),
+        'pareto': pareto_front(records)
+    }
+
+def _timed(compute, repeats):
+    """(result, fastest time, None), or (None, inf, repr) on a numerical failure."""
+    best = np.inf
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = compute()
+            best = min(best, time.perf_counter() - start)
+    except (np.linalg.LinAlgError, FloatingPointError) as e:
+        return None, np.inf, repr(e)
+    return result, best, None
+
+def convergence_rates(records):
+    """
+    Fit empirical convergence orders from study records.
+    
+    Fits log(max_error) = log(C) - p * log(n) by least squares for each
+    method and test type. Errors at machine precision are excluded since
+    they no longer follow the power law.
+    
+    Returns:
+        dict: {method: {test_type: p}}, NaN where fewer than two usable points
+    """
+    rates = {}
+    groups = {}
+    for r in records:
+        groups.setdefault((r['method'], r['test_type']), []).append(r)
+    
+    for (method, test_type), group in groups.items():
+        usable = [r for r in group if np.isfinite(r['max_error']) and r['max_error'] > 1e-10]
+        rate = np.nan
+        if len(usable) >= 2:
+            n = np.log([r['num_samples'] for r in usable])
+            err = np.log([r['max_error'] for r in usable])
+            rate = -np.polyfit(n, err, 1)[0]
+        rates.setdefault(method, {})[test_type] = float(rate)
+    
+    return rates
+
+def pareto_front(records):
+    """
+    Error-versus-time Pareto front for each test type.
+    
+    A record is on the front when no other record of the same test type is
+    both faster and at least as accurate.
+    
+    Returns:
+        dict: {test_type: list of records sorted by time}
+    """
+    fronts = {}
+    for test_type in sorted({r['test_type'] for r in records}):
+        candidates = sorted((r for r in records
+                             if r['test_type'] == test_type and np.isfinite(r['max_error'])),
+                            key=lambda r: (r['time'], r['max_error']))
+        front = []
+        best_error = np.inf
+        for r in candidates:
+            if r['max_error'] < best_error:
+                front.append(r)
+                best_error = r['max_error']
+        fronts[test_type] = front
+    
+    return fronts
\ No newline at end of file
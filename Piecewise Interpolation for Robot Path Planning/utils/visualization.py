@@ -1,5 +1,41 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from utils.lod import PathPyramid
+
+# Line colors of the methods, in registration order
+METHOD_COLORS = ['blue', 'green', 'purple', 'orange', 'brown', 'teal', 'magenta',
+                 'olive', 'navy', 'gray']
+
+# Paths with more points than this are drawn through a PathPyramid
+LOD_MIN_POINTS = 20000
+
+def plot_path(ax, path, *args, **kwargs):
+    """Plot a path array, or a PathPyramid at the level the view needs.
+    
+    Arrays with more than LOD_MIN_POINTS points are wrapped in a
+    PathPyramid first. For a pyramid, the level is chosen from the axes'
+    data limits and their size in display pixels (which includes the
+    figure DPI). Only the points in view are drawn, and the line is
+    re-queried when the view is zoomed or panned.
+    """
+    if not isinstance(path, PathPyramid):
+        path = np.asarray(path)
+        if len(path) <= LOD_MIN_POINTS:
+            return ax.plot(path[:, 0], path[:, 1], *args, **kwargs)[0]
+        path = PathPyramid(path)
+    
+    coarsest = path.levels[-1]
+    line, = ax.plot(coarsest[:, 0], coarsest[:, 1], *args, **kwargs)
+    
+    def update(ax):
+        extent = ax.get_window_extent()
+        points = path.view(ax.get_xlim(), ax.get_ylim(), (extent.width, extent.height))
+        line.set_data(points[:, 0], points[:, 1])
+    
+    update(ax)
+    ax.callbacks.connect('xlim_changed', update)
+    ax.callbacks.connect('ylim_changed', update)
+    return line
 
 def plot_interpolation_comparison(waypoints, paths):
     """Create comparison plot for different interpolation methods."""
@@ -9,10 +45,9 @@ def plot_interpolation_comparison(waypoints, paths):
     ax.plot(waypoints[:, 0], waypoints[:, 1], 'ro-', markersize=8, label='Waypoints')
     
     # Plot each path
-    colors = ['blue', 'green', 'purple', 'orange']
     for i, (method, path) in enumerate(paths.items()):
-        color = colors[i % len(colors)]
-        ax.plot(path[:, 0], path[:, 1], color=color, linewidth=2, label=method)
+        color = METHOD_COLORS[i % len(METHOD_COLORS)]
+        plot_path(ax, path, color=color, linewidth=2, label=method)
     
     ax.set_aspect('equal')
     ax.set_xlabel('X')
@@ -30,9 +65,8 @@ def plot_curvature_comparison(paths, curvatures):
     """Plot curvature profiles for different methods."""
     fig, ax = plt.subplots(figsize=(10, 6))
     
-    colors = ['blue', 'green', 'purple', 'orange']
     for i, (method, curvature) in enumerate(curvatures.items()):
-        color = colors[i % len(colors)]
+        color = METHOD_COLORS[i % len(METHOD_COLORS)]
         path = paths[method]
         
         # Create parameter along path (arc length)
@@ -61,8 +95,11 @@ def plot_local_control_effect(methods, original_waypoints, modified_waypoints,
                             original_paths, modified_paths):
     """Visualize how changing one waypoint affects the entire curve."""
     num_methods = len(methods)
-    fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+    rows = (num_methods + 1) // 2
+    fig, axes = plt.subplots(rows, 2, figsize=(12, 5 * rows), squeeze=False)
     axes = axes.flatten()
+    for ax in axes[num_methods:]:
+        ax.set_visible(False)
     
     for i, method in enumerate(methods):
         ax = axes[i]
@@ -97,7 +134,8 @@ def plot_density_comparison(methods, waypoints_sets, density_results):
     density_factors = sorted(list(waypoints_sets.keys()))
     num_methods = len(methods)
     
-    fig, axes = plt.subplots(num_methods, len(density_factors), figsize=(15, 12))
+    fig, axes = plt.subplots(num_methods, len(density_factors), figsize=(15, 3 * num_methods),
+                             squeeze=False)
     
     # Plot each method
     for i, method in enumerate(methods):
@@ -123,4 +161,37 @@ def plot_density_comparison(methods, waypoints_sets, density_results):
     plt.tight_layout()
     plt.show()
     
+    return fig
+
+def plot_density_sweep(sweep):
+    """Plot the cost-versus-accuracy curve of a density sweep."""
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    
+    for i, (method, records) in enumerate(sweep['curve'].items()):
+        color = METHOD_COLORS[i % len(METHOD_COLORS)]
+        factors = [r['factor'] for r in records]
+        times = [r['time'] * 1000 for r in records]
+        deviations = [r['max_deviation'] for r in records]
+        
+        ax1.plot(factors, deviations, 'o-', color=color, label=method)
+        ax2.plot(times, deviations, 'o-', color=color, label=method)
+    
+    ax1.set_xscale('log')
+    ax1.set_yscale('log')
+    ax1.set_xlabel('Density factor')
+    ax1.set_ylabel('Max deviation')
+    ax1.set_title('Accuracy vs. Density')
+    ax1.legend()
+    ax1.grid(True)
+    
+    ax2.set_xscale('log')
+    ax2.set_yscale('log')
+    ax2.set_xlabel('Time per path (ms)')
+    ax2.set_ylabel('Max deviation')
+    ax2.set_title('Accuracy vs. Cost')
+    ax2.grid(True)
+    
+    plt.tight_layout()
+    plt.show()
+    
     return fig
\ No newline at end of file
@@ -8,15 +8,141 @@ def get_test_waypoints(name='simple_curve'):
     
     return np.array(TEST_WAYPOINTS[name])
 
-def generate_random_waypoints(num_points=5, x_range=(100, 700), y_range=(100, 500)):
-    """Generate random waypoints within the specified range."""
-    x = np.random.uniform(x_range[0], x_range[1], num_points)
-    y = np.random.uniform(y_range[0], y_range[1], num_points)
+def generate_random_waypoints(num_points=5, x_range=(100, 700), y_range=(100, 500), rng=None):
+    """Generate random waypoints within the specified range.
+    
+    Pass a numpy.random.Generator as rng for reproducible sets; without it
+    the global np.random state is used.
+    """
+    source = np.random if rng is None else rng
+    x = source.uniform(x_range[0], x_range[1], num_points)
+    y = source.uniform(y_range[0], y_range[1], num_points)
     
     return np.column_stack((x, y))
 
+def spawn_generators(seed, num_workers):
+    """Create independent random generators, one per worker.
+    
+    The streams are spawned from a single SeedSequence, so they do not
+    overlap and a sweep is reproducible from one seed.
+    """
+    children = np.random.SeedSequence(seed).spawn(num_workers)
+    return [np.random.default_rng(child) for child in children]
+
+def chord_length_parameter(waypoints, alpha=1.0):
+    """Cumulative chord length along the waypoint axis, normalized to [0, 1].
+    
+    Works on one set of shape (n, d) or a batch of shape (batch, n, d).
+    Each chord is raised to the power alpha: 1 gives chord length, 0.5 the
+    centripetal and 0 the uniform parameterization. Sets with zero total
+    length get a uniform parameterization.
+    """
+    waypoints = np.asarray(waypoints, dtype=float)
+    distances = np.sqrt(np.sum(np.diff(waypoints, axis=-2)**2, axis=-1))**alpha
+    t = np.concatenate((np.zeros(distances.shape[:-1] + (1,)),
+                        np.cumsum(distances, axis=-1)), axis=-1)
+    
+    total = t[..., -1:]
+    uniform = np.broadcast_to(np.linspace(0, 1, t.shape[-1]), t.shape)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(total > 0, t / total, uniform)
+
+def interpolate_batch(t_new, t, values):
+    """Piecewise-linear interpolation of many sets at once.
+    
+    Equivalent to np.interp(t_new, t[i], values[i]) for every set i. Each
+    row of t must be non-decreasing within [0, 1]; offsetting row i by 2*i
+    makes the rows one sorted array, so one searchsorted serves the batch.
+    
+    Args:
+        t_new (numpy.ndarray): Query parameters, shape (m,) or (batch, m)
+        t (numpy.ndarray): Parameters of the samples, shape (batch, n)
+        values (numpy.ndarray): Samples, shape (batch, n, d)
+        
+    Returns:
+        numpy.ndarray: Interpolated values of shape (batch, m, d)
+    """
+    batch, n = t.shape
+    t_new = np.broadcast_to(t_new, (batch, np.shape(t_new)[-1]))
+    offsets = 2.0 * np.arange(batch)[:, None]
+    
+    flat_t = (t + offsets).ravel()
+    flat_new = (t_new + offsets).ravel()
+    right = np.searchsorted(flat_t, flat_new, side='right')
+    
+    # Keep each query inside its own row
+    row_start = np.repeat(np.arange(batch) * n, t_new.shape[1])
+    right = np.clip(right, row_start + 1, row_start + n - 1)
+    left = right - 1
+    
+    span = flat_t[right] - flat_t[left]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        weight = np.where(span > 0, (flat_new - flat_t[left]) / span, 0.0)
+    weight = np.clip(weight, 0.0, 1.0)[:, None]
+    
+    flat_values = values.reshape(batch * n, -1)
+    result = (1 - weight) * flat_values[left] + weight * flat_values[right]
+    return result.reshape(batch, t_new.shape[1], -1)
+
+def generate_waypoint_batch(rng, batch_size, num_points=5, family='uniform',
+                            x_range=(100, 700), y_range=(100, 500), noise=0.1):
+    """
+    Generate a batch of random waypoint sets in one vectorized call.
+    
+    Args:
+        rng (numpy.random.Generator): Random generator, e.g. from spawn_generators
+        batch_size (int): Number of waypoint sets
+        num_points (int): Waypoints per set
+        family (str): Shape family:
+            - 'uniform': independent uniform points in the range
+            - 'corridor': left-to-right route wandering inside a corridor
+            - 'loop': closed loop around the range centre
+            - 'switchback': back-and-forth rows climbing through the range
+        x_range (tuple): Range of x coordinates
+        y_range (tuple): Range of y coordinates
+        noise (float): Perturbation as a fraction of the range size
+        
+    Returns:
+        numpy.ndarray: Waypoints of shape (batch_size, num_points, 2)
+    """
+    low = np.array([x_range[0], y_range[0]], dtype=float)
+    size = np.array([x_range[1] - x_range[0], y_range[1] - y_range[0]], dtype=float)
+    shape = (batch_size, num_points)
+    s = np.linspace(0, 1, num_points)
+    
+    if family == 'uniform':
+        unit = rng.uniform(0, 1, shape + (2,))
+    elif family == 'corridor':
+        # Random walk in y, clipped to the corridor
+        steps = rng.normal(0, noise, shape)
+        steps[:, 0] = rng.uniform(0.25, 0.75, batch_size)
+        y = np.clip(np.cumsum(steps, axis=1), 0, 1)
+        x = s + rng.uniform(-0.25, 0.25, shape) * noise / max(num_points - 1, 1)
+        unit = np.stack((np.clip(x, 0, 1), y), axis=-1)
+    elif family == 'loop':
+        angle = 2 * np.pi * np.arange(num_points) / num_points
+        angle = angle + rng.uniform(-0.5, 0.5, shape) * noise * 2 * np.pi / num_points
+        radius = 0.4 * (1 + rng.normal(0, noise, shape))
+        unit = 0.5 + np.stack((radius * np.cos(angle), radius * np.sin(angle)), axis=-1)
+    elif family == 'switchback':
+        # Two waypoints per row; an odd count leaves one on the last row
+        rows = max((num_points + 1) // 2, 1)
+        index = np.arange(num_points)
+        x = np.where((index // 2) % 2 == 0, index % 2, 1 - index % 2).astype(float)
+        y = (index // 2) / max(rows - 1, 1) if rows > 1 else np.zeros(num_points)
+        unit = np.stack((np.broadcast_to(x, shape), np.broadcast_to(y, shape)), axis=-1)
+        unit = np.clip(unit + rng.normal(0, noise, shape + (2,)), 0, 1)
+    else:
+        raise ValueError(f"Unknown waypoint family '{family}'")
+    
+    return low + unit * size
+
 def generate_waypoints_with_density(base_waypoints, density_factor):
-    """Generate waypoints with modified density."""
+    """Generate waypoints with modified density.
+    
+    Densities below 1 keep every n-th waypoint; to keep the waypoints the
+    geometry needs instead, use utils.decimation.decimate_waypoints.
+    """
     base_waypoints = np.array(base_waypoints)
     
     if density_factor == 1.0:
@@ -27,14 +153,11 @@ def generate_waypoints_with_density(base_waypoints, density_factor):
         n_waypoints = len(base_waypoints)
         n_new_waypoints = int(n_waypoints * density_factor)
         
-        t = np.zeros(n_waypoints)
-        for i in range(1, n_waypoints):
-            t[i] = t[i-1] + np.sqrt(np.sum((base_waypoints[i] - base_waypoints[i-1])**2))
-        
-        if t[-1] == 0:
+        distances = np.sqrt(np.sum(np.diff(base_waypoints, axis=0)**2, axis=1))
+        if np.sum(distances) == 0:
             return base_waypoints
         
-        t = t / t[-1]
+        t = chord_length_parameter(base_waypoints)
         t_new = np.linspace(0, 1, n_new_waypoints)
         
         x = np.interp(t_new, t, base_waypoints[:, 0])
@@ -44,4 +167,28 @@ def generate_waypoints_with_density(base_waypoints, density_factor):
     else:
         # Decrease density
         step = max(1, int(1 / density_factor))
-        return base_waypoints[::step]
\ No newline at end of file
+        return base_waypoints[::step]
+
+def generate_waypoint_batch_with_density(waypoint_batch, density_factor):
+    """Apply generate_waypoints_with_density to a whole batch at once.
+    
+    Args:
+        waypoint_batch (numpy.ndarray): Waypoints of shape (batch, n, 2)
+        density_factor (float): Density multiplier
+        
+    Returns:
+        numpy.ndarray: Waypoints of shape (batch, m, 2)
+    """
+    waypoint_batch = np.asarray(waypoint_batch, dtype=float)
+    
+    if density_factor == 1.0:
+        return waypoint_batch
+    
+    if density_factor > 1.0:
+        n_new_waypoints = int(waypoint_batch.shape[1] * density_factor)
+        t = chord_length_parameter(waypoint_batch)
+        t_new = np.linspace(0, 1, n_new_waypoints)
+        return interpolate_batch(t_new, t, waypoint_batch)
+    
+    step = max(1, int(1 / density_factor))
+    return waypoint_batch[:, ::step]
\ No newline at end of file